@@ -4,24 +4,116 @@ import discord
 from discord.ext import commands
 import asyncio
 import os
+import time
+
+from utils.io_executor import shutdown_io
+from utils import disk_gc
+from utils.gallery_queue import gallery_archiver
+from utils.post_queue import post_queue
+
+# Set SIGN4ME_PROFILE_IMPORTS=1 to print per-cog load times on startup
+PROFILE_IMPORTS = os.environ.get("SIGN4ME_PROFILE_IMPORTS", "").lower() in ("1", "true", "yes")
+
+# Sharding (set by cluster.py, or by hand for a single sharded process)
+#   SIGN4ME_SHARDED=1        → use AutoShardedBot
+#   SIGN4ME_SHARD_COUNT=16   → total shards across every process (omit to let Discord decide)
+#   SIGN4ME_SHARD_IDS=0,1,2  → shards owned by this process
+SHARDED = os.environ.get("SIGN4ME_SHARDED", "").lower() in ("1", "true", "yes")
+SHARD_COUNT = int(os.environ["SIGN4ME_SHARD_COUNT"]) if os.environ.get("SIGN4ME_SHARD_COUNT") else None
+SHARD_IDS = (
+    [int(sid) for sid in os.environ["SIGN4ME_SHARD_IDS"].split(",") if sid.strip()]
+    if os.environ.get("SIGN4ME_SHARD_IDS") else None
+)
+# AutoShardedBot needs the total to place a subset of shards; catch a bad pair before connecting
+if SHARD_IDS is not None and SHARD_COUNT is None:
+    raise SystemExit("❌ SIGN4ME_SHARD_IDS needs SIGN4ME_SHARD_COUNT to be set as well.")
+if SHARD_IDS is not None and any(not 0 <= sid < SHARD_COUNT for sid in SHARD_IDS):
+    raise SystemExit(f"❌ SIGN4ME_SHARD_IDS must be between 0 and {SHARD_COUNT - 1} (SIGN4ME_SHARD_COUNT={SHARD_COUNT}).")
+
+BotBase = commands.AutoShardedBot if SHARDED else commands.Bot
+
+class Sign4MeBot(BotBase):
+    async def setup_hook(self):
+        # Pick up gallery archive jobs a previous run didn't finish
+        await gallery_archiver.resume()
+        # Keep outputs/, previews/ and the gallery inside their disk budgets
+        self.gc_task = asyncio.create_task(disk_gc.run_forever())
+        # Optional web panel API on the same loop and build scheduler (SIGN4ME_HTTP_PORT);
+        # under cluster.py only the first shard group gets the port
+        self.http_runner = None
+        if os.environ.get("SIGN4ME_HTTP_PORT"):
+            from utils.http_api import start_http_api
+            self.http_runner = await start_http_api()
+
+    async def close(self):
+        # Flush queued gallery/admin posts before the connection goes away, then archive them
+        await post_queue.drain()
+        await gallery_archiver.drain()
+        if getattr(self, "gc_task", None):
+            self.gc_task.cancel()
+        if getattr(self, "http_runner", None):
+            await self.http_runner.cleanup()
+        await super().close()
+        # Let pending config/channel writes land before the process exits
+        await asyncio.to_thread(shutdown_io)
 
 intents = discord.Intents.default()
-bot = commands.Bot(command_prefix="!", intents=intents)
+if SHARDED:
+    bot = Sign4MeBot(command_prefix="!", intents=intents, shard_count=SHARD_COUNT, shard_ids=SHARD_IDS)
+else:
+    bot = Sign4MeBot(command_prefix="!", intents=intents)
 
 @bot.event
 async def on_ready():
     print(f"✅ Sign4Me bot is online as {bot.user}")
+    if SHARDED:
+        print(f"🧩 Running shard(s) {sorted(bot.shards)} of {bot.shard_count}")
+
+    # Global commands only need syncing once per cluster
+    if SHARD_IDS is not None and 0 not in SHARD_IDS:
+        return
+
     try:
         synced = await bot.tree.sync()
         print(f"🔁 Synced {len(synced)} command(s)")
     except Exception as e:
         print(f"❌ Failed to sync commands: {e}")
 
+async def load_cog(extension: str) -> float:
+    """Load a single cog and return how long it took in milliseconds."""
+    start = time.perf_counter()
+    await bot.load_extension(extension)
+    return (time.perf_counter() - start) * 1000
+
+async def load_all_cogs():
+    """
+    Load every cog in /cogs, one after another: imports are synchronous, so there is nothing
+    to overlap. Startup stays fast because heavy libraries (NumPy, Pillow, OpenCV) are only
+    imported on first use.
+    """
+    extensions = [
+        f"cogs.{filename[:-3]}"
+        for filename in sorted(os.listdir("./cogs"))
+        if filename.endswith(".py")
+    ]
+
+    start = time.perf_counter()
+    for ext in extensions:
+        try:
+            elapsed = await load_cog(ext)
+        except Exception as e:
+            print(f"❌ Failed to load {ext}: {e}")
+            continue
+        if PROFILE_IMPORTS:
+            print(f"⏱️ {ext} loaded in {elapsed:.1f} ms")
+    total_ms = (time.perf_counter() - start) * 1000
+
+    if PROFILE_IMPORTS:
+        print(f"⏱️ {len(extensions)} cog(s) loaded in {total_ms:.1f} ms")
+
 async def main():
     # Load all cogs in /cogs
-    for filename in os.listdir("./cogs"):
-        if filename.endswith(".py"):
-            await bot.load_extension(f"cogs.{filename[:-3]}")
+    await load_all_cogs()
 
     # Load token from environment variable (Railway-style)
     token = os.environ.get("DISCORD_BOT_TOKEN")
@@ -0,0 +1,82 @@
+# cluster.py — Runs Sign4Me as several sharded bot processes on one host
+#
+# Usage:  python cluster.py --processes 4 --shards 8
+# Each child runs bot.py with SIGN4ME_SHARDED=1 and its own SIGN4ME_SHARD_IDS group.
+# Only the first group serves the HTTP API (SIGN4ME_HTTP_PORT), since one port can't be bound twice.
+# Crashed children are restarted; Ctrl+C / SIGTERM stops the whole cluster.
+
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+
+RESTART_DELAY = 5.0  # seconds before restarting a crashed shard group
+
+def shard_groups(shard_count: int, processes: int) -> list:
+    """Split shard IDs into contiguous groups, one per process."""
+    processes = max(1, min(processes, shard_count))
+    base, extra = divmod(shard_count, processes)
+    groups, start = [], 0
+    for i in range(processes):
+        size = base + (1 if i < extra else 0)
+        groups.append(list(range(start, start + size)))
+        start += size
+    return groups
+
+def spawn(group: list, shard_count: int, index: int) -> subprocess.Popen:
+    env = dict(os.environ)
+    if index:
+        env.pop("SIGN4ME_HTTP_PORT", None)
+    env["SIGN4ME_SHARDED"] = "1"
+    env["SIGN4ME_SHARD_COUNT"] = str(shard_count)
+    env["SIGN4ME_SHARD_IDS"] = ",".join(str(sid) for sid in group)
+    print(f"[cluster] 🚀 Starting shard group {group}")
+    return subprocess.Popen([sys.executable, "bot.py"], env=env)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Sign4Me across several sharded processes")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="number of bot processes")
+    parser.add_argument("--shards", type=int, default=None, help="total shard count (defaults to --processes)")
+    args = parser.parse_args()
+
+    if not os.environ.get("DISCORD_BOT_TOKEN"):
+        print("[cluster] ❌ DISCORD_BOT_TOKEN not set in environment variables.")
+        return
+
+    shard_count = args.shards or args.processes
+    groups = shard_groups(shard_count, args.processes)
+    children = {i: spawn(group, shard_count, i) for i, group in enumerate(groups)}
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    while not stopping:
+        time.sleep(1.0)
+        for i, proc in list(children.items()):
+            code = proc.poll()
+            if code is None or stopping:
+                continue
+            print(f"[cluster] ⚠️ Shard group {groups[i]} exited with code {code}, restarting in {RESTART_DELAY:.0f}s")
+            time.sleep(RESTART_DELAY)
+            children[i] = spawn(groups[i], shard_count, i)
+
+    print("[cluster] 🛑 Stopping shard groups...")
+    for proc in children.values():
+        if proc.poll() is None:
+            proc.terminate()
+    for proc in children.values():
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+if __name__ == "__main__":
+    main()
@@ -1,62 +1,76 @@
-# cogs/cleanup.py — Removes latest Sign4Me preview + ZIP + gallery post
+# cogs/cleanup.py — Removes recent Sign4Me build posts and their output files
 
 import discord
 from discord.ext import commands
 from discord import app_commands
 import os
+from collections import defaultdict
 
-from utils.permissions import is_admin_user
-from utils.config_utils import get_guild_config
-from utils.channel_utils import get_channel_id
+from utils.permissions import is_admin_user_async
+from utils.io_executor import run_io
+from utils.post_index import recent_posts_async, remove_posts_async
+from utils.post_queue import post_queue
+
+def _remove_artifacts(paths: set) -> list:
+    removed = []
+    for path in sorted(paths):
+        try:
+            os.remove(path)
+            removed.append(os.path.basename(path))
+        except FileNotFoundError:
+            pass
+    return removed
 
 class Cleanup(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-    @app_commands.command(name="cleanup", description="Delete the most recent sign preview + ZIP build output and bot post")
-    async def cleanup(self, interaction: discord.Interaction):
-        if not is_admin_user(interaction):
+    @app_commands.command(name="cleanup", description="Delete recent sign build posts and their output files")
+    @app_commands.describe(
+        count="How many of the latest builds to remove (default 1)",
+        message_id="Remove one specific build post by its message ID instead"
+    )
+    async def cleanup(self, interaction: discord.Interaction, count: app_commands.Range[int, 1, 100] = 1, message_id: str = None):
+        if not await is_admin_user_async(interaction):
             await interaction.response.send_message("❌ You do not have permission.", ephemeral=True)
             return
 
+        await interaction.response.defer(ephemeral=True)
         guild_id = str(interaction.guild_id)
-        guild_config = get_guild_config(guild_id)
-        preview_path = guild_config.get("preview_output_path")
-        zip_path = guild_config.get("zip_output_path")
-
-        removed_files = []
-
-        for path in [preview_path, zip_path]:
-            try:
-                if os.path.exists(path):
-                    os.remove(path)
-                    removed_files.append(os.path.basename(path))
-            except Exception as e:
-                await interaction.response.send_message(
-                    f"❌ Failed to delete `{os.path.basename(path)}`: {e}",
-                    ephemeral=True
-                )
-                return
-
-        channel_id = get_channel_id("gallery", guild_id) or guild_config.get("admin_channel_id")
-        channel = self.bot.get_channel(int(channel_id)) if channel_id else None
-
-        if channel:
-            try:
-                async for msg in channel.history(limit=10):
-                    if msg.author == self.bot.user and msg.attachments:
-                        await msg.delete()
-                        break
-            except Exception as e:
-                print(f"[cleanup] Warning: could not delete previous message: {e}")
-
-        if removed_files:
-            await interaction.response.send_message(
-                f"🧹 Removed: `{', '.join(removed_files)}` and latest bot message.",
-                ephemeral=True
-            )
+
+        # Straight from the post index: no channel history scan
+        if message_id:
+            wanted = message_id.strip()
+            posts = [post for post in await recent_posts_async(guild_id) if post["message_id"] == wanted]
         else:
-            await interaction.response.send_message("✅ Nothing to clean.", ephemeral=True)
+            posts = await recent_posts_async(guild_id, count)
+        if not posts:
+            await interaction.followup.send("✅ Nothing to clean.", ephemeral=True)
+            return
+
+        by_channel = defaultdict(list)
+        for post in posts:
+            by_channel[post["channel_id"]].append(post["message_id"])
+
+        deleted_ids = []
+        for channel_id, message_ids in by_channel.items():
+            channel = self.bot.get_channel(int(channel_id))
+            if channel:
+                # Queued deletes in one channel go out as a single bulk delete
+                deleted_ids += await post_queue.delete(channel, message_ids)
+
+        # Only posts whose message is gone leave the index; the rest can be retried later
+        kept = len(posts) - len(deleted_ids)
+        posts = await remove_posts_async(guild_id, deleted_ids) if deleted_ids else []
+        deleted = len(posts)
+
+        # Output files are shared by later builds; only remove those no remaining post still points at
+        still_used = {path for post in await recent_posts_async(guild_id) for path in post["artifacts"]}
+        removed_files = await run_io(_remove_artifacts, {path for post in posts for path in post["artifacts"]} - still_used)
+
+        files_note = f" and `{', '.join(removed_files)}`" if removed_files else ""
+        kept_note = f" {kept} post(s) could not be deleted and stay indexed." if kept else ""
+        await interaction.followup.send(f"🧹 Removed {deleted} build post(s){files_note}.{kept_note}", ephemeral=True)
 
 async def setup(bot):
     await bot.add_cog(Cleanup(bot))
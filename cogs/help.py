@@ -35,7 +35,12 @@ class Help(commands.Cog):
             name="🪧 Build Commands",
             value=(
                 "**/signbuild** — Convert capitalized text into an in-game sign made of item objects.\n"
-                "**/cleanup** — Delete the most recent build preview and export files."
+                "**/signimage** — Convert an uploaded logo or image into a sign, sized to fit the object limit.\n"
+                "**/signqr** — Build a scannable QR-code sign from a URL or text.\n"
+                "**/signfont** — Upload or pick a TTF/OTF font and letter height for sign text.\n"
+                "**/signfit** — Suggest object type, scale and spacing for a target size in metres.\n"
+                "**/signcompare** — Preview the same text with every object type on one contact sheet.\n"
+                "**/cleanup** — Delete the latest build post(s) and files (`count`, or one `message_id`)."
             ),
             inline=False
         )
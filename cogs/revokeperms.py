@@ -4,7 +4,7 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
-from utils.permissions import remove_admin_user, is_admin_user
+from utils.permissions import remove_admin_user_async, is_admin_user_async
 
 class RevokePerms(commands.Cog):
     def __init__(self, bot):
@@ -13,12 +13,12 @@ class RevokePerms(commands.Cog):
     @app_commands.command(name="revokeperms", description="Remove a user's permission to use bot commands")
     @app_commands.describe(user="The user to revoke access from")
     async def revokeperms(self, interaction: discord.Interaction, user: discord.User):
-        if not is_admin_user(interaction):
+        if not await is_admin_user_async(interaction):
             await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
             return
 
         guild_id = str(interaction.guild.id)
-        removed = remove_admin_user(guild_id, user.id)
+        removed = await remove_admin_user_async(guild_id, user.id)
 
         if removed:
             await interaction.response.send_message(
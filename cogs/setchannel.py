@@ -4,8 +4,8 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
-from utils.channel_utils import save_channel
-from utils.permissions import is_admin_user  # ✅ Centralized permission logic
+from utils.channel_utils import save_channel_async
+from utils.permissions import is_admin_user_async  # ✅ Centralized permission logic
 
 class SetChannel(commands.Cog):
     def __init__(self, bot):
@@ -26,7 +26,7 @@ class SetChannel(commands.Cog):
         type: app_commands.Choice[str],
         target: discord.abc.GuildChannel
     ):
-        if not is_admin_user(interaction):
+        if not await is_admin_user_async(interaction):
             await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
             return
 
@@ -43,7 +43,7 @@ class SetChannel(commands.Cog):
             return
 
         guild_id = str(interaction.guild.id)
-        save_channel(guild_id, type.value, str(target.id))
+        await save_channel_async(guild_id, type.value, str(target.id))
 
         await interaction.response.send_message(
             f"✅ `{type.name}` successfully assigned to {target.mention}.",
@@ -4,8 +4,8 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
-from utils.config_utils import get_guild_config, save_guild_config
-from utils.permissions import is_admin_user
+from utils.config_utils import get_guild_config_async, save_guild_config_async
+from utils.permissions import is_admin_user_async
 
 class SetOrigin(commands.Cog):
     def __init__(self, bot):
@@ -18,12 +18,12 @@ class SetOrigin(commands.Cog):
         y="Height (default 0.0)"
     )
     async def setorigin(self, interaction: discord.Interaction, x: float, z: float, y: float = 0.0):
-        if not is_admin_user(interaction):
+        if not await is_admin_user_async(interaction):
             await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
             return
 
         guild_id = str(interaction.guild.id)
-        config = get_guild_config(guild_id)
+        config = await get_guild_config_async(guild_id)
 
         # ✅ Internal YPR stacking swap: Z ➝ Y, Y ➝ Z
         config["origin_position"] = {
@@ -32,7 +32,7 @@ class SetOrigin(commands.Cog):
             "z": y   # y becomes forward depth (Z axis)
         }
 
-        save_guild_config(guild_id, config)
+        await save_guild_config_async(guild_id, config)
 
         await interaction.response.send_message(
             f"📍 **New origin position set for this server:**\n"
@@ -4,35 +4,20 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import asyncio
-import json
 
-from utils.config_utils import get_guild_config, update_guild_config
-from utils.permissions import is_admin_user
+from utils.config_utils import get_guild_config_async, save_guild_config_async
+from utils.permissions import is_admin_user_async
 from logic.text_matrix import generate_letter_matrix
-from logic.render_sign_preview import render_sign_preview
-from sign_packager import create_sign_zip
-from utils.channel_utils import get_channel_id
-from sign_generator import letter_to_object_list
-
-OBJECT_SIZE_ADJUSTMENTS = {
-    "Armband_Black": 0.5,
-    "JerryCan": 1.0,
-    "BoxWooden": 1.0,
-    "SmallProtectiveCase": 1.0,
-    "WoodenCrate": 1.1,
-    "ImprovisedContainer": 1.0,
-    "DryBag_Black": 1.25
-}
-
-OBJECT_NAME_TO_LABEL = {
-    "Armband_Black": "Armband (Black)",
-    "JerryCan": "Jerry Can",
-    "BoxWooden": "Wooden Box",
-    "SmallProtectiveCase": "Protective Case (Small)",
-    "WoodenCrate": "Wooden Crate",
-    "ImprovisedContainer": "Improvised Container",
-    "DryBag_Black": "Dry Bag (Black)"
-}
+from logic.matrix_ops import resize_matrix, estimate_object_counts
+from logic.render_sign_preview import PREVIEW_ENCODINGS
+from logic.build_pipeline import build_sign, format_build_post, build_artifacts, gallery_metadata, guild_output_paths
+from utils.channel_utils import get_channel_id_async
+from utils.post_queue import post_queue
+from sign_generator import MAX_OBJECTS, OBJECT_SIZE_ADJUSTMENTS, OBJECT_NAME_TO_LABEL
+from utils.post_index import post_recorder
+from utils.build_scheduler import build_scheduler, interaction_progress
+from utils.gallery_queue import gallery_archiver
+
 LABEL_TO_OBJECT_NAME = {v: k for k, v in OBJECT_NAME_TO_LABEL.items()}
 
 class SignSettings(commands.Cog):
@@ -41,12 +26,12 @@ class SignSettings(commands.Cog):
 
     @app_commands.command(name="sign_settings", description="View current Sign4Me settings and optionally rebuild")
     async def sign_settings(self, interaction: discord.Interaction):
-        if not is_admin_user(interaction):
+        if not await is_admin_user_async(interaction):
             await interaction.response.send_message("❌ You do not have permission.", ephemeral=True)
             return
 
         guild_id = str(interaction.guild.id)
-        config = get_guild_config(guild_id)
+        config = await get_guild_config_async(guild_id)
         view = SignAdjustPanelView(config, guild_id)
         embed = view.build_embed()
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
@@ -78,27 +63,79 @@ class SignAdjustPanelView(discord.ui.View):
         )
         embed.add_field(name="Placement Mode", value="`Upright`" if upright else "`Flat`", inline=True)
         embed.add_field(
-            name="⚠️ Placement Warning",
-            value="Ensure scale/spacing is appropriate to avoid overlap or huge distances in-game.",
+            name="Mirror Kit",
+            value="`Front + Back`" if self.config.get("include_mirror_kit", False) else "`Off`",
+            inline=True
+        )
+        embed.add_field(
+            name="Object Optimizer",
+            value=f"`On (up to {self.config.get('optimize_max_merge', 4)}×)`" if self.config.get("optimize_objects", False) else "`Off`",
+            inline=True
+        )
+        embed.add_field(
+            name="Letter Size",
+            value=f"`{self.config.get('size_factor', 1)}×" + (" outline`" if self.config.get("outline_mode", False) else " solid`"),
+            inline=True
+        )
+        embed.add_field(
+            name="Export Format",
+            value="`ZIP bundle`" if self.config.get("export_mode", "json") == "zip" else "`Raw JSON`",
+            inline=True
+        )
+        embed.add_field(
+            name="Preview Format",
+            value=f"`{self.config.get('preview_encoding', 'png')}`",
+            inline=True
+        )
+        embed.add_field(
+            name="⚠️ Placement Check",
+            value=f"Every build is checked for overlapping objects and for placement inside `{self.config.get('selected_map', 'Chernarus')}`; problems are listed in the build post.",
             inline=False
         )
         return embed
 
     async def interaction_check(self, interaction: discord.Interaction):
-        return is_admin_user(interaction)
+        return await is_admin_user_async(interaction)
 
     @discord.ui.button(label="🔄 Toggle Placement Mode", style=discord.ButtonStyle.secondary)
     async def toggle_upright(self, interaction: discord.Interaction, button: discord.ui.Button):
         current = self.config.get("upright_mode", True)
         self.config["upright_mode"] = not current
-        update_guild_config(self.guild_id, self.config)
+        await save_guild_config_async(self.guild_id, self.config)
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="🪞 Toggle Mirror Kit", style=discord.ButtonStyle.secondary)
+    async def toggle_mirror_kit(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.config["include_mirror_kit"] = not self.config.get("include_mirror_kit", False)
+        await save_guild_config_async(self.guild_id, self.config)
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="🧩 Toggle Optimizer", style=discord.ButtonStyle.secondary)
+    async def toggle_optimizer(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.config["optimize_objects"] = not self.config.get("optimize_objects", False)
+        await save_guild_config_async(self.guild_id, self.config)
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="📦 Toggle Export Format", style=discord.ButtonStyle.secondary)
+    async def toggle_export(self, interaction: discord.Interaction, button: discord.ui.Button):
+        current = self.config.get("export_mode", "json")
+        self.config["export_mode"] = "json" if current == "zip" else "zip"
+        await save_guild_config_async(self.guild_id, self.config)
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="🖼️ Preview Format", style=discord.ButtonStyle.secondary)
+    async def cycle_preview_encoding(self, interaction: discord.Interaction, button: discord.ui.Button):
+        encodings = list(PREVIEW_ENCODINGS)
+        current = self.config.get("preview_encoding", "png")
+        self.config["preview_encoding"] = encodings[(encodings.index(current) + 1) % len(encodings) if current in encodings else 0]
+        await save_guild_config_async(self.guild_id, self.config)
         await interaction.response.edit_message(embed=self.build_embed(), view=self)
 
     @discord.ui.button(label="🧱 Adjust Object", style=discord.ButtonStyle.secondary)
     async def adjust_object(self, interaction: discord.Interaction, button: discord.ui.Button):
         options = [
             discord.SelectOption(label=OBJECT_NAME_TO_LABEL[obj], value=obj)
-            for obj in OBJECT_SIZE_ADJUSTMENTS.keys()
+            for obj in OBJECT_NAME_TO_LABEL
         ]
         select = discord.ui.Select(placeholder="Select object", options=options)
         view = discord.ui.View(timeout=60)
@@ -107,7 +144,7 @@ class SignAdjustPanelView(discord.ui.View):
         async def callback(i: discord.Interaction):
             selected = select.values[0]
             self.config["default_object"] = selected
-            update_guild_config(self.guild_id, self.config)
+            await save_guild_config_async(self.guild_id, self.config)
 
             confirm = await i.response.send_message(f"✅ Object changed to `{OBJECT_NAME_TO_LABEL.get(selected, selected)}`", ephemeral=True)
             if self.message:
@@ -171,7 +208,7 @@ class AdjustScaleModal(discord.ui.Modal, title="Set Scale"):
             val = float(self.children[0].value)
             obj = self.view.config.get("default_object", "WoodenCrate")
             self.view.config.setdefault("custom_scale", {})[obj] = val
-            update_guild_config(self.view.guild_id, self.view.config)
+            await save_guild_config_async(self.view.guild_id, self.view.config)
             await interaction.response.edit_message(embed=self.view.build_embed(), view=self.view)
         except ValueError:
             await interaction.response.send_message("❌ Invalid scale. Use a number.", ephemeral=True)
@@ -189,7 +226,7 @@ class AdjustSpacingModal(discord.ui.Modal, title="Set Spacing"):
             val = float(self.children[0].value)
             obj = self.view.config.get("default_object", "WoodenCrate")
             self.view.config.setdefault("custom_spacing", {})[obj] = val
-            update_guild_config(self.view.guild_id, self.view.config)
+            await save_guild_config_async(self.view.guild_id, self.view.config)
             await interaction.response.edit_message(embed=self.view.build_embed(), view=self.view)
         except ValueError:
             await interaction.response.send_message("❌ Invalid spacing. Use a number.", ephemeral=True)
@@ -210,7 +247,7 @@ class AdjustOriginModal(discord.ui.Modal, title="Set Origin Coordinates"):
             z = float(self.children[1].value)  # Now `z` is assigned to key `"z"`
             y = float(self.children[2].value)  # Now `y` is assigned to key `"y"`
             self.view.config["origin_position"] = {"x": x, "y": y, "z": z}
-            update_guild_config(self.view.guild_id, self.view.config)
+            await save_guild_config_async(self.view.guild_id, self.view.config)
             await interaction.response.edit_message(embed=self.view.build_embed(), view=self.view)
         except ValueError:
             await interaction.response.send_message("❌ Invalid origin values.", ephemeral=True)
@@ -230,7 +267,7 @@ class AdjustOffsetModal(discord.ui.Modal, title="Set Origin Offset"):
             y = float(self.children[1].value)
             z = float(self.children[2].value)
             self.view.config["originOffset"] = {"x": x, "y": y, "z": z}
-            update_guild_config(self.view.guild_id, self.view.config)
+            await save_guild_config_async(self.view.guild_id, self.view.config)
             await interaction.response.edit_message(embed=self.view.build_embed(), view=self.view)
         except ValueError:
             await interaction.response.send_message("❌ Invalid offset values.", ephemeral=True)
@@ -247,41 +284,72 @@ async def handle_sign_rebuild(interaction: discord.Interaction, config: dict, gu
     upright = config.get("upright_mode", True)
 
     ypr_mode = "upright" if upright else "flat"
-
-    matrix = generate_letter_matrix(text)
-    objects = letter_to_object_list(
-        matrix=matrix,
-        object_type=obj,
-        origin=origin,
-        offset=offset,
-        scale=scale,
-        spacing=spacing,
-        ypr_mode=ypr_mode
-    )
-
-    with open(config["object_output_path"], "w") as f:
-        json.dump({"Objects": objects}, f, indent=2)
-
-    render_sign_preview(matrix, config["preview_output_path"], object_type=obj)
-
-    channel_id = get_channel_id("gallery", guild_id) or config.get("admin_channel_id")
+    mirror_kit = upright and config.get("include_mirror_kit", False)
+
+    size_factor = config.get("size_factor", 1)
+    outline = config.get("outline_mode", False)
+    optimize = config.get("optimize_objects", False)
+
+    try:
+        matrix = await asyncio.to_thread(generate_letter_matrix, text, font_path=config.get("font_path"), cell_height=config.get("font_cell_height", 12))
+    except OSError as e:
+        await interaction.followup.send(f"❌ Could not load the sign font: {e}. Use `/signfont reset:True` to go back to the block font.", ephemeral=True)
+        return
+
+    # Same pre-check as /signbuild: a stored 2× or 3× size easily goes over the object cap
+    costs = estimate_object_counts(matrix, size_factor, mirror_kit)
+    chosen = costs["outline" if outline else "solid"]
+    if chosen > MAX_OBJECTS and not optimize:
+        await interaction.followup.send(
+            f"❌ Too many objects to rebuild at size {size_factor}× ({chosen}, max {MAX_OBJECTS}). "
+            f"Lower the size with `/signbuild size_factor:` or turn on optimize.",
+            ephemeral=True
+        )
+        return
+
+    matrix = resize_matrix(matrix, size_factor, outline)
+    # Fresh paths: the previous build's post may still be reading its files
+    output_json_path, preview_path, zip_path = guild_output_paths(guild_id)
+    try:
+        result = await build_scheduler.run(
+            guild_id,
+            chosen,
+            build_sign,
+            matrix,
+            obj,
+            config,
+            origin=origin,
+            offset=offset,
+            scale=scale,
+            spacing=spacing,
+            output_json_path=output_json_path,
+            preview_path=preview_path,
+            zip_output_path=zip_path,
+            ypr_mode=ypr_mode,
+            mirror_kit=mirror_kit,
+            optimize=optimize,
+            max_merge=config.get("optimize_max_merge", 4),
+            on_update=interaction_progress(interaction)
+        )
+    except ValueError as e:
+        # Over the object cap after merging, or a stored object type that no longer exists
+        await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True)
+        return
+    config["object_output_path"] = result["output_json_path"]
+    config["preview_output_path"] = result["preview_path"]
+    await save_guild_config_async(guild_id, config)
+
+    channel_id = await get_channel_id_async("gallery", guild_id) or config.get("admin_channel_id")
     channel = interaction.client.get_channel(int(channel_id)) if channel_id else None
 
     if channel:
-        await channel.send(
-            content=(
-                f"🪧 **Sign Rebuild Complete**\n"
-                f"• Size: {len(matrix[0])}x{len(matrix)}\n"
-                f"• Objects: {len(objects)}\n"
-                f"• Type: `{obj}`\n"
-                f"• Scale: `{scale}` | Spacing: `{spacing}`\n"
-                f"• Origin: X: {origin['x']}, Y: {origin['y']}, Z: {origin['z']}"
-            ),
-            files=[
-                discord.File(config["object_output_path"], filename="Sign4ME.json"),
-                discord.File(config["preview_output_path"])
-            ]
+        posted = post_queue.send(
+            channel,
+            content=format_build_post("Sign Rebuild Complete", result),
+            files=[result["export_file"], result["preview_file"]],
+            on_sent=post_recorder(guild_id, "Sign Rebuild Complete", build_artifacts(result))
         )
+        await gallery_archiver.publish(posted, result["preview_path"], result["export_file"][0], gallery_metadata(result), guild_id)
 
     await interaction.followup.send("✅ Settings applied and sign rebuilt.", ephemeral=True)
 
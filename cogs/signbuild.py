@@ -1,18 +1,21 @@
 # cogs/signbuild.py
 
+import asyncio
+
 import discord
 from discord.ext import commands
 from discord import app_commands
-import os
-import json
 
-from utils.config_utils import get_guild_config, save_guild_config
+from utils.config_utils import get_guild_config_async, save_guild_config_async
 from logic.text_matrix import generate_letter_matrix
-from logic.render_sign_preview import render_sign_preview
-from sign_generator import letter_to_object_list, OBJECT_CLASS_MAP
-from sign_packager import create_sign_zip
-from utils.channel_utils import get_channel_id
-from utils.permissions import is_admin_user
+from logic.matrix_ops import resize_matrix, estimate_object_counts
+from logic.build_pipeline import build_sign, format_build_post, build_artifacts, gallery_metadata, guild_output_paths
+from utils.channel_utils import get_channel_id_async
+from utils.permissions import is_admin_user_async
+from utils.post_queue import post_queue
+from utils.post_index import post_recorder
+from utils.build_scheduler import build_scheduler, interaction_progress
+from utils.gallery_queue import gallery_archiver
 
 MAX_OBJECTS = 1200
 
@@ -22,11 +25,18 @@ class SignBuild(commands.Cog):
 
     @app_commands.command(name="signbuild", description="Convert text into a DayZ item sign layout")
     @app_commands.describe(
-        text="The capital letters to build as a sign (A-Z only)",
+        text="The text to build as a sign (A-Z, or any character when a custom font is set with /signfont)",
         overall_scale="Overall object scale multiplier (default 0.5 or overridden per object)",
         object_spacing="Spacing between objects (default 1.0 or overridden per object)",
         object_type="Choose the object to use for the sign",
-        orientation="Object orientation: upright (billboard) or flat (ground)"
+        orientation="Object orientation: upright (billboard) or flat (ground)",
+        mirror_kit="Also build a mirrored back face so upright signs read from both sides",
+        optimize="Merge filled blocks into fewer, larger objects",
+        size_factor="Make letters N× bigger by upscaling the glyphs (1–6)",
+        outline="Build only the letter edges so big letters stay cheap",
+        estimate_only="Report the object count of each size choice without building",
+        facing="Compass direction the sign faces, in degrees (turns the whole sign about its origin)",
+        tilt="Lean the sign forward or back about its horizontal edge, in degrees"
     )
     @app_commands.choices(
         object_type=[
@@ -50,16 +60,23 @@ class SignBuild(commands.Cog):
         object_type: app_commands.Choice[str],
         orientation: app_commands.Choice[str] = None,
         overall_scale: float = None,
-        object_spacing: float = None
+        object_spacing: float = None,
+        mirror_kit: bool = None,
+        optimize: bool = None,
+        size_factor: app_commands.Range[int, 1, 6] = None,
+        outline: bool = None,
+        estimate_only: bool = False,
+        facing: app_commands.Range[float, -180.0, 180.0] = None,
+        tilt: app_commands.Range[float, -90.0, 90.0] = None
     ):
-        if not is_admin_user(interaction):
+        if not await is_admin_user_async(interaction):
             await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
             return
 
         await interaction.response.defer()
 
         guild_id = str(interaction.guild.id)
-        config = get_guild_config(guild_id)
+        config = await get_guild_config_async(guild_id)
         obj_type = object_type.value
 
         origin = config.get("origin_position", {"x": 0.0, "y": 0.0, "z": 0.0})
@@ -69,13 +86,20 @@ class SignBuild(commands.Cog):
         object_spacing = object_spacing or config.get("custom_spacing", {}).get(obj_type, config.get("defaultSpacing", 1.0))
 
         # ✅ Step 1: Generate and flip character matrix
-        matrix = [row[::-1] for row in generate_letter_matrix(text.upper())[::-1]]
+        font_path = config.get("font_path")
+        try:
+            letter_matrix = await asyncio.to_thread(generate_letter_matrix, text, font_path=font_path, cell_height=config.get("font_cell_height", 12))
+        except OSError as e:
+            await interaction.followup.send(f"❌ Could not load the sign font: {e}. Use `/signfont reset:True` to go back to the block font.", ephemeral=True)
+            return
+        matrix = [row[::-1] for row in letter_matrix[::-1]]
 
         print(f"🧠 Matrix = {len(matrix)} rows x {len(matrix[0])} cols")
         print(f"🧱 Raw # count = {sum(row.count('#') for row in matrix)}")
 
         if not matrix or not any('#' in row for row in matrix):
-            await interaction.followup.send("⚠️ No valid characters detected. Please use capital A–Z letters only.", ephemeral=True)
+            hint = "The font has no visible glyphs for that text." if font_path else "Please use capital A–Z letters only."
+            await interaction.followup.send(f"⚠️ No valid characters detected. {hint}", ephemeral=True)
             return
 
         # 🔄 Adjust origin logic for upright mode (Z→Y stacking)
@@ -87,23 +111,62 @@ class SignBuild(commands.Cog):
                 "z": origin["z"]
             }
 
-        # ✅ Step 2: Generate objects from matrix using internal YPR mode
+        if mirror_kit is None:
+            mirror_kit = config.get("include_mirror_kit", False)
+        if optimize is None:
+            optimize = config.get("optimize_objects", False)
+        if size_factor is None:
+            size_factor = config.get("size_factor", 1)
+        if outline is None:
+            outline = config.get("outline_mode", False)
+        # build_sign reads the rotation from the config it is given; it only applies to this build
+        # and is never saved, so a later /signbuild without facing/tilt comes out upright again
+        build_config = {**config, "sign_yaw": facing or 0.0, "sign_tilt": tilt or 0.0}
+
+        # 📏 Cost of each size choice, before anything is laid out
+        costs = estimate_object_counts(matrix, size_factor, mirror_kit and ypr_mode == "upright")
+        chosen = costs["outline" if outline else "solid"]
+        cost_report = (f"📏 Size {size_factor}× — solid: **{costs['solid']}** objects, "
+                       f"outline: **{costs['outline']}** objects (max {MAX_OBJECTS})")
+        print(cost_report)
+
+        if estimate_only:
+            await interaction.followup.send(cost_report, ephemeral=True)
+            return
+        if chosen > MAX_OBJECTS and not optimize:
+            await interaction.followup.send(f"❌ Too many objects for this size.\n{cost_report}", ephemeral=True)
+            return
+
+        matrix = resize_matrix(matrix, size_factor, outline)
+
+        # ✅ Step 2–3: Generate objects, write JSON + preview, package export (queued behind other builds)
+        output_json_path, preview_path, zip_path = guild_output_paths(guild_id)
         try:
-            objects = letter_to_object_list(
-                matrix=matrix,
-                object_type=obj_type,
+            result = await build_scheduler.run(
+                guild_id,
+                chosen,
+                build_sign,
+                matrix,
+                obj_type,
+                build_config,
                 origin=origin,
                 offset=offset,
                 scale=overall_scale,
                 spacing=object_spacing,
-                ypr_mode=ypr_mode
+                output_json_path=output_json_path,
+                preview_path=preview_path,
+                zip_output_path=zip_path,
+                ypr_mode=ypr_mode,
+                mirror_kit=mirror_kit,
+                optimize=optimize,
+                max_merge=config.get("optimize_max_merge", 4),
+                on_update=interaction_progress(interaction)
             )
         except ValueError as e:
             await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True)
             return
 
-        print(f"📦 Generated object count = {len(objects)}")
-
+        objects = result["objects"]
         if not objects:
             await interaction.followup.send("⚠️ Sign generation failed. No objects were created. Check your origin and spacing settings.", ephemeral=True)
             return
@@ -114,65 +177,36 @@ class SignBuild(commands.Cog):
                 ephemeral=True
             )
 
-        # ✅ Step 3: Write to JSON and preview
-        output_json_path = os.path.join("outputs", "Sign4ME.json")
-        preview_path = os.path.join("previews", "sign_preview.png")
-
-        os.makedirs("outputs", exist_ok=True)
-        os.makedirs("previews", exist_ok=True)
-
-        with open(output_json_path, "w") as f:
-            json.dump({"Objects": objects}, f, indent=2)
-
-        render_sign_preview(matrix, preview_path, object_type=obj_type)
-
         # ✅ Step 4: Save config
         config["default_object"] = obj_type
         config["defaultScale"] = overall_scale
         config["defaultSpacing"] = object_spacing
         config.setdefault("custom_scale", {})[obj_type] = overall_scale
         config.setdefault("custom_spacing", {})[obj_type] = object_spacing
+        config["size_factor"] = size_factor
+        config["outline_mode"] = outline
         config["last_sign_data"] = text
-        config["object_output_path"] = output_json_path
-        config["preview_output_path"] = preview_path
-        save_guild_config(guild_id, config)
-
-        # ✅ Step 5: Package ZIP
-        final_path = create_sign_zip(
-            output_json_path,
-            preview_path,
-            config.get("zip_output_path", "Sign4ME.zip"),
-            extra_text=(f"Sign Size: {len(matrix[0])}x{len(matrix)}\n"
-                        f"Total Objects: {len(objects)}\n"
-                        f"Object Used: {OBJECT_CLASS_MAP.get(obj_type, obj_type)}\n"
-                        f"Scale: {overall_scale} | Spacing: {object_spacing}\n"
-                        f"Orientation: {orientation.value if orientation else 'upright'}"),
-            export_mode="json"
-        )
+        config["object_output_path"] = result["output_json_path"]
+        config["preview_output_path"] = result["preview_path"]
+        await save_guild_config_async(guild_id, config)
 
-        # ✅ Step 6: Gallery or Admin Channel Post
-        channel_id = get_channel_id("gallery", guild_id) or config.get("admin_channel_id")
+        # ✅ Step 5: Gallery or Admin Channel Post
+        channel_id = await get_channel_id_async("gallery", guild_id) or config.get("admin_channel_id")
         channel = self.bot.get_channel(int(channel_id)) if channel_id else None
 
         if not channel:
             await interaction.followup.send("❌ Could not find configured gallery/admin channel.", ephemeral=True)
             return
 
-        await channel.send(
-            content=(f"🪧 **Sign Build Complete**\n"
-                     f"• Size: {len(matrix[0])}x{len(matrix)}\n"
-                     f"• Objects: {len(objects)}\n"
-                     f"• Type: `{OBJECT_CLASS_MAP.get(obj_type, obj_type)}`\n"
-                     f"• Scale: `{overall_scale}` | Spacing: `{object_spacing}`\n"
-                     f"• Orientation: `{orientation.value if orientation else 'upright'}`\n"
-                     f"• Origin: X: {origin['x']}, Y: {origin['y']}, Z: {origin['z']}"),
-            files=[
-                discord.File(output_json_path, filename="Sign4ME.json"),
-                discord.File(preview_path, filename="sign_preview.png")
-            ]
+        posted = post_queue.send(
+            channel,
+            content=format_build_post("Sign Build Complete", result),
+            files=[result["export_file"], result["preview_file"]],
+            on_sent=post_recorder(guild_id, "Sign Build Complete", build_artifacts(result))
         )
+        await gallery_archiver.publish(posted, result["preview_path"], result["export_file"][0], gallery_metadata(result), guild_id)
 
-        await interaction.followup.send("✅ Sign build generated and posted in gallery channel.", ephemeral=True)
+        await interaction.followup.send("✅ Sign build generated and queued for the gallery channel.", ephemeral=True)
 
 async def setup(bot):
     await bot.add_cog(SignBuild(bot))
@@ -0,0 +1,105 @@
+# cogs/signcompare.py — Preview the same sign with every object type on one contact sheet
+
+import asyncio
+import os
+import uuid
+
+import discord
+from discord.ext import commands
+from discord import app_commands
+
+from utils.config_utils import get_guild_config_async
+from utils.permissions import is_admin_user_async
+from utils.build_scheduler import build_scheduler, interaction_progress
+from logic.text_matrix import generate_letter_matrix
+from logic.matrix_ops import resize_matrix, estimate_object_counts
+from logic.contact_sheet import render_contact_sheet
+from sign_generator import OBJECT_CLASS_MAP, MAX_OBJECTS
+
+class SignCompare(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="signcompare", description="Render a sign with every object type side by side")
+    @app_commands.describe(
+        text="The text to compare across object types",
+        orientation="Object orientation: upright (billboard) or flat (ground)"
+    )
+    @app_commands.choices(
+        orientation=[
+            app_commands.Choice(name="Upright (Billboard Style)", value="upright"),
+            app_commands.Choice(name="Flat (On Ground)", value="flat")
+        ]
+    )
+    async def signcompare(self, interaction: discord.Interaction, text: str, orientation: app_commands.Choice[str] = None):
+        if not await is_admin_user_async(interaction):
+            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+
+        guild_id = str(interaction.guild.id)
+        config = await get_guild_config_async(guild_id)
+        ypr_mode = orientation.value if orientation else "upright"
+        mirror_kit = config.get("include_mirror_kit", False) and ypr_mode == "upright"
+        optimize = config.get("optimize_objects", False)
+        size_factor = config.get("size_factor", 1)
+        outline = config.get("outline_mode", False)
+
+        # ✅ One matrix for every panel, built with the same settings /signbuild would use
+        try:
+            letter_matrix = await asyncio.to_thread(generate_letter_matrix, text, font_path=config.get("font_path"), cell_height=config.get("font_cell_height", 12))
+        except OSError as e:
+            await interaction.followup.send(f"❌ Could not load the sign font: {e}", ephemeral=True)
+            return
+        matrix = [row[::-1] for row in letter_matrix[::-1]]
+
+        if not any("#" in row for row in matrix):
+            await interaction.followup.send("⚠️ No valid characters detected.", ephemeral=True)
+            return
+
+        count = estimate_object_counts(matrix, size_factor, mirror_kit)["outline" if outline else "solid"]
+        if count > MAX_OBJECTS and not optimize:
+            await interaction.followup.send(f"❌ Too many objects for this size ({count}, max {MAX_OBJECTS}).", ephemeral=True)
+            return
+        matrix = resize_matrix(matrix, size_factor, outline)
+
+        scales = {t: config.get("custom_scale", {}).get(t, config.get("defaultScale", 0.5)) for t in OBJECT_CLASS_MAP}
+        spacings = {t: config.get("custom_spacing", {}).get(t, config.get("defaultSpacing", 1.0)) for t in OBJECT_CLASS_MAP}
+
+        try:
+            sheet_path, panels = await build_scheduler.run(
+                guild_id,
+                count * len(OBJECT_CLASS_MAP),
+                render_contact_sheet,
+                matrix,
+                os.path.join("previews", guild_id, f"contact_sheet_{uuid.uuid4().hex[:12]}.png"),
+                scales,
+                spacings,
+                ypr_mode=ypr_mode,
+                mirror_kit=mirror_kit,
+                optimize=optimize,
+                max_merge=config.get("optimize_max_merge", 4),
+                encoding=config.get("preview_encoding", "png"),
+                on_update=interaction_progress(interaction, "comparison")
+            )
+        except ValueError as e:
+            await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True)
+            return
+
+        lines = [f"🗂️ **{text}** with every object type"]
+        lines.extend(
+            f"• `{p['object_type']}` — {p['objects']} objects, {p['width_m']} × {p['height_m']} m "
+            f"(scale `{p['scale']}`, spacing `{p['spacing']}`)"
+            for p in panels
+        )
+        await interaction.followup.send(
+            "\n".join(lines),
+            file=discord.File(sheet_path, filename="contact_sheet" + os.path.splitext(sheet_path)[1]),
+            ephemeral=True
+        )
+        # Ephemeral and never indexed, so the sheet isn't needed once Discord has it
+        await asyncio.to_thread(os.remove, sheet_path)
+
+async def setup(bot):
+    await bot.add_cog(SignCompare(bot))
@@ -0,0 +1,88 @@
+# cogs/signfit.py — Suggest object type, scale and spacing for a sign of a given physical size
+
+import asyncio
+
+import discord
+from discord.ext import commands
+from discord import app_commands
+
+from utils.config_utils import get_guild_config_async, save_guild_config_async
+from utils.permissions import is_admin_user_async
+from logic.autofit import solve_fit
+from logic.text_matrix import generate_letter_matrix
+from sign_generator import MAX_OBJECTS, OBJECT_NAME_TO_LABEL
+
+class SignFit(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="signfit", description="Find the object type, scale and spacing that make a sign a given size")
+    @app_commands.describe(
+        text="The sign text to fit",
+        width="Target width in metres",
+        height="Target height in metres",
+        apply="Save the best match as this server's object, scale, spacing and size factor"
+    )
+    async def signfit(
+        self,
+        interaction: discord.Interaction,
+        text: str,
+        width: app_commands.Range[float, 0.5, 2000.0] = None,
+        height: app_commands.Range[float, 0.5, 2000.0] = None,
+        apply: bool = False
+    ):
+        if not await is_admin_user_async(interaction):
+            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
+            return
+
+        if not width and not height:
+            await interaction.response.send_message("❌ Give a target `width`, `height` or both (in metres).", ephemeral=True)
+            return
+
+        guild_id = str(interaction.guild.id)
+        config = await get_guild_config_async(guild_id)
+
+        try:
+            matrix = await asyncio.to_thread(generate_letter_matrix, text, font_path=config.get("font_path"), cell_height=config.get("font_cell_height", 12))
+        except OSError as e:
+            await interaction.response.send_message(f"❌ Could not load the sign font: {e}", ephemeral=True)
+            return
+
+        if not any("#" in row for row in matrix):
+            await interaction.response.send_message("⚠️ No valid characters detected.", ephemeral=True)
+            return
+
+        fits = solve_fit(
+            matrix,
+            width_m=width,
+            height_m=height,
+            mirror_kit=config.get("include_mirror_kit", False) and config.get("upright_mode", True),
+            outline=config.get("outline_mode", False)
+        )
+        if not fits:
+            await interaction.response.send_message(f"❌ No layout fits under the {MAX_OBJECTS}-object limit.", ephemeral=True)
+            return
+
+        target = " × ".join(f"{v:g} m" for v in (width, height) if v)
+        lines = [f"📐 **Best fits for {target}**"]
+        for rank, fit in enumerate(fits, 1):
+            lines.append(
+                f"`{rank}.` **{OBJECT_NAME_TO_LABEL.get(fit['object_type'], fit['object_type'])}** — "
+                f"scale `{fit['scale']}`, spacing `{fit['spacing']}`, size `{fit['size_factor']}×` → "
+                f"{fit['width_m']} × {fit['height_m']} m, {fit['objects']} objects"
+                + (f", {fit['gap']:.0%} gaps" if fit["gap"] > 0.01 else "")
+            )
+
+        if apply:
+            best = fits[0]
+            config["default_object"] = best["object_type"]
+            config.setdefault("custom_scale", {})[best["object_type"]] = best["scale"]
+            config.setdefault("custom_spacing", {})[best["object_type"]] = best["spacing"]
+            config["size_factor"] = best["size_factor"]
+            await save_guild_config_async(guild_id, config)
+            lines.append("✅ Saved #1 as this server's settings — `/signbuild` with that object type will use it.")
+
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(SignFit(bot))
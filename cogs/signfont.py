@@ -0,0 +1,98 @@
+# cogs/signfont.py — Choose or upload a TrueType/OpenType font for sign text
+
+import discord
+from discord.ext import commands
+from discord import app_commands
+import io
+import os
+
+from utils.config_utils import get_guild_config_async, save_guild_config_async
+from utils.io_executor import run_io
+from utils.permissions import is_admin_user_async
+from logic.glyph_provider import FONT_EXTENSIONS, UPLOADED_FONTS_DIR, resolve_font_path
+
+MAX_FONT_BYTES = 8 * 1024 * 1024
+
+def _check_font(source) -> None:
+    """Raise OSError unless Pillow can read the font (a path, or an upload's bytes)."""
+    from PIL import ImageFont
+    ImageFont.truetype(io.BytesIO(source) if isinstance(source, bytes) else source, 16)
+
+def _save_font(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+class SignFont(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="signfont", description="Use a TTF/OTF font for sign text instead of the built-in block letters")
+    @app_commands.describe(
+        font_file="Upload a .ttf or .otf font for this server",
+        font_name="Name of a bundled or previously uploaded font file",
+        cell_height="Letter height in objects (default 12)",
+        reset="Go back to the built-in 5×5 block font"
+    )
+    async def signfont(
+        self,
+        interaction: discord.Interaction,
+        font_file: discord.Attachment = None,
+        font_name: str = None,
+        cell_height: app_commands.Range[int, 5, 64] = None,
+        reset: bool = False
+    ):
+        if not await is_admin_user_async(interaction):
+            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
+            return
+
+        guild_id = str(interaction.guild.id)
+        config = await get_guild_config_async(guild_id)
+
+        if reset:
+            config["font_path"] = None
+            await save_guild_config_async(guild_id, config)
+            await interaction.response.send_message("🔤 Sign text reset to the built-in block font.", ephemeral=True)
+            return
+
+        if font_file:
+            filename = os.path.basename(font_file.filename)
+            if not filename.lower().endswith(FONT_EXTENSIONS):
+                await interaction.response.send_message("❌ Please upload a `.ttf` or `.otf` font.", ephemeral=True)
+                return
+            if font_file.size > MAX_FONT_BYTES:
+                await interaction.response.send_message("❌ Font file is too large (8 MB max).", ephemeral=True)
+                return
+
+            # Validate from the bytes, so a file Pillow can't read never lands in data/fonts
+            data = await font_file.read()
+            try:
+                await run_io(_check_font, data)
+            except OSError as e:
+                await interaction.response.send_message(f"❌ Could not load font `{filename}`: {e}", ephemeral=True)
+                return
+            await run_io(_save_font, os.path.join(UPLOADED_FONTS_DIR, guild_id, filename), data)
+            font_name = filename
+
+        if font_name:
+            try:
+                font_path = resolve_font_path(font_name, guild_id)
+                await run_io(_check_font, font_path)  # make sure Pillow can actually read it
+            except OSError as e:
+                await interaction.response.send_message(f"❌ Could not load font `{font_name}`: {e}", ephemeral=True)
+                return
+            config["font_path"] = font_path
+
+        if cell_height:
+            config["font_cell_height"] = cell_height
+
+        await save_guild_config_async(guild_id, config)
+
+        current = os.path.basename(config["font_path"]) if config.get("font_path") else "built-in block font"
+        await interaction.response.send_message(
+            f"🔤 Sign font: `{current}` | Letter height: `{config.get('font_cell_height', 12)}` objects",
+            ephemeral=True
+        )
+
+async def setup(bot):
+    await bot.add_cog(SignFont(bot))
@@ -0,0 +1,148 @@
+# cogs/signimage.py — Convert an uploaded image (logo, emblem) into a DayZ item sign
+
+import discord
+from discord.ext import commands
+from discord import app_commands
+
+from utils.config_utils import get_guild_config_async
+from logic.build_pipeline import build_sign, format_build_post, build_artifacts, gallery_metadata, guild_output_paths
+from sign_generator import MAX_OBJECTS
+from utils.channel_utils import get_channel_id_async
+from utils.permissions import is_admin_user_async
+from utils.post_queue import post_queue
+from utils.post_index import post_recorder
+from utils.build_scheduler import build_scheduler, interaction_progress
+from utils.gallery_queue import gallery_archiver
+
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+
+class SignImage(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="signimage", description="Convert an uploaded image into a DayZ item sign layout")
+    @app_commands.describe(
+        image="PNG/JPG/WebP image to convert (dark areas become objects)",
+        object_type="Choose the object to use for the sign",
+        mode="Threshold for crisp logos, dither for shaded images",
+        invert="Place objects on light areas instead of dark ones",
+        orientation="Object orientation: upright (billboard) or flat (ground)",
+        overall_scale="Overall object scale multiplier (default 0.5 or overridden per object)",
+        object_spacing="Spacing between objects (default 1.0 or overridden per object)"
+    )
+    @app_commands.choices(
+        object_type=[
+            app_commands.Choice(name="Armband (Black)", value="Armband_Black"),
+            app_commands.Choice(name="Jerry Can", value="JerryCan"),
+            app_commands.Choice(name="Box Wooden", value="BoxWooden"),
+            app_commands.Choice(name="Small Protective Case", value="SmallProtectiveCase"),
+            app_commands.Choice(name="Wooden Crate", value="WoodenCrate"),
+            app_commands.Choice(name="Improvised Container", value="ImprovisedContainer"),
+            app_commands.Choice(name="Dry Bag (Black)", value="DryBag_Black"),
+        ],
+        mode=[
+            app_commands.Choice(name="Threshold (logos, text)", value="threshold"),
+            app_commands.Choice(name="Dither (shaded images)", value="dither")
+        ],
+        orientation=[
+            app_commands.Choice(name="Upright (Billboard Style)", value="upright"),
+            app_commands.Choice(name="Flat (On Ground)", value="flat")
+        ]
+    )
+    async def signimage(
+        self,
+        interaction: discord.Interaction,
+        image: discord.Attachment,
+        object_type: app_commands.Choice[str],
+        mode: app_commands.Choice[str] = None,
+        invert: bool = False,
+        orientation: app_commands.Choice[str] = None,
+        overall_scale: float = None,
+        object_spacing: float = None
+    ):
+        if not await is_admin_user_async(interaction):
+            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
+            return
+
+        if image.size > MAX_IMAGE_BYTES:
+            await interaction.response.send_message("❌ Image is too large (10 MB max).", ephemeral=True)
+            return
+
+        await interaction.response.defer()
+
+        guild_id = str(interaction.guild.id)
+        config = await get_guild_config_async(guild_id)
+        obj_type = object_type.value
+        ypr_mode = orientation.value if orientation else "upright"
+        mirror_kit = config.get("include_mirror_kit", False) and ypr_mode == "upright"
+
+        origin = config.get("origin_position", {"x": 0.0, "y": 0.0, "z": 0.0})
+        offset = config.get("originOffset", {"x": 0.0, "y": 0.0, "z": 0.0})
+        overall_scale = overall_scale or config.get("custom_scale", {}).get(obj_type, config.get("defaultScale", 0.5))
+        object_spacing = object_spacing or config.get("custom_spacing", {}).get(obj_type, config.get("defaultSpacing", 1.0))
+
+        data = await image.read()
+        budget = MAX_OBJECTS // 2 if mirror_kit else MAX_OBJECTS
+        output_json_path, preview_path, zip_path = guild_output_paths(guild_id)
+
+        def convert_and_build():
+            # NumPy/OpenCV-backed, so imported on first use rather than when the cog loads
+            from logic.image_matrix import image_to_matrix
+
+            # ✅ Step 1: Image → matrix, sized to stay under the object cap (halved for a mirror kit)
+            try:
+                image_matrix = image_to_matrix(data, mode.value if mode else "threshold", invert, budget)
+            except ValueError as e:
+                raise ValueError(f"Could not convert image: {e}") from e
+
+            # Same flip as text signs so the image reads correctly in-game
+            matrix = [row[::-1] for row in image_matrix[::-1]]
+
+            # ✅ Step 2: Build objects, export and preview
+            return build_sign(
+                matrix,
+                obj_type,
+                config,
+                origin=origin,
+                offset=offset,
+                scale=overall_scale,
+                spacing=object_spacing,
+                output_json_path=output_json_path,
+                preview_path=preview_path,
+                zip_output_path=zip_path,
+                ypr_mode=ypr_mode,
+                mirror_kit=mirror_kit,
+                optimize=config.get("optimize_objects", False),
+                max_merge=config.get("optimize_max_merge", 4)
+            )
+
+        # The object count isn't known until the image is converted; the budget is the upper bound
+        try:
+            result = await build_scheduler.run(
+                guild_id, budget * (2 if mirror_kit else 1), convert_and_build,
+                on_update=interaction_progress(interaction, "image sign")
+            )
+        except ValueError as e:
+            await interaction.followup.send(f"❌ {str(e)}", ephemeral=True)
+            return
+
+        # ✅ Step 3: Gallery or Admin Channel Post
+        channel_id = await get_channel_id_async("gallery", guild_id) or config.get("admin_channel_id")
+        channel = self.bot.get_channel(int(channel_id)) if channel_id else None
+
+        if not channel:
+            await interaction.followup.send("❌ Could not find configured gallery/admin channel.", ephemeral=True)
+            return
+
+        posted = post_queue.send(
+            channel,
+            content=format_build_post("Image Sign Build Complete", result, [f"• Source: `{image.filename}`"]),
+            files=[result["export_file"], result["preview_file"]],
+            on_sent=post_recorder(guild_id, "Image Sign Build Complete", build_artifacts(result))
+        )
+        await gallery_archiver.publish(posted, result["preview_path"], result["export_file"][0], gallery_metadata(result), guild_id)
+
+        await interaction.followup.send("✅ Image sign generated and queued for the gallery channel.", ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(SignImage(bot))
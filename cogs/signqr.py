@@ -0,0 +1,146 @@
+# cogs/signqr.py — Build a scannable QR-code sign from a URL or text
+
+import discord
+from discord.ext import commands
+from discord import app_commands
+import asyncio
+
+from utils.config_utils import get_guild_config_async
+from logic.qr_matrix import qr_matrix, verify_qr_preview
+from logic.build_pipeline import build_sign, format_build_post, build_artifacts, gallery_metadata, guild_output_paths
+from utils.channel_utils import get_channel_id_async
+from utils.permissions import is_admin_user_async
+from utils.post_queue import post_queue
+from utils.post_index import post_recorder
+from utils.build_scheduler import build_scheduler, interaction_progress
+from utils.gallery_queue import gallery_archiver
+from utils.io_executor import run_io
+
+class SignQR(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="signqr", description="Build a scannable QR-code sign from a URL or text")
+    @app_commands.describe(
+        payload="URL or text to encode",
+        object_type="Choose the object to use for the sign",
+        error_correction="Higher levels survive more damage but need more objects",
+        tile_size="Preview pixels per object used for the scan check (default 16)",
+        orientation="Object orientation: upright (billboard) or flat (ground)",
+        overall_scale="Overall object scale multiplier (default 0.5 or overridden per object)",
+        object_spacing="Spacing between objects (default 1.0 or overridden per object)"
+    )
+    @app_commands.choices(
+        object_type=[
+            app_commands.Choice(name="Armband (Black)", value="Armband_Black"),
+            app_commands.Choice(name="Jerry Can", value="JerryCan"),
+            app_commands.Choice(name="Box Wooden", value="BoxWooden"),
+            app_commands.Choice(name="Small Protective Case", value="SmallProtectiveCase"),
+            app_commands.Choice(name="Wooden Crate", value="WoodenCrate"),
+            app_commands.Choice(name="Improvised Container", value="ImprovisedContainer"),
+            app_commands.Choice(name="Dry Bag (Black)", value="DryBag_Black"),
+        ],
+        error_correction=[
+            app_commands.Choice(name="Low (7%)", value="L"),
+            app_commands.Choice(name="Medium (15%)", value="M"),
+            app_commands.Choice(name="Quartile (25%)", value="Q"),
+            app_commands.Choice(name="High (30%)", value="H")
+        ],
+        orientation=[
+            app_commands.Choice(name="Upright (Billboard Style)", value="upright"),
+            app_commands.Choice(name="Flat (On Ground)", value="flat")
+        ]
+    )
+    async def signqr(
+        self,
+        interaction: discord.Interaction,
+        payload: app_commands.Range[str, 1, 512],
+        object_type: app_commands.Choice[str],
+        error_correction: app_commands.Choice[str] = None,
+        tile_size: app_commands.Range[int, 4, 64] = 16,
+        orientation: app_commands.Choice[str] = None,
+        overall_scale: float = None,
+        object_spacing: float = None
+    ):
+        if not await is_admin_user_async(interaction):
+            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
+            return
+
+        await interaction.response.defer()
+
+        guild_id = str(interaction.guild.id)
+        config = await get_guild_config_async(guild_id)
+        obj_type = object_type.value
+        ecc = error_correction.value if error_correction else "M"
+        ypr_mode = orientation.value if orientation else "upright"
+
+        origin = config.get("origin_position", {"x": 0.0, "y": 0.0, "z": 0.0})
+        offset = config.get("originOffset", {"x": 0.0, "y": 0.0, "z": 0.0})
+        overall_scale = overall_scale or config.get("custom_scale", {}).get(obj_type, config.get("defaultScale", 0.5))
+        object_spacing = object_spacing or config.get("custom_spacing", {}).get(obj_type, config.get("defaultSpacing", 1.0))
+
+        # ✅ Step 1: QR matrix (cached by payload, and a miss writes the cache), flipped like text signs
+        code = await run_io(qr_matrix, payload, ecc)
+        matrix = [row[::-1] for row in code[::-1]]
+
+        # ✅ Step 2: Build objects, export and preview (QR codes are never mirrored)
+        output_json_path, preview_path, zip_path = guild_output_paths(guild_id)
+        try:
+            result = await build_scheduler.run(
+                guild_id,
+                sum(row.count("#") for row in matrix),
+                build_sign,
+                matrix,
+                obj_type,
+                config,
+                origin=origin,
+                offset=offset,
+                scale=overall_scale,
+                spacing=object_spacing,
+                output_json_path=output_json_path,
+                preview_path=preview_path,
+                zip_output_path=zip_path,
+                ypr_mode=ypr_mode,
+                tile_size=tile_size,
+                optimize=config.get("optimize_objects", False),
+                max_merge=config.get("optimize_max_merge", 4),
+                on_update=interaction_progress(interaction, "QR sign")
+            )
+        except ValueError as e:
+            await interaction.followup.send(
+                f"❌ Error: {str(e)} Try a shorter payload or a lower error-correction level.",
+                ephemeral=True
+            )
+            return
+
+        # ✅ Step 3: Scan the rendered preview (verdict cached per payload/object/tile size/encoding)
+        verified = await asyncio.to_thread(
+            verify_qr_preview, result["preview_path"], payload, (payload, ecc, obj_type, tile_size),
+            encoding=config.get("preview_encoding", "png"), matrix=matrix, object_type=obj_type, tile_size=tile_size
+        )
+        verdict = {True: "✅ scans", False: "⚠️ did not scan — try another object or a larger tile size", None: "❔ not checked"}[verified]
+
+        # ✅ Step 4: Gallery or Admin Channel Post
+        channel_id = await get_channel_id_async("gallery", guild_id) or config.get("admin_channel_id")
+        channel = self.bot.get_channel(int(channel_id)) if channel_id else None
+
+        if not channel:
+            await interaction.followup.send("❌ Could not find configured gallery/admin channel.", ephemeral=True)
+            return
+
+        posted = post_queue.send(
+            channel,
+            content=format_build_post(
+                "QR Sign Build Complete",
+                result,
+                [f"• QR: {len(code)}×{len(code)} modules, ECC `{ecc}`", f"• Scan check: {verdict}"]
+            ),
+            files=[result["export_file"], result["preview_file"]],
+            on_sent=post_recorder(guild_id, "QR Sign Build Complete", build_artifacts(result))
+        )
+        await gallery_archiver.publish(posted, result["preview_path"], result["export_file"][0], gallery_metadata(result), guild_id)
+
+        await interaction.followup.send(f"✅ QR sign generated and queued for the gallery channel. Scan check: {verdict}", ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(SignQR(bot))
@@ -0,0 +1,75 @@
+# logic/autofit.py — Pick object type, size factor, scale and spacing for a target physical size
+
+import math
+
+from logic.matrix_ops import matrix_to_mask, estimate_object_counts
+from sign_generator import OBJECT_CLASS_MAP, OBJECT_SIZE_ADJUSTMENTS, MAX_OBJECTS
+
+MIN_SCALE = 0.1
+MAX_SCALE = 5.0
+MAX_SIZE_FACTOR = 6
+SCALE_STEP = 0.05   # scales are rounded down to this so they're easy to type back in
+
+def solve_fit(matrix: list, width_m: float = None, height_m: float = None, object_types: list = None,
+              mirror_kit: bool = False, outline: bool = False, limit: int = 5) -> list:
+    """
+    Rank (object type, size factor, scale, spacing) choices that make the sign as close as possible
+    to `width_m` × `height_m` metres (either may be omitted) while staying under MAX_OBJECTS.
+    Works from the matrix dimensions and the per-object size table only; no objects are generated.
+
+    Spacing is set so the sign spans the target, and scale so neighbouring objects just touch
+    (object edge = OBJECT_SIZE_ADJUSTMENTS × scale). Where scale hits its limits the
+    objects are left with gaps, which counts against the choice.
+    """
+    if not width_m and not height_m:
+        raise ValueError("Give a target width, height or both.")
+
+    rows, cols = matrix_to_mask(matrix).shape
+    if not rows or not cols:
+        return []
+
+    candidates = []
+    for factor in range(1, MAX_SIZE_FACTOR + 1):
+        counts = estimate_object_counts(matrix, factor, mirror_kit)
+        objects = counts["outline" if outline else "solid"]
+        if objects > MAX_OBJECTS:
+            break  # object count only grows with the factor
+
+        cells_w, cells_h = cols * factor, rows * factor
+        spacings = [t / n for t, n in ((width_m, cells_w), (height_m, cells_h)) if t]
+        # Fit inside both targets; scale is derived from the spacing as saved, so rounding
+        # can never leave the spacing below the object edge
+        spacing = max(round(min(spacings), 3), 0.001)
+
+        for object_type in object_types or OBJECT_CLASS_MAP:
+            size = OBJECT_SIZE_ADJUSTMENTS.get(object_type, 1.0)
+            # Round down so rounding never pushes neighbours into each other
+            scale = math.floor(min(spacing / size, MAX_SCALE) / SCALE_STEP + 1e-9) * SCALE_STEP
+            scale = max(scale, MIN_SCALE)
+            edge = size * scale
+
+            # The sign spans n cells: (n - 1) spacings between centres plus one object edge
+            width = (cells_w - 1) * spacing + edge
+            height = (cells_h - 1) * spacing + edge
+            error = max(abs(width - width_m) / width_m if width_m else 0.0,
+                        abs(height - height_m) / height_m if height_m else 0.0)
+            gap = max(0.0, 1.0 - edge / spacing)
+            overlap = max(0.0, edge / spacing - 1.0)
+
+            candidates.append({
+                "object_type": object_type,
+                "size_factor": factor,
+                "scale": round(scale, 2),
+                "spacing": spacing,
+                "objects": objects,
+                "width_m": round(width, 2),
+                "height_m": round(height, 2),
+                "error": error,
+                "gap": gap,
+                "overlap": overlap,
+                # Off-target size matters most, then see-through gaps/overlaps, then object count
+                "score": error + 0.5 * gap + 2.0 * overlap + 0.1 * objects / MAX_OBJECTS
+            })
+
+    candidates.sort(key=lambda c: c["score"])
+    return candidates[:limit]
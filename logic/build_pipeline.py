@@ -0,0 +1,143 @@
+# logic/build_pipeline.py — Shared matrix → objects → export → preview → bundle steps for every build command
+
+import os
+import uuid
+
+from logic.render_sign_preview import render_sign_preview
+from logic.object_optimizer import DEFAULT_MAX_MERGE
+from sign_generator import letter_to_object_list, save_object_json, OBJECT_CLASS_MAP, OBJECT_SIZE_ADJUSTMENTS
+from sign_packager import create_sign_zip
+
+def build_sign(matrix: list, object_type: str, config: dict, origin: dict, offset: dict, scale: float, spacing: float,
+               output_json_path: str, preview_path: str, ypr_mode: str = "upright", mirror_kit: bool = False,
+               tile_size: int = 64, optimize: bool = False, max_merge: int = DEFAULT_MAX_MERGE,
+               zip_output_path: str = None) -> dict:
+    """
+    Run one build without touching Discord and return everything the caller needs to report it.
+    Raises ValueError (bad object type / object cap) like letter_to_object_list.
+    """
+    # NumPy-backed, so imported per build rather than when the cogs load
+    from logic.layout_validation import validate_layout
+    from logic.transform import sign_rotation
+
+    mirror_kit = mirror_kit and ypr_mode == "upright"
+    yaw, tilt = config.get("sign_yaw", 0.0), config.get("sign_tilt", 0.0)
+
+    objects = letter_to_object_list(
+        matrix=matrix,
+        object_type=object_type,
+        origin=origin,
+        offset=offset,
+        scale=scale,
+        spacing=spacing,
+        ypr_mode=ypr_mode,
+        mirror_kit=mirror_kit,
+        mirror_depth=config.get("mirror_depth"),
+        optimize=optimize,
+        max_merge=max_merge,
+        yaw=yaw,
+        tilt=tilt
+    )
+    cell_count = sum(row.count("#") for row in matrix) * (2 if mirror_kit else 1)
+    print(f"📦 Generated object count = {len(objects)}" + (f" (optimized from {cell_count})" if optimize else ""))
+
+    # Catch overlapping objects and off-map placements before anyone pastes the export
+    validation = validate_layout(objects, OBJECT_SIZE_ADJUSTMENTS.get(object_type, 1.0), config.get("selected_map"),
+                                 rotation=sign_rotation(yaw, tilt) if yaw or tilt else None)
+    for warning in validation["warnings"]:
+        print(f"⚠️ Layout: {warning}")
+
+    for path in (output_json_path, preview_path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    save_object_json(objects, output_json_path)
+    preview_path = render_sign_preview(matrix, preview_path, object_type=object_type, tile_size=tile_size,
+                                       mirror_kit=mirror_kit, encoding=config.get("preview_encoding", "png"))
+
+    result = {
+        "objects": objects,
+        "cell_count": cell_count,
+        "optimized": optimize,
+        "object_type": object_type,
+        "object_class": OBJECT_CLASS_MAP.get(object_type, object_type),
+        "size": (max((len(row) for row in matrix), default=0), len(matrix)),
+        "scale": scale,
+        "spacing": spacing,
+        "ypr_mode": ypr_mode,
+        "mirror_kit": mirror_kit,
+        "yaw": yaw,
+        "tilt": tilt,
+        "origin": origin,
+        "validation": validation,
+        "output_json_path": output_json_path,
+        "preview_path": preview_path
+    }
+
+    export_mode = config.get("export_mode", "json")
+    final_path = create_sign_zip(
+        output_json_path,
+        preview_path,
+        zip_output_path or config.get("zip_output_path", "Sign4ME.zip"),
+        extra_text=build_manifest(result),
+        export_mode=export_mode,
+        compress_level=config.get("zip_compress_level", 6)
+    )
+    result["export_file"] = (final_path, "Sign4ME.zip") if export_mode == "zip" else (output_json_path, "Sign4ME.json")
+    result["preview_file"] = (preview_path, "sign_preview" + os.path.splitext(preview_path)[1])
+    return result
+
+def guild_output_paths(guild_id: str, build_id: str = None) -> tuple:
+    """
+    (export JSON, preview, ZIP) paths unique to one build. The post and gallery archive read
+    the files after the build slot is released, so a queued build must never reuse them.
+    """
+    build_id = build_id or uuid.uuid4().hex[:12]
+    return (os.path.join("outputs", str(guild_id), f"Sign4ME_{build_id}.json"),
+            os.path.join("previews", str(guild_id), f"sign_preview_{build_id}.png"),
+            os.path.join("outputs", str(guild_id), f"Sign4ME_{build_id}.zip"))
+
+def build_manifest(result: dict) -> str:
+    """Plain-text build summary stored in the ZIP bundle."""
+    width, height = result["size"]
+    return (f"Sign Size: {width}x{height}\n"
+            f"Total Objects: {len(result['objects'])}\n"
+            f"Filled Cells: {result['cell_count']}{' (merged into larger objects)' if result['optimized'] else ''}\n"
+            f"Object Used: {result['object_class']}\n"
+            f"Scale: {result['scale']} | Spacing: {result['spacing']}\n"
+            f"Orientation: {result['ypr_mode']} | Facing: {result['yaw']}° | Tilt: {result['tilt']}°\n"
+            f"Mirror Kit: {'front + back' if result['mirror_kit'] else 'off'}\n"
+            f"Layout Check: {'; '.join(result['validation']['warnings']) or 'no overlaps, inside map bounds'}")
+
+def gallery_metadata(result: dict) -> dict:
+    """Fields save_to_gallery records for a build."""
+    width, height = result["size"]
+    return {
+        "object_type": result["object_type"],
+        "qr_size": f"{width}x{height}",
+        "total_objects": len(result["objects"])
+    }
+
+def build_artifacts(result: dict) -> list:
+    """Files a build wrote, for the post index: the export (ZIP in zip mode), the JSON beside it and the preview."""
+    return [result["export_file"][0], result["output_json_path"], result["preview_path"]]
+
+def format_build_post(title: str, result: dict, extra_lines: list = None) -> str:
+    """Gallery/admin channel message for a finished build."""
+    width, height = result["size"]
+    origin = result["origin"]
+    lines = [
+        f"🪧 **{title}**",
+        f"• Size: {width}x{height}",
+        f"• Objects: {len(result['objects'])}" + (f" (optimized from {result['cell_count']})" if result["optimized"] else ""),
+        f"• Type: `{result['object_class']}`",
+        f"• Scale: `{result['scale']}` | Spacing: `{result['spacing']}`",
+        f"• Orientation: `{result['ypr_mode']}`"
+    ]
+    if result["yaw"] or result["tilt"]:
+        lines.append(f"• Facing: `{result['yaw']}°` | Tilt: `{result['tilt']}°`")
+    if result["mirror_kit"]:
+        lines.append("• Mirror Kit: `front + back`")
+    lines.extend(f"• ⚠️ {warning}" for warning in result["validation"]["warnings"])
+    lines.extend(extra_lines or [])
+    lines.append(f"• Origin: X: {origin['x']}, Y: {origin['y']}, Z: {origin['z']}")
+    return "\n".join(lines)
@@ -0,0 +1,92 @@
+# logic/contact_sheet.py — Render one matrix with every object type side by side for comparison
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from logic.render_sign_preview import compose_preview, save_preview, preview_path_for
+from logic.object_optimizer import DEFAULT_MAX_MERGE
+from sign_generator import letter_to_object_list, OBJECT_CLASS_MAP, OBJECT_SIZE_ADJUSTMENTS
+
+MAX_PANEL_PIXELS = 768      # longest panel edge; tiles shrink to fit so wide text stays readable
+MIN_TILE_SIZE = 4
+LABEL_HEIGHT = 44
+PANEL_PADDING = 12
+SHEET_BACKGROUND = (49, 51, 56, 255)
+LABEL_COLOUR = (235, 235, 235, 255)
+SHEET_WORKERS = int(os.getenv("SIGN4ME_SHEET_WORKERS", "0")) or min(len(OBJECT_CLASS_MAP), os.cpu_count() or 1)
+
+def _render_panel(matrix: list, object_type: str, scale: float, spacing: float, tile_size: int,
+                  ypr_mode: str, mirror_kit: bool, optimize: bool, max_merge: int) -> dict:
+    """Lay out and draw one object type; returns its stats and panel image."""
+    objects = letter_to_object_list(
+        matrix, object_type, origin={}, offset={}, scale=scale, spacing=spacing,
+        ypr_mode=ypr_mode, mirror_kit=mirror_kit, optimize=optimize, max_merge=max_merge
+    )
+
+    # Extent = centre-to-centre span plus the edge of the largest object
+    low, high = objects.bounds()
+    edge = OBJECT_SIZE_ADJUSTMENTS.get(object_type, 1.0) * float(objects.scale_array().max(initial=scale))
+    return {
+        "object_type": object_type,
+        "objects": len(objects),
+        "scale": scale,
+        "spacing": spacing,
+        "width_m": round(high[0] - low[0] + edge, 2),
+        "height_m": round(high[1] - low[1] + edge, 2),
+        "image": compose_preview(matrix, object_type, tile_size, mirror_kit and ypr_mode == "upright")
+    }
+
+def render_contact_sheet(matrix: list, output_path: str, scales: dict, spacings: dict, object_types: list = None,
+                         ypr_mode: str = "upright", mirror_kit: bool = False, optimize: bool = False,
+                         max_merge: int = DEFAULT_MAX_MERGE, encoding: str = "png") -> tuple:
+    """
+    Render `matrix` once per object type in a thread pool (Pillow releases the GIL while
+    pasting and encoding) and tile the panels into one labelled image. `scales` and
+    `spacings` map object type → value. Returns (path written, [per-type stats]).
+    """
+    from PIL import Image, ImageDraw
+
+    object_types = list(object_types or OBJECT_CLASS_MAP)
+    rows = len(matrix) * (2 if mirror_kit and ypr_mode == "upright" else 1)
+    cols = max((len(row) for row in matrix), default=0)
+    tile_size = max(MIN_TILE_SIZE, min(64, MAX_PANEL_PIXELS // max(rows, cols, 1)))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(SHEET_WORKERS, len(object_types))) as pool:
+        futures = [
+            pool.submit(_render_panel, matrix, object_type, scales[object_type], spacings[object_type],
+                        tile_size, ypr_mode, mirror_kit, optimize, max_merge)
+            for object_type in object_types
+        ]
+        panels = [f.result() for f in futures]  # re-raises the first worker error
+
+    # Grid close to square, panels in the requested order
+    grid_cols = 1
+    while grid_cols * grid_cols < len(panels):
+        grid_cols += 1
+    grid_rows = -(-len(panels) // grid_cols)
+    panel_w = max(p["image"].width for p in panels) + PANEL_PADDING * 2
+    panel_h = max(p["image"].height for p in panels) + PANEL_PADDING * 2 + LABEL_HEIGHT
+
+    sheet = Image.new("RGBA", (grid_cols * panel_w, grid_rows * panel_h), SHEET_BACKGROUND)
+    draw = ImageDraw.Draw(sheet)
+    for i, panel in enumerate(panels):
+        x = (i % grid_cols) * panel_w
+        y = (i // grid_cols) * panel_h
+        image = panel.pop("image")
+        sheet.paste(image, (x + (panel_w - image.width) // 2, y + PANEL_PADDING), image)
+        label_y = y + panel_h - LABEL_HEIGHT
+        draw.text((x + PANEL_PADDING, label_y), OBJECT_CLASS_MAP[panel["object_type"]], fill=LABEL_COLOUR)
+        draw.text((x + PANEL_PADDING, label_y + 16),
+                  f"{panel['objects']} objects | {panel['width_m']} x {panel['height_m']} m", fill=LABEL_COLOUR)
+
+    # The sheet is RGBA with a solid background, so the palette encoding falls back to plain PNG
+    encoding = "png" if encoding == "palette" else encoding
+    output_path = preview_path_for(output_path, encoding)
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    save_preview(sheet, output_path, encoding)
+
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"🗂️ Contact sheet: {len(panels)} object types in {elapsed:.0f} ms → {output_path}")
+    return output_path, panels
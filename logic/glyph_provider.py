@@ -0,0 +1,83 @@
+# logic/glyph_provider.py — TrueType/OpenType glyphs for sign text, cached in an on-disk atlas
+
+import hashlib
+import math
+import os
+
+from utils.disk_cache import PersistentLRUCache
+
+FONTS_DIR = "assets/fonts"            # fonts shipped with the bot
+UPLOADED_FONTS_DIR = "data/fonts"     # per-guild uploads: data/fonts/<guild_id>/<file>
+FONT_EXTENSIONS = (".ttf", ".otf")
+ATLAS_PATH = "data/glyph_atlas.json"
+ATLAS_MAX_GLYPHS = 4096
+RENDER_OVERSAMPLE = 8                 # rasterize at 8× the cell height, then box-downsample
+INK_THRESHOLD = 80                    # ~30% coverage, so thin strokes survive small cell heights
+
+# Glyph bitmaps keyed by (font, cell height, char)
+atlas = PersistentLRUCache(ATLAS_PATH, ATLAS_MAX_GLYPHS)
+
+_font_ids = {}
+_fonts = {}
+
+def resolve_font_path(font: str, guild_id: str = None) -> str:
+    """Find a font by guild upload name or bundled font name; paths are refused so only the fonts directories are reachable."""
+    if not font or os.path.basename(font) != font or font in (".", ".."):
+        raise FileNotFoundError(f"Font not found: {font}")
+    candidates = []
+    if guild_id:
+        candidates.append(os.path.join(UPLOADED_FONTS_DIR, str(guild_id), font))
+    candidates.append(os.path.join(FONTS_DIR, font))
+
+    for path in candidates:
+        if os.path.isfile(path) and path.lower().endswith(FONT_EXTENSIONS):
+            return path
+    raise FileNotFoundError(f"Font not found: {font}")
+
+def _font_id(font_path: str) -> str:
+    # Content hash, so re-uploading a different file under the same name can't serve stale glyphs
+    stat = os.stat(font_path)
+    cache_key = (font_path, stat.st_mtime_ns, stat.st_size)
+    if cache_key not in _font_ids:
+        with open(font_path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:12]
+        _font_ids[cache_key] = f"{os.path.basename(font_path)}-{digest}"
+    return _font_ids[cache_key]
+
+def _load_font(font_path: str, cell_height: int):
+    from PIL import ImageFont
+
+    key = (font_path, cell_height)
+    if key not in _fonts:
+        _fonts[key] = ImageFont.truetype(font_path, cell_height * RENDER_OVERSAMPLE)
+    return _fonts[key]
+
+def rasterize_glyph(font_path: str, cell_height: int, char: str) -> list:
+    """Render one character to `cell_height` rows of '#'/' ' using the font's full line height."""
+    from PIL import Image, ImageDraw
+
+    font = _load_font(font_path, cell_height)
+    ascent, descent = font.getmetrics()
+    line_height = ascent + descent
+    width = max(1, math.ceil(font.getlength(char)))
+
+    img = Image.new("L", (width, line_height), 0)
+    ImageDraw.Draw(img).text((0, 0), char, font=font, fill=255)
+
+    cols = max(1, round(width * cell_height / line_height))
+    small = img.resize((cols, cell_height), Image.BOX)
+    pixels = small.load()
+
+    return [
+        "".join("#" if pixels[x, y] >= INK_THRESHOLD else " " for x in range(cols))
+        for y in range(cell_height)
+    ]
+
+def get_glyph(font_path: str, cell_height: int, char: str) -> list:
+    """Return a glyph bitmap from the atlas, rasterizing it on first use."""
+    key = f"{_font_id(font_path)}:{cell_height}:{char}"
+    rows = atlas.get(key)
+    if rows is None:
+        rows = rasterize_glyph(font_path, cell_height, char)
+        atlas.put(key, rows)
+    return rows
@@ -0,0 +1,142 @@
+# logic/image_matrix.py — Converts uploaded images (logos, emblems) into sign matrices
+
+import io
+
+import numpy as np
+
+from logic.matrix_ops import mask_to_matrix
+from sign_generator import MAX_OBJECTS
+
+MAX_COLUMNS = 240        # widest sign the search will consider
+DECODE_HEADROOM = 2      # keep at least 2 source pixels per output cell after a reduced decode
+
+# 4×4 Bayer matrix for ordered dithering, normalised to (0, 1)
+BAYER_4 = (np.array([
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5]
+], dtype=np.float32) + 0.5) / 16.0
+
+def decode_image(data: bytes, max_columns: int = MAX_COLUMNS) -> np.ndarray:
+    """
+    Decode to an 8-bit grayscale array. Only the header is parsed up front; opaque
+    images are then decoded at 1/2, 1/4 or 1/8 scale when the sign can't use the
+    extra detail, which skips most of the work for large photos.
+    """
+    import cv2
+    from PIL import Image
+
+    try:
+        with Image.open(io.BytesIO(data)) as header:
+            width, height = header.size
+            has_alpha = header.mode in ("RGBA", "LA", "PA") or "transparency" in header.info
+    except (OSError, Image.DecompressionBombError) as e:
+        # Not an image (UnidentifiedImageError is an OSError) or too many pixels to decode safely
+        raise ValueError("Could not decode image.") from e
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+
+    if has_alpha:
+        # Reduced decode modes drop alpha; composite transparent logos onto white instead
+        img = cv2.imdecode(buf, cv2.IMREAD_UNCHANGED)
+        if img is None:
+            raise ValueError("Could not decode image.")
+        if img.ndim == 3 and img.shape[2] == 4:
+            alpha = img[:, :, 3:4].astype(np.float32) / 255.0
+            rgb = img[:, :, :3].astype(np.float32) * alpha + 255.0 * (1.0 - alpha)
+            img = rgb.astype(np.uint8)
+        return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img
+
+    flag = cv2.IMREAD_GRAYSCALE
+    for factor, reduced in ((8, cv2.IMREAD_REDUCED_GRAYSCALE_8), (4, cv2.IMREAD_REDUCED_GRAYSCALE_4), (2, cv2.IMREAD_REDUCED_GRAYSCALE_2)):
+        if max(width, height) // factor >= max_columns * DECODE_HEADROOM:
+            flag = reduced
+            break
+
+    img = cv2.imdecode(buf, flag)
+    if img is None:
+        raise ValueError("Could not decode image.")
+    return img
+
+def image_to_mask(gray: np.ndarray, columns: int, mode: str = "threshold", invert: bool = False, threshold: float = None) -> np.ndarray:
+    """Downsample to `columns` cells wide (square cells) and binarise; True = place an object."""
+    import cv2
+
+    height, width = gray.shape
+    rows = max(1, round(columns * height / width))
+    small = cv2.resize(gray, (columns, rows), interpolation=cv2.INTER_AREA).astype(np.float32) / 255.0
+
+    if invert:
+        small = 1.0 - small
+
+    if mode == "dither":
+        # Ordered dithering: compare every cell against a tiled threshold map in one shot
+        tiled = np.tile(BAYER_4, (rows // 4 + 1, columns // 4 + 1))[:rows, :columns]
+        return small < tiled
+
+    return small < (threshold if threshold is not None else 0.5)
+
+def otsu_threshold(gray: np.ndarray, invert: bool = False) -> float:
+    """Global Otsu threshold of the full image, as a 0–1 level."""
+    import cv2
+
+    source = 255 - gray if invert else gray
+    level, _ = cv2.threshold(source, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    # Otsu's level is the top of the dark class, and for a two-tone logo that is the logo colour
+    # itself; cut halfway between the two class means so `small < threshold` keeps the logo
+    dark, light = source[source <= level], source[source > level]
+    if not dark.size or not light.size:
+        return level / 255.0
+    return (float(dark.mean()) + float(light.mean())) / 2.0 / 255.0
+
+def image_to_matrix(data: bytes, mode: str = "threshold", invert: bool = False, max_objects: int = MAX_OBJECTS, max_columns: int = MAX_COLUMNS) -> list:
+    """
+    Convert image bytes into the '#'/' ' matrix letter_to_object_list consumes, picking
+    the widest resolution whose object count stays within `max_objects`.
+    Dark pixels become objects unless `invert` is set.
+    """
+    gray = decode_image(data, max_columns)
+    threshold = otsu_threshold(gray, invert) if mode == "threshold" else None
+    max_columns = min(max_columns, gray.shape[1])
+
+    # Binary search on width: object count grows with resolution
+    best = None
+    low, high = 1, max_columns
+    while low <= high:
+        columns = (low + high) // 2
+        mask = image_to_mask(gray, columns, mode, invert, threshold)
+        if int(mask.sum()) <= max_objects:
+            best = mask
+            low = columns + 1
+        else:
+            high = columns - 1
+
+    if best is None or not best.any():
+        raise ValueError("Image produced no objects within the object limit.")
+
+    print(f"🖼️ Image → {best.shape[1]}x{best.shape[0]} cells, {int(best.sum())} objects")
+    return mask_to_matrix(best)
+
+if __name__ == "__main__":
+    # python -m logic.image_matrix — regression check: coloured two-tone logos must convert
+    import cv2
+
+    def _encode(image: np.ndarray) -> bytes:
+        ok, png = cv2.imencode(".png", image)
+        assert ok
+        return png.tobytes()
+
+    for name, colour in (("red", (0, 0, 200)), ("green", (0, 120, 0)), ("gray", (128, 128, 128)), ("black", (0, 0, 0))):
+        logo = np.full((120, 200, 3), 255, dtype=np.uint8)
+        logo[30:90, 50:150] = colour
+        cells = sum(row.count("#") for row in image_to_matrix(_encode(logo)))
+        print(f"{name:>6} on white: {cells} objects")
+        assert cells > 0
+
+    emblem = np.zeros((120, 200, 4), dtype=np.uint8)
+    emblem[30:90, 50:150] = (0, 0, 200, 255)   # BGRA: opaque red on transparent
+    cells = sum(row.count("#") for row in image_to_matrix(_encode(emblem)))
+    print(f"red on transparent: {cells} objects")
+    assert cells > 0
+    print("✅ Two-tone images convert")
@@ -0,0 +1,97 @@
+# logic/layout_validation.py — Overlap and map-bounds checks for generated layouts
+
+import itertools
+import numpy as np
+
+from logic.sign_objects import SignObjects
+
+# Playable extent (metres) of each map along world X and Z, from 0
+MAP_SIZES = {
+    "Chernarus": 15360.0,
+    "Livonia": 12800.0,
+    "Sakhal": 15360.0,
+    "Namalsk": 12800.0,
+    "Deer Isle": 16384.0,
+    "Esseker": 12800.0,
+    "Takistan": 12800.0
+}
+
+MAX_REPORTED_PAIRS = 20
+TOUCH_TOLERANCE = 1e-6  # neighbours that exactly touch are fine
+
+def find_overlaps(objects: SignObjects, footprint: float, max_pairs: int = MAX_REPORTED_PAIRS) -> tuple:
+    """
+    Count pairs of objects whose boxes (edge `footprint` × scale, centred on pos) overlap,
+    using a spatial hash with cells as big as the largest box so only neighbouring cells
+    need comparing. Returns (pair_count, first `max_pairs` index pairs).
+    """
+    if len(objects) < 2:
+        return 0, []
+
+    pos = objects.pos
+    half = footprint * objects.scale_array() / 2.0
+    cell = max(float(half.max()) * 2.0, TOUCH_TOLERANCE)
+    keys = np.floor(pos / cell).astype(np.int64)
+
+    keys = keys - keys.min(axis=0) + 1          # ≥ 1, so a -1 neighbour offset stays non-negative
+    span = keys.max(axis=0) + 2
+    codes = (keys[:, 0] * span[1] + keys[:, 1]) * span[2] + keys[:, 2]
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    index = np.arange(len(objects))
+
+    count, pairs = 0, []
+    for offset in itertools.product((-1, 0, 1), repeat=3):
+        # Every object against everything hashed into the neighbouring cell at `offset`
+        dx, dy, dz = offset
+        target = codes + (dx * span[1] + dy) * span[2] + dz
+        lo = np.searchsorted(sorted_codes, target, side="left")
+        hi = np.searchsorted(sorted_codes, target, side="right")
+        per_object = hi - lo
+        if not per_object.any():
+            continue
+        i = np.repeat(index, per_object)
+        within = np.arange(len(i)) - np.repeat(np.cumsum(per_object) - per_object, per_object)
+        j = order[np.repeat(lo, per_object) + within]
+
+        keep = i < j  # each pair once
+        i, j = i[keep], j[keep]
+        gap = np.abs(pos[i] - pos[j]) - (half[i] + half[j])[:, None]
+        hit = (gap < -TOUCH_TOLERANCE).all(axis=1)
+        count += int(hit.sum())
+        pairs.extend(zip(i[hit][:max(0, max_pairs - len(pairs))].tolist(), j[hit].tolist()))
+
+    return count, pairs
+
+def check_map_bounds(objects: SignObjects, map_name: str) -> int | None:
+    """Number of objects outside the map's X/Z extent, or None for an unknown map."""
+    size = MAP_SIZES.get(map_name)
+    if size is None or not len(objects):
+        return None if size is None else 0
+    x, z = objects.pos[:, 0], objects.pos[:, 2]  # export order [x, height, z]
+    outside = (x < 0) | (x > size) | (z < 0) | (z > size)
+    return int(outside.sum())
+
+def validate_layout(objects: SignObjects, footprint: float, map_name: str = None, rotation=None) -> dict:
+    """
+    Run every layout check and collect human-readable warnings for the build report.
+    `rotation` is the 3×3 matrix a rotated sign was turned by; boxes are compared in the
+    sign's own frame, since axis-aligned boxes of turned neighbours would look like overlaps.
+    """
+    local = objects if rotation is None else SignObjects(objects.name, objects.pos @ rotation, objects.ypr, objects.scale)
+    overlap_count, pairs = find_overlaps(local, footprint)
+    out_of_bounds = check_map_bounds(objects, map_name) if map_name else None
+
+    warnings = []
+    if overlap_count:
+        warnings.append(f"{overlap_count} overlapping object pair(s) — lower the scale or raise the spacing")
+    if out_of_bounds:
+        warnings.append(f"{out_of_bounds} object(s) outside {map_name} (0–{MAP_SIZES[map_name]:.0f} m) — check the origin")
+
+    return {
+        "overlaps": overlap_count,
+        "overlap_pairs": pairs,
+        "out_of_bounds": out_of_bounds,
+        "map": map_name,
+        "warnings": warnings
+    }
@@ -0,0 +1,58 @@
+# logic/matrix_ops.py — Conversions between character matrices and NumPy masks
+#
+# Imported by the cogs at load time, so NumPy is only imported inside the functions.
+
+def matrix_to_mask(matrix: list) -> "np.ndarray":
+    """Turn a (possibly ragged) list of '#'/' ' rows into a boolean array, padding short rows."""
+    import numpy as np
+
+    if not matrix:
+        return np.zeros((0, 0), dtype=bool)
+    width = max(len(row) for row in matrix)
+    mask = np.zeros((len(matrix), width), dtype=bool)
+    for r, row in enumerate(matrix):
+        mask[r, :len(row)] = [cell == "#" for cell in row]
+    return mask
+
+def mask_to_matrix(mask: "np.ndarray") -> list:
+    """Turn a boolean array back into the list-of-lists '#'/' ' matrix used everywhere else."""
+    import numpy as np
+
+    return [["#" if cell else " " for cell in row] for row in np.asarray(mask, dtype=bool)]
+
+def upscale_mask(mask: "np.ndarray", factor: int) -> "np.ndarray":
+    """Blow every cell up into a factor×factor block (Kronecker product with a block of ones)."""
+    import numpy as np
+
+    if factor <= 1:
+        return mask
+    return np.kron(mask, np.ones((factor, factor), dtype=bool))
+
+def outline_mask(mask: "np.ndarray") -> "np.ndarray":
+    """Keep only filled cells that touch an empty cell (8-neighbourhood) or the edge of the sign."""
+    import numpy as np
+
+    if not mask.size:
+        return mask
+    padded = np.pad(mask, 1)
+    interior = np.lib.stride_tricks.sliding_window_view(padded, (3, 3)).all(axis=(2, 3))
+    return mask & ~interior
+
+def resize_matrix(matrix: list, factor: int = 1, outline: bool = False) -> list:
+    """Upscale a '#'/' ' matrix by an integer factor, optionally hollowing it to an outline."""
+    if factor <= 1 and not outline:
+        return matrix
+    mask = upscale_mask(matrix_to_mask(matrix), factor)
+    return mask_to_matrix(outline_mask(mask) if outline else mask)
+
+def estimate_object_counts(matrix: list, factor: int = 1, mirror_kit: bool = False) -> dict:
+    """
+    Object count of each size choice without laying anything out: the solid sign
+    costs cells × factor², the outline only its edge cells. Doubled for a mirror kit.
+    """
+    mask = matrix_to_mask(matrix)
+    faces = 2 if mirror_kit else 1
+    return {
+        "solid": int(mask.sum()) * max(factor, 1) ** 2 * faces,
+        "outline": int(outline_mask(upscale_mask(mask, factor)).sum()) * faces
+    }
@@ -0,0 +1,41 @@
+# logic/object_optimizer.py — Cover filled cells with fewer, larger objects
+
+DEFAULT_MAX_MERGE = 4  # largest block (k×k cells) one object may replace
+
+def merge_cells(mask: "np.ndarray", max_merge: int = DEFAULT_MAX_MERGE) -> tuple:
+    """
+    Greedily cover the filled cells of `mask` with k×k blocks, largest first.
+
+    DayZ object scale is uniform, so an object scaled k× grows k× in every direction:
+    a horizontal run of k cells can't become one object without spilling into the rows
+    around it, but a filled k×k square can. Returns (row_centres, col_centres, sizes)
+    where sizes[i] is the block edge in cells; single cells come out with size 1.
+    """
+    import numpy as np
+
+    mask = np.asarray(mask, dtype=bool)
+    available = mask.copy()
+    rows_out, cols_out, sizes_out = [], [], []
+
+    for k in range(min(max_merge, *mask.shape) if mask.size else 0, 1, -1):
+        # k×k window sums of the still-available cells via a 2D prefix sum
+        prefix = np.pad(available, ((1, 0), (1, 0))).cumsum(0).cumsum(1)
+        window = prefix[k:, k:] - prefix[:-k, k:] - prefix[k:, :-k] + prefix[:-k, :-k]
+
+        for r, c in zip(*np.nonzero(window == k * k)):
+            # Blocks taken earlier in this pass may overlap this candidate
+            block = available[r:r + k, c:c + k]
+            if block.all():
+                block[:] = False
+                rows_out.append(r + (k - 1) / 2)
+                cols_out.append(c + (k - 1) / 2)
+                sizes_out.append(k)
+
+    single_r, single_c = np.nonzero(available)
+    rows = np.concatenate([np.asarray(rows_out, dtype=np.float64), single_r])
+    cols = np.concatenate([np.asarray(cols_out, dtype=np.float64), single_c])
+    sizes = np.concatenate([np.asarray(sizes_out, dtype=np.float64), np.ones(len(single_r))])
+
+    # Row-major order keeps exports stable and readable
+    order = np.lexsort((cols, rows))
+    return rows[order], cols[order], sizes[order]
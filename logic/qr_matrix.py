@@ -0,0 +1,83 @@
+# logic/qr_matrix.py — QR-code sign matrices with scan verification, cached by payload
+
+import hashlib
+import io
+
+from utils.disk_cache import PersistentLRUCache
+
+QR_CACHE_PATH = "data/qr_cache.json"
+QR_CACHE_MAX = 512
+ECC_LEVELS = ("L", "M", "Q", "H")
+DEFAULT_BORDER = 2  # quiet-zone modules around the code
+# Lossless RGBA previews can be scanned as written; JPEG (opaque dark background) and
+# lossy WebP/palette are checked against a PNG render of the same sign instead
+SCANNABLE_ENCODINGS = ("png", "png_fast")
+
+# "matrix:<key>" → rows, "verdict:<key>" → bool
+qr_cache = PersistentLRUCache(QR_CACHE_PATH, QR_CACHE_MAX)
+
+def _key(*parts) -> str:
+    return hashlib.sha1("\x1f".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+def qr_matrix(payload: str, ecc: str = "M", border: int = DEFAULT_BORDER) -> list:
+    """Encode `payload` as a QR code and return it as a '#'/' ' matrix (dark module = object)."""
+    key = "matrix:" + _key(payload, ecc, border)
+    rows = qr_cache.get(key)
+
+    if rows is None:
+        import qrcode
+        from qrcode import constants
+
+        qr = qrcode.QRCode(
+            error_correction=getattr(constants, f"ERROR_CORRECT_{ecc}"),
+            border=border
+        )
+        qr.add_data(payload)
+        qr.make(fit=True)
+        rows = ["".join("#" if cell else " " for cell in row) for row in qr.get_matrix()]
+        qr_cache.put(key, rows)
+        qr_cache.flush()
+
+    return [list(row) for row in rows]
+
+def verify_qr_preview(preview_path: str, payload: str, verdict_key: tuple, encoding: str = "png",
+                      matrix: list = None, object_type: str = None, tile_size: int = 64) -> bool | None:
+    """
+    Decode the rendered preview with pyzbar and check it scans back to `payload`.
+    `verdict_key` identifies what was rendered (payload, ecc, object type, tile size...)
+    so repeat builds reuse the verdict; the encoding is part of the key. When the preview
+    isn't in SCANNABLE_ENCODINGS, `matrix`/`object_type`/`tile_size` are re-rendered as PNG
+    and that is scanned. Returns None when zbar isn't available.
+    """
+    key = "verdict:" + _key(*verdict_key, encoding)
+    verdict = qr_cache.get(key)
+    if verdict is not None:
+        return verdict
+
+    try:
+        from pyzbar.pyzbar import decode
+    except ImportError as e:  # pyzbar installed without the zbar shared library
+        print(f"[qr] ⚠️ Scan verification unavailable: {e}")
+        return None
+
+    from PIL import Image
+
+    if encoding not in SCANNABLE_ENCODINGS and matrix is not None:
+        from logic.render_sign_preview import compose_preview, save_preview
+
+        preview_path = io.BytesIO()
+        save_preview(compose_preview(matrix, object_type, tile_size), preview_path, "png")
+        preview_path.seek(0)
+
+    with Image.open(preview_path) as preview:
+        # Icons sit on a transparent canvas; scanners need dark modules on a light background
+        canvas = Image.new("RGBA", preview.size, (255, 255, 255, 255))
+        canvas.alpha_composite(preview.convert("RGBA"))
+        gray = canvas.convert("L")
+
+    decoded = [result.data.decode("utf-8", errors="replace") for result in decode(gray)]
+    verdict = payload in decoded
+
+    qr_cache.put(key, verdict)
+    qr_cache.flush()
+    return verdict
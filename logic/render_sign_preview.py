@@ -1,29 +1,209 @@
 # logic/render_sign_preview.py
 
-from PIL import Image
+import io
 import os
+import struct
+import sys
+import time
+import zlib
 
 ASSETS_DIR = "assets/thumbnails"
 
-def render_sign_preview(matrix, output_path, object_type="WoodenCrate", tile_size=64):
+# Preview encodings: name → (file extension, description)
+PREVIEW_ENCODINGS = {
+    "png": (".png", "RGBA PNG, zlib level 6"),
+    "png_fast": (".png", "RGBA PNG, zlib level 1 (fastest encode)"),
+    "palette": (".png", "8-bit palette PNG (icons only have a few colours)"),
+    "webp": (".webp", "Lossy WebP with alpha, quality 85"),
+    "jpeg": (".jpg", "JPEG on a dark background, quality 85")
+}
+DEFAULT_ENCODING = "png"
+TRANSPARENT_INDEX = 255          # palette slot reserved for the empty cells
+JPEG_BACKGROUND = (49, 51, 56)   # Discord dark theme, so JPEG previews look like the PNG ones
+STREAM_THRESHOLD_PIXELS = 32_000_000  # above this (~128 MB as RGBA) previews are rendered strip by strip
+
+def preview_path_for(output_path: str, encoding: str = DEFAULT_ENCODING) -> str:
+    """Swap the preview path's extension for the one `encoding` writes."""
+    return os.path.splitext(output_path)[0] + PREVIEW_ENCODINGS[encoding][0]
+
+def _load_icon(object_type: str, tile_size: int):
+    from PIL import Image
+
     icon_path = os.path.join(ASSETS_DIR, f"{object_type}.PNG")
     if not os.path.exists(icon_path):
         raise FileNotFoundError(f"Icon not found for object: {object_type}")
 
-    icon_img = Image.open(icon_path).convert("RGBA")
-    icon_img = icon_img.resize((tile_size, tile_size))
+    with Image.open(icon_path) as icon:
+        return icon.convert("RGBA").resize((tile_size, tile_size))
+
+def _palette_icon(icon):
+    """Quantize the icon once; returns (P-mode tile, 1-bit paste mask, 768-entry palette)."""
+    from PIL import Image
 
+    rgb = Image.new("RGB", icon.size, (0, 0, 0))
+    rgb.paste(icon, mask=icon)
+    tile = rgb.quantize(colors=TRANSPARENT_INDEX, method=Image.Quantize.MEDIANCUT)
+    palette = tile.getpalette()[:TRANSPARENT_INDEX * 3]
+    palette += [0] * (256 * 3 - len(palette))
+    mask = icon.getchannel("A").point(lambda a: 255 if a >= 128 else 0, "1")
+    return tile, mask, palette
+
+def _layout(matrix: list, mirror_kit: bool) -> list:
     # ✅ Flip vertically and horizontally to match in-game layout
     matrix = matrix[::-1]
     matrix = [row[::-1] for row in matrix]
 
-    width = len(matrix[0]) * tile_size
+    if mirror_kit:
+        # Back face as seen from behind: same rows, columns reversed
+        width_cells = max(len(row) for row in matrix)
+        padded = [list(row) + [" "] * (width_cells - len(row)) for row in matrix]
+        matrix = padded + [[" "] * width_cells] + [row[::-1] for row in padded]
+    return matrix
+
+def compose_preview(matrix, object_type="WoodenCrate", tile_size=64, mirror_kit=False, palette=False):
+    """Paste one icon per '#' cell. With `palette`, the canvas is 8-bit with index 255 transparent."""
+    # Pillow is imported on first render so loading the cogs stays cheap
+    from PIL import Image
+
+    icon_img = _load_icon(object_type, tile_size)
+    matrix = _layout(matrix, mirror_kit)
+
+    width = max(len(row) for row in matrix) * tile_size
     height = len(matrix) * tile_size
-    canvas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+
+    if palette:
+        tile, mask, colours = _palette_icon(icon_img)
+        canvas = Image.new("P", (width, height), TRANSPARENT_INDEX)
+        canvas.putpalette(colours)
+    else:
+        tile, mask = icon_img, icon_img
+        canvas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
 
     for y, row in enumerate(matrix):
         for x, cell in enumerate(row):
             if cell == "#":
-                canvas.paste(icon_img, (x * tile_size, y * tile_size), icon_img)
+                canvas.paste(tile, (x * tile_size, y * tile_size), mask)
+
+    return canvas
+
+def save_preview(canvas, fp, encoding: str = DEFAULT_ENCODING) -> None:
+    """Encode a composed canvas to a path or file object."""
+    from PIL import Image
+
+    if encoding == "palette":
+        canvas.save(fp, format="PNG", transparency=TRANSPARENT_INDEX, compress_level=6)
+    elif encoding == "png_fast":
+        canvas.save(fp, format="PNG", compress_level=1)
+    elif encoding == "webp":
+        canvas.save(fp, format="WEBP", quality=85, method=4)
+    elif encoding == "jpeg":
+        background = Image.new("RGB", canvas.size, JPEG_BACKGROUND)
+        background.paste(canvas, mask=canvas)
+        background.save(fp, format="JPEG", quality=85, optimize=True)
+    else:
+        canvas.save(fp, format="PNG", compress_level=6)
+
+def _png_chunk(f, tag: bytes, data: bytes) -> None:
+    f.write(struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+def stream_preview(matrix, output_path, object_type="WoodenCrate", tile_size=64, mirror_kit=False, palette=False, compress_level=6):
+    """
+    Write the preview PNG one tile row at a time: each strip is composed, filtered and fed
+    to a single zlib stream as IDAT chunks, so memory is bounded by one strip however wide
+    or tall the sign is. Produces the same image as compose_preview + save_preview.
+    """
+    import numpy as np
+    from PIL import Image
+
+    icon_img = _load_icon(object_type, tile_size)
+    matrix = _layout(matrix, mirror_kit)
+    width = max(len(row) for row in matrix) * tile_size
+    height = len(matrix) * tile_size
+
+    if palette:
+        tile, mask, colours = _palette_icon(icon_img)
+        mode, background, color_type, channels = "P", TRANSPARENT_INDEX, 3, 1
+    else:
+        tile, mask = icon_img, icon_img
+        mode, background, color_type, channels = "RGBA", (0, 0, 0, 0), 6, 4
+
+    compressor = zlib.compressobj(compress_level)
+    with open(output_path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        _png_chunk(f, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0))
+        if palette:
+            _png_chunk(f, b"PLTE", bytes(colours))
+            _png_chunk(f, b"tRNS", b"\xff" * TRANSPARENT_INDEX + b"\x00")
+
+        scanlines = np.zeros((tile_size, width * channels + 1), dtype=np.uint8)  # column 0 = filter type 0
+        for row in matrix:
+            strip = Image.new(mode, (width, tile_size), background)
+            if palette:
+                strip.putpalette(colours)
+            for x, cell in enumerate(row):
+                if cell == "#":
+                    strip.paste(tile, (x * tile_size, 0), mask)
+
+            scanlines[:, 1:] = np.frombuffer(strip.tobytes(), dtype=np.uint8).reshape(tile_size, -1)
+            data = compressor.compress(scanlines.tobytes())
+            if data:
+                _png_chunk(f, b"IDAT", data)
+
+        _png_chunk(f, b"IDAT", compressor.flush())
+        _png_chunk(f, b"IEND", b"")
+
+def render_sign_preview(matrix, output_path, object_type="WoodenCrate", tile_size=64, mirror_kit=False, encoding=DEFAULT_ENCODING):
+    """
+    Render the sign as icon tiles. With `mirror_kit`, the back face is drawn below the front, one tile row apart.
+    The file extension follows `encoding`; returns the path actually written.
+    """
+    if encoding not in PREVIEW_ENCODINGS:
+        encoding = DEFAULT_ENCODING
+
+    rows = len(matrix) * (2 if mirror_kit else 1) + (1 if mirror_kit else 0)
+    pixels = max((len(row) for row in matrix), default=0) * rows * tile_size ** 2
+    start = time.perf_counter()
+
+    if pixels > STREAM_THRESHOLD_PIXELS:
+        # Too big to hold as one canvas; only PNG can be streamed, so WebP/JPEG fall back to it
+        encoding = "palette" if encoding == "palette" else "png"
+        output_path = preview_path_for(output_path, encoding)
+        stream_preview(matrix, output_path, object_type, tile_size, mirror_kit, palette=encoding == "palette")
+        encoding += ", streamed"
+    else:
+        output_path = preview_path_for(output_path, encoding)
+        canvas = compose_preview(matrix, object_type, tile_size, mirror_kit, palette=encoding == "palette")
+        save_preview(canvas, output_path, encoding)
+
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"🖼️ Preview encoded as {encoding}: {os.path.getsize(output_path) / 1024:.0f} KB in {elapsed:.0f} ms")
+    return output_path
+
+def benchmark_encodings(matrix, object_type="WoodenCrate", tile_size=64, mirror_kit=False) -> list:
+    """Compose and encode the same sign with every strategy; returns [{encoding, compose_ms, encode_ms, bytes}]."""
+    results = []
+    for encoding in PREVIEW_ENCODINGS:
+        start = time.perf_counter()
+        canvas = compose_preview(matrix, object_type, tile_size, mirror_kit, palette=encoding == "palette")
+        composed = time.perf_counter()
+        buffer = io.BytesIO()
+        save_preview(canvas, buffer, encoding)
+        done = time.perf_counter()
+        results.append({
+            "encoding": encoding,
+            "compose_ms": (composed - start) * 1000,
+            "encode_ms": (done - composed) * 1000,
+            "bytes": buffer.tell()
+        })
+    return results
+
+if __name__ == "__main__":
+    # python -m logic.render_sign_preview "SIGN TEXT" [object_type] [tile_size]
+    from logic.text_matrix import generate_letter_matrix
+
+    text = sys.argv[1] if len(sys.argv) > 1 else "SIGN4ME"
+    object_type = sys.argv[2] if len(sys.argv) > 2 else "WoodenCrate"
+    tile_size = int(sys.argv[3]) if len(sys.argv) > 3 else 64
 
-    canvas.save(output_path)
+    for row in benchmark_encodings(generate_letter_matrix(text), object_type, tile_size):
+        print(f"{row['encoding']:>9}: {row['bytes'] / 1024:8.1f} KB  compose {row['compose_ms']:6.1f} ms  encode {row['encode_ms']:6.1f} ms")
@@ -0,0 +1,91 @@
+# logic/sign_objects.py — Compact, array-backed container for generated sign objects
+
+import numpy as np
+
+class SignObjects:
+    """
+    A sign's objects stored as typed arrays instead of one dict per object.
+
+    `pos` is an (n, 3) float64 array in export order [x, z, y]. `ypr` and `scale` are
+    shared by every object (shapes (3,) and ()) unless per-object values are needed,
+    in which case they are (n, 3) and (n,). Export dicts are only built on demand.
+    """
+
+    __slots__ = ("name", "pos", "ypr", "scale")
+
+    def __init__(self, name: str, pos, ypr=(0.0, 0.0, 0.0), scale=1.0):
+        self.name = name
+        self.pos = np.asarray(pos, dtype=np.float64).reshape(-1, 3)
+        self.ypr = np.asarray(ypr, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.pos)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._object_dict(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            if not -len(self) <= index < len(self):
+                raise IndexError("SignObjects index out of range")
+            return self._object_dict(int(index) % len(self))
+        return SignObjects(
+            self.name,
+            self.pos[index],
+            self.ypr[index] if self.ypr.ndim == 2 else self.ypr,
+            self.scale[index] if self.scale.ndim == 1 else self.scale
+        )
+
+    def __repr__(self) -> str:
+        return f"<SignObjects {self.name} x{len(self)}>"
+
+    def _object_dict(self, i: int) -> dict:
+        ypr = self.ypr[i] if self.ypr.ndim == 2 else self.ypr
+        scale = self.scale[i] if self.scale.ndim == 1 else self.scale
+        return {
+            "name": self.name,
+            "pos": [round(float(v), 6) for v in self.pos[i]],
+            "ypr": [float(v) for v in ypr],
+            "scale": float(scale),
+            "enableCEPersistency": 0,
+            "customString": ""
+        }
+
+    def to_dicts(self) -> list:
+        return list(self)
+
+    def ypr_array(self) -> np.ndarray:
+        """Per-object (n, 3) view of ypr, whether shared or not."""
+        return np.broadcast_to(self.ypr, (len(self), 3))
+
+    def scale_array(self) -> np.ndarray:
+        """Per-object (n,) view of scale, whether shared or not."""
+        return np.broadcast_to(self.scale, (len(self),))
+
+    def translate(self, dx: float = 0.0, dz: float = 0.0, dy: float = 0.0) -> "SignObjects":
+        """Shift every object at once (offsets in export order x, z, y)."""
+        return SignObjects(self.name, self.pos + (dx, dz, dy), self.ypr, self.scale)
+
+    def bounds(self) -> tuple:
+        """(min, max) corners of the object positions, each [x, z, y]."""
+        if not len(self):
+            return [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+        return self.pos.min(axis=0).tolist(), self.pos.max(axis=0).tolist()
+
+    @classmethod
+    def concat(cls, parts: list) -> "SignObjects":
+        """Join several SignObjects of the same object class, keeping shared ypr/scale when they agree."""
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            raise ValueError("Nothing to concatenate.")
+        if len({p.name for p in parts}) > 1:
+            raise ValueError("Cannot mix object classes in one SignObjects.")
+
+        pos = np.concatenate([p.pos for p in parts])
+        shared_ypr = all(p.ypr.ndim == 1 and np.array_equal(p.ypr, parts[0].ypr) for p in parts)
+        shared_scale = all(p.scale.ndim == 0 and p.scale == parts[0].scale for p in parts)
+        ypr = parts[0].ypr if shared_ypr else np.concatenate([p.ypr_array() for p in parts])
+        scale = parts[0].scale if shared_scale else np.concatenate([p.scale_array() for p in parts])
+        return cls(parts[0].name, pos, ypr, scale)
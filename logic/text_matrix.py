@@ -2,7 +2,10 @@
 
 from .font_map import FONT_MAP
 
-def generate_letter_matrix(text):
+def generate_letter_matrix(text, font_path=None, cell_height=None):
+    if font_path:
+        return _generate_font_matrix(text, font_path, cell_height or 12)
+
     text = text.upper()
     lines = [[] for _ in range(5)]
 
@@ -17,3 +20,28 @@ def generate_letter_matrix(text):
     # Combine characters into final matrix rows
     final_matrix = ["".join(line).rstrip() for line in lines]
     return [list(row) for row in final_matrix]  # Return as 2D list (row-major)
+
+def _generate_font_matrix(text, font_path, cell_height):
+    """Same layout as the block font, but any character, rasterized from a TTF/OTF at `cell_height` rows."""
+    from .glyph_provider import atlas, get_glyph
+
+    lines = [[] for _ in range(cell_height)]
+
+    for char in text:
+        glyph = get_glyph(font_path, cell_height, char)
+        for i in range(cell_height):
+            lines[i].append(glyph[i])
+            lines[i].append(" ")  # 1-space gap between letters
+
+    atlas.flush()
+
+    final_matrix = ["".join(line).rstrip() for line in lines]
+
+    # Drop blank ascender/descender rows so the sign is centred on its ink
+    if any(final_matrix):
+        while not final_matrix[0]:
+            final_matrix.pop(0)
+        while not final_matrix[-1]:
+            final_matrix.pop()
+
+    return [list(row) for row in final_matrix]
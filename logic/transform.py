@@ -0,0 +1,68 @@
+# logic/transform.py — Rotate a whole sign about a pivot: positions and per-object ypr in one pass
+#
+# Frame is the export position order: axis 0 = world X (east), axis 1 = up, axis 2 = world Z (north).
+# Yaw turns about the up axis, clockwise seen from above like a compass heading, so it adds
+# straight onto object yaw. Tilt turns about the X axis, i.e. the sign's horizontal edge.
+# Object orientation follows DayZ's yaw → pitch → roll order: R = Ry(yaw) · Rx(pitch) · Rz(roll).
+
+import numpy as np
+
+from logic.sign_objects import SignObjects
+
+def _ry(a):
+    c, s = np.cos(a), np.sin(a)
+    o, z = np.ones_like(a), np.zeros_like(a)
+    return np.stack([np.stack([c, z, s], -1), np.stack([z, o, z], -1), np.stack([-s, z, c], -1)], -2)
+
+def _rx(a):
+    c, s = np.cos(a), np.sin(a)
+    o, z = np.ones_like(a), np.zeros_like(a)
+    return np.stack([np.stack([o, z, z], -1), np.stack([z, c, -s], -1), np.stack([z, s, c], -1)], -2)
+
+def _rz(a):
+    c, s = np.cos(a), np.sin(a)
+    o, z = np.ones_like(a), np.zeros_like(a)
+    return np.stack([np.stack([c, -s, z], -1), np.stack([s, c, z], -1), np.stack([z, z, o], -1)], -2)
+
+def ypr_to_matrices(ypr: np.ndarray) -> np.ndarray:
+    """(n, 3) degrees → (n, 3, 3) rotation matrices."""
+    yaw, pitch, roll = np.radians(np.asarray(ypr, dtype=np.float64)).T
+    return _ry(yaw) @ _rx(pitch) @ _rz(roll)
+
+def matrices_to_ypr(m: np.ndarray) -> np.ndarray:
+    """(n, 3, 3) rotation matrices → (n, 3) degrees, yaw/roll in [-180, 180)."""
+    pitch = np.arcsin(np.clip(-m[:, 1, 2], -1.0, 1.0))
+    gimbal = np.abs(np.cos(pitch)) < 1e-9
+    # Pitched straight up/down, yaw and roll turn about the same axis; fold it all into yaw
+    yaw = np.where(gimbal, np.arctan2(-m[:, 2, 0], m[:, 0, 0]), np.arctan2(m[:, 0, 2], m[:, 2, 2]))
+    roll = np.where(gimbal, 0.0, np.arctan2(m[:, 1, 0], m[:, 1, 1]))
+    ypr = np.degrees(np.stack([yaw, pitch, roll], axis=1))
+    ypr[:, [0, 2]] = (ypr[:, [0, 2]] + 180.0) % 360.0 - 180.0
+    return ypr + 0.0  # no -0.0 in exports
+
+def sign_rotation(yaw: float = 0.0, tilt: float = 0.0) -> np.ndarray:
+    """3×3 matrix that tilts the sign about its horizontal edge, then turns it to `yaw` degrees."""
+    return _ry(np.radians(yaw)) @ _rx(np.radians(tilt))
+
+def rotate_objects(objects: SignObjects, yaw: float = 0.0, tilt: float = 0.0, pivot=(0.0, 0.0, 0.0)) -> SignObjects:
+    """
+    Rotate every position about `pivot` (export order) with one matrix product and compose
+    the same rotation onto each object's ypr. A pure yaw keeps a shared ypr shared.
+    """
+    if not yaw and not tilt:
+        return objects
+
+    rotation = sign_rotation(yaw, tilt)
+    pivot = np.asarray(pivot, dtype=np.float64)
+    pos = (objects.pos - pivot) @ rotation.T + pivot
+
+    ypr = objects.ypr
+    if ypr.ndim == 1 and not tilt and not ypr[1] and not ypr[2]:
+        # Upright/flat signs only carry yaw, so the rotations just add
+        ypr = np.array([(ypr[0] + yaw + 180.0) % 360.0 - 180.0, 0.0, 0.0])
+    else:
+        shared = ypr.ndim == 1
+        ypr = matrices_to_ypr(rotation @ ypr_to_matrices(ypr[None] if shared else ypr))
+        ypr = ypr[0] if shared else ypr
+
+    return SignObjects(objects.name, pos, ypr, objects.scale)
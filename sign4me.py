@@ -0,0 +1,243 @@
+# sign4me.py — Offline batch generator: build many signs from a CSV/JSONL spec file without Discord
+#
+# Usage:  python sign4me.py event_signs.csv --out batch --workers 4
+# Each row/line is one sign: text plus any of the SPEC_FIELDS below (blank = the default).
+# Output lands in <out>/<slug>-<hash>/ (Sign4ME.json, sign_preview.*, spec.json), with
+# <out>/index.json listing every sign in input order. A spec whose content hash already
+# has a finished folder is skipped, so re-running after edits only rebuilds what changed.
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from logic.render_sign_preview import PREVIEW_ENCODINGS
+from sign_generator import OBJECT_CLASS_MAP
+from utils.config_utils import DEFAULTS
+
+BATCH_VERSION = 1   # bump when the output for an unchanged spec would change
+SPEC_FIELDS = {
+    # field: (type, default)
+    "text": (str, None),
+    "name": (str, None),
+    "object_type": (str, "WoodenCrate"),
+    "scale": (float, DEFAULTS["defaultScale"]),
+    "spacing": (float, DEFAULTS["defaultSpacing"]),
+    "orientation": (str, "upright"),
+    "mirror_kit": (bool, DEFAULTS["include_mirror_kit"]),
+    "optimize": (bool, DEFAULTS["optimize_objects"]),
+    "max_merge": (int, DEFAULTS["optimize_max_merge"]),
+    "size_factor": (int, DEFAULTS["size_factor"]),
+    "outline": (bool, DEFAULTS["outline_mode"]),
+    "font_path": (str, DEFAULTS["font_path"]),
+    "font_cell_height": (int, DEFAULTS["font_cell_height"]),
+    "preview_encoding": (str, DEFAULTS["preview_encoding"]),
+    "selected_map": (str, DEFAULTS["selected_map"]),
+    "origin_x": (float, DEFAULTS["origin_position"]["x"]),
+    "origin_y": (float, DEFAULTS["origin_position"]["y"]),
+    "origin_z": (float, DEFAULTS["origin_position"]["z"]),
+    "yaw": (float, DEFAULTS["sign_yaw"]),
+    "tilt": (float, DEFAULTS["sign_tilt"])
+}
+# Fields that only take one of a fixed set of values
+SPEC_CHOICES = {
+    "object_type": tuple(OBJECT_CLASS_MAP),
+    "orientation": ("upright", "flat"),
+    "preview_encoding": tuple(PREVIEW_ENCODINGS)
+}
+DONE_MARKER = "spec.json"   # written last, so a folder without it is an interrupted build
+
+def _coerce(value, kind):
+    """Convert one field; anything that would need rounding or guessing raises ValueError."""
+    if isinstance(value, str):
+        value = value.strip()
+        if value == "":
+            return None
+        if kind is bool:
+            if value.lower() in ("1", "true", "yes", "y", "on"):
+                return True
+            if value.lower() in ("0", "false", "no", "n", "off"):
+                return False
+            raise ValueError(value)
+        return kind(value)
+
+    # JSONL values arrive typed: no truncating 2.5 to 2, and no numbers standing in for booleans
+    if not isinstance(value, (bool, int, float)) or (kind is bool) != isinstance(value, bool):
+        raise ValueError(value)
+    if kind is int and isinstance(value, float) and not value.is_integer():
+        raise ValueError(value)
+    return kind(value)
+
+def normalize_spec(raw: dict, line: int) -> dict:
+    """Fill defaults and coerce types; unknown columns are an error so typos don't pass silently."""
+    unknown = set(raw) - set(SPEC_FIELDS)
+    if unknown:
+        raise ValueError(f"line {line}: unknown field(s) {', '.join(sorted(unknown))}")
+
+    spec = {}
+    for field, (kind, default) in SPEC_FIELDS.items():
+        value = raw.get(field)
+        try:
+            value = _coerce(value, kind) if value is not None else None
+        except ValueError:
+            raise ValueError(f"line {line}: {field} must be {kind.__name__}, got {raw.get(field)!r}")
+        spec[field] = default if value is None else value
+
+    if not spec["text"]:
+        raise ValueError(f"line {line}: text is required")
+    for field, choices in SPEC_CHOICES.items():
+        if spec[field] not in choices:
+            raise ValueError(f"line {line}: {field} must be one of {', '.join(choices)}, got {spec[field]!r}")
+    return spec
+
+def read_specs(path: str) -> list:
+    """Read a .csv (header row) or .jsonl (one object per line) spec file."""
+    specs = []
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            # Header is line 1, so data rows start at 2
+            rows = ((i, row) for i, row in enumerate(csv.DictReader(f), 2))
+        else:
+            rows = ((i, json.loads(line)) for i, line in enumerate(f, 1) if line.strip())
+        for line, raw in rows:
+            specs.append(normalize_spec({k: v for k, v in raw.items() if k}, line))
+    return specs
+
+def spec_hash(spec: dict) -> str:
+    """Content hash of everything that affects the output, including the font file's bytes."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"version": BATCH_VERSION, **spec}, sort_keys=True).encode())
+    if spec["font_path"] and os.path.exists(spec["font_path"]):
+        with open(spec["font_path"], "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def output_dir(out_root: str, spec: dict, digest: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", spec["name"] or spec["text"]).strip("-").lower()[:40] or "sign"
+    return os.path.join(out_root, f"{slug}-{digest[:12]}")
+
+def build_one(spec: dict, folder: str) -> dict:
+    """Worker: text → matrix → objects → export + preview. Runs in a child process."""
+    from logic.text_matrix import generate_letter_matrix
+    from logic.matrix_ops import resize_matrix
+    from logic.build_pipeline import build_sign
+
+    start = time.perf_counter()
+    letter_matrix = generate_letter_matrix(spec["text"], font_path=spec["font_path"], cell_height=spec["font_cell_height"])
+    matrix = [row[::-1] for row in letter_matrix[::-1]]
+    if not any("#" in row for row in matrix):
+        raise ValueError("no drawable characters in text")
+    matrix = resize_matrix(matrix, spec["size_factor"], spec["outline"])
+
+    result = build_sign(
+        matrix,
+        spec["object_type"],
+        {"export_mode": "json", "preview_encoding": spec["preview_encoding"], "selected_map": spec["selected_map"],
+         "sign_yaw": spec["yaw"], "sign_tilt": spec["tilt"]},
+        origin={"x": spec["origin_x"], "y": spec["origin_y"], "z": spec["origin_z"]},
+        offset={"x": 0.0, "y": 0.0, "z": 0.0},
+        scale=spec["scale"],
+        spacing=spec["spacing"],
+        output_json_path=os.path.join(folder, "Sign4ME.json"),
+        preview_path=os.path.join(folder, "sign_preview.png"),
+        ypr_mode=spec["orientation"],
+        mirror_kit=spec["mirror_kit"],
+        optimize=spec["optimize"],
+        max_merge=spec["max_merge"]
+    )
+    return {
+        "objects": len(result["objects"]),
+        "size": list(result["size"]),
+        "warnings": result["validation"]["warnings"],
+        "preview": os.path.basename(result["preview_path"]),
+        "seconds": round(time.perf_counter() - start, 3)
+    }
+
+def mark_done(folder: str, spec: dict, digest: str, stats: dict) -> None:
+    """Record a finished build; its presence is what makes later runs skip the spec."""
+    with open(os.path.join(folder, DONE_MARKER), "w") as f:
+        json.dump({"hash": digest, "spec": spec, "result": stats}, f, indent=2, sort_keys=True)
+
+def load_done(folder: str, digest: str):
+    """Stats of a finished build of exactly this spec, or None."""
+    try:
+        with open(os.path.join(folder, DONE_MARKER)) as f:
+            done = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return done["result"] if done.get("hash") == digest else None
+
+def run_batch(specs: list, out_root: str, workers: int = None, force: bool = False) -> list:
+    """Build every spec not already built; returns index entries in input order."""
+    os.makedirs(out_root, exist_ok=True)
+    entries = []
+    todo = []
+    for i, spec in enumerate(specs):
+        digest = spec_hash(spec)
+        folder = output_dir(out_root, spec, digest)
+        entry = {"index": i, "text": spec["text"], "name": spec["name"], "hash": digest, "folder": os.path.basename(folder)}
+        entries.append(entry)
+
+        done = None if force else load_done(folder, digest)
+        if done is not None:
+            entry.update(status="skipped", **done)
+        elif any(e["folder"] == entry["folder"] for e in entries[:-1]):
+            entry.update(status="duplicate")  # identical spec earlier in the file
+        else:
+            todo.append((entry, spec, folder))
+
+    skipped = len(specs) - len(todo)
+    print(f"[sign4me] 📋 {len(specs)} specs: {len(todo)} to build, {skipped} already built or duplicated")
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+            futures = {}
+            for entry, spec, folder in todo:
+                os.makedirs(folder, exist_ok=True)
+                futures[pool.submit(build_one, spec, folder)] = (entry, spec, folder)
+
+            for finished, future in enumerate(as_completed(futures), 1):
+                entry, spec, folder = futures[future]
+                label = entry["name"] or entry["text"]
+                try:
+                    stats = future.result()
+                except Exception as e:
+                    entry.update(status="failed", error=str(e))
+                    print(f"[sign4me] ❌ {finished}/{len(todo)} {label}: {e}")
+                    continue
+                mark_done(folder, spec, entry["hash"], stats)
+                entry.update(status="built", **stats)
+                print(f"[sign4me] ✅ {finished}/{len(todo)} {label} — {stats['objects']} objects in {stats['seconds']}s")
+
+    with open(os.path.join(out_root, "index.json"), "w") as f:
+        json.dump(entries, f, indent=2)
+    return entries
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate Sign4Me exports and previews from a CSV/JSONL spec file")
+    parser.add_argument("specs", help="CSV with a header row, or JSONL with one spec object per line")
+    parser.add_argument("--out", default="outputs/batch", help="output folder (default outputs/batch)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="rebuild specs that were already built")
+    args = parser.parse_args()
+
+    try:
+        specs = read_specs(args.specs)
+    except (OSError, ValueError) as e:
+        print(f"[sign4me] ❌ {e}")
+        sys.exit(2)
+
+    start = time.perf_counter()
+    entries = run_batch(specs, args.out, args.workers, args.force)
+    failed = sum(1 for e in entries if e["status"] == "failed")
+    print(f"[sign4me] 🏁 Done in {time.perf_counter() - start:.1f}s — index at {os.path.join(args.out, 'index.json')}"
+          + (f", {failed} failed" if failed else ""))
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 import os
 import json
+import textwrap
+
+from logic.object_optimizer import DEFAULT_MAX_MERGE
 
 OBJECT_CLASS_MAP = {
     "ImprovisedContainer": "Land_Container_1Mo",
@@ -22,57 +25,94 @@ OBJECT_SIZE_ADJUSTMENTS = {
     "BoxWooden": 1.0
 }
 
+# Display names for the settings panel and command replies
+OBJECT_NAME_TO_LABEL = {
+    "Armband_Black": "Armband (Black)",
+    "JerryCan": "Jerry Can",
+    "BoxWooden": "Wooden Box",
+    "SmallProtectiveCase": "Protective Case (Small)",
+    "WoodenCrate": "Wooden Crate",
+    "ImprovisedContainer": "Improvised Container",
+    "DryBag_Black": "Dry Bag (Black)"
+}
+
 MAX_OBJECTS = 1200
 DEFAULT_YPR = [-178.0899200439453, 0.0, 0.0]
 
-def pad_matrix(matrix: list) -> list:
-    max_len = max(len(row) for row in matrix)
-    return [row + [' '] * (max_len - len(row)) for row in matrix]
+def _flip_yaw(ypr: list) -> list:
+    yaw = (ypr[0] + 180.0 + 180.0) % 360.0 - 180.0
+    return [yaw, ypr[1], ypr[2]]
+
+def letter_to_object_list(matrix: list, object_type: str, origin: dict, offset: dict, scale: float = 1.0, spacing: float = None, ypr_mode: str = "upright", mirror_kit: bool = False, mirror_depth: float = None, optimize: bool = False, max_merge: int = DEFAULT_MAX_MERGE, yaw: float = 0.0, tilt: float = 0.0) -> "SignObjects":
+    """
+    Lay out one object per '#' cell. With `mirror_kit` (upright signs only) a mirrored
+    back face — reversed columns, yaw turned 180°, pushed `mirror_depth` behind the
+    front (default: one spacing) — is generated in the same pass so the sign reads
+    correctly from both sides. With `optimize`, filled k×k blocks (k ≤ `max_merge`)
+    become one object scaled k×, centred on the block. `yaw` turns the finished sign
+    about its origin (compass degrees) and `tilt` leans it about its horizontal edge.
+    """
+    # numpy and the layout helpers load on first build so importing this module stays cheap
+    import numpy as np
+
+    from logic.matrix_ops import matrix_to_mask
+    from logic.object_optimizer import merge_cells
+    from logic.sign_objects import SignObjects
+    from logic.transform import rotate_objects
 
-def letter_to_object_list(matrix: list, object_type: str, origin: dict, offset: dict, scale: float = 1.0, spacing: float = None, ypr_mode: str = "upright") -> list:
     if object_type not in OBJECT_CLASS_MAP:
         raise ValueError(f"❌ Unrecognized object type: '{object_type}'.")
 
     resolved_type = OBJECT_CLASS_MAP[object_type]
     spacing = spacing if spacing is not None else scale * OBJECT_SIZE_ADJUSTMENTS.get(object_type, 1.0)
 
-    matrix = pad_matrix(matrix)  # ✅ Make all rows the same length
+    mask = matrix_to_mask(matrix)  # ✅ Pads all rows to the same length
+    rows, row_len = mask.shape
 
-    rows = len(matrix)
     origin_x = origin.get("x", 0.0)
     origin_y = origin.get("y", 0.0)
     origin_z = origin.get("z", 0.0)
 
     base_y = origin_y + offset.get("y", 0.0)
-
-    objects = []
-
-    for row in range(rows):
-        current_row = matrix[row]
-        row_len = len(current_row)
-
-        offset_x = round(origin_x - ((row_len / 2) * spacing) + offset.get("x", 0.0), 6)
-        pos_z = round(origin_z - ((rows / 2) * spacing) + (row * spacing) + offset.get("z", 0.0), 6)
-
-        for col in range(row_len):
-            if current_row[col] != "#":
-                continue
-
-            pos_x = round(offset_x + (col * spacing), 6)
-            obj_pos = [pos_x, pos_z, round(base_y, 6)]  # XZY order
-
-            ypr = DEFAULT_YPR if ypr_mode == "upright" else [0.0, 0.0, 0.0]
-
-            obj = {
-                "name": resolved_type,
-                "pos": obj_pos,
-                "ypr": ypr,
-                "scale": scale,
-                "enableCEPersistency": 0,
-                "customString": ""
-            }
-
-            objects.append(obj)
+    offset_x = round(origin_x - ((row_len / 2) * spacing) + offset.get("x", 0.0), 6)
+    start_z = origin_z - ((rows / 2) * spacing)
+
+    # All filled cells at once, in row-major order
+    if optimize:
+        row_idx, col_idx, sizes = merge_cells(mask, max_merge)
+    else:
+        row_idx, col_idx = np.nonzero(mask)
+        sizes = None
+    ypr = DEFAULT_YPR if ypr_mode == "upright" else [0.0, 0.0, 0.0]
+
+    mirrored = mirror_kit and ypr_mode == "upright"
+    if mirrored:
+        # Back face: same rows, columns reversed, one layer behind the front
+        depth = mirror_depth if mirror_depth is not None else spacing
+        row_idx = np.concatenate([row_idx, row_idx])
+        col_idx = np.concatenate([col_idx, row_len - 1 - col_idx])
+        depth_idx = np.repeat([0.0, depth], len(row_idx) // 2)
+        sizes = np.concatenate([sizes, sizes]) if sizes is not None else None
+    else:
+        depth_idx = 0.0
+
+    def rounded(index, position):
+        # Same arithmetic and round(…, 6) as one object at a time, done once per distinct row/column
+        values, inverse = np.unique(np.asarray(index, dtype=np.float64), return_inverse=True)
+        return np.array([round(position(float(v)), 6) for v in values], dtype=np.float64)[inverse]
+
+    pos = np.empty((len(row_idx), 3), dtype=np.float64)
+    pos[:, 0] = rounded(col_idx, lambda c: offset_x + (c * spacing))
+    pos[:, 1] = rounded(row_idx, lambda r: start_z + (r * spacing) + offset.get("z", 0.0))
+    pos[:, 2] = rounded(np.broadcast_to(depth_idx, len(row_idx)), lambda d: base_y + d)  # XZY order
+
+    if mirrored:
+        ypr = np.repeat([ypr, _flip_yaw(ypr)], len(pos) // 2, axis=0)
+    if sizes is not None and (sizes != 1).any():
+        scale = scale * sizes
+    objects = SignObjects(resolved_type, pos, ypr, scale)
+    # Laid out facing along world Z; turn the whole sign about its origin point
+    objects = rotate_objects(objects, yaw, tilt, pivot=(origin_x + offset.get("x", 0.0), origin_z + offset.get("z", 0.0), base_y))
 
     if len(objects) > MAX_OBJECTS:
         print(f"⚠️ Object cap exceeded: {len(objects)} > {MAX_OBJECTS}")
@@ -81,10 +121,20 @@ def letter_to_object_list(matrix: list, object_type: str, origin: dict, offset:
     print(f"🧱 Final object count: {len(objects)} from {rows} rows × uniform cols")
     return objects
 
-def save_object_json(object_list: list, output_path: str):
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+def save_object_json(object_list, output_path: str):
+    """
+    Write {"Objects": [...]} in the same layout as json.dump(indent=2), building one
+    object dict at a time so a SignObjects never has to exist as a full list of dicts.
+    """
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
     with open(output_path, "w") as f:
-        json.dump({"Objects": object_list}, f, indent=2)
+        f.write('{\n  "Objects": [')
+        count = 0
+        for obj in object_list:
+            f.write(",\n" if count else "\n")
+            f.write(textwrap.indent(json.dumps(obj, indent=2), "    "))
+            count += 1
+        f.write("\n  ]\n}" if count else "]\n}")
 
 # ✅ Manual test
 if __name__ == "__main__":
@@ -1,13 +1,47 @@
-# logic/sign_packager.py — Returns path to .json export for Sign4Me output
+# logic/sign_packager.py — Bundles Sign4Me output into a deflate-compressed ZIP
 
+import io
 import os
+import zipfile
 
-def create_sign_zip(object_json_path: str, preview_image_path: str, zip_output_path: str, extra_text: str = "", export_mode: str = "json") -> str:
+DEFAULT_COMPRESS_LEVEL = 6  # 0 = store only, 1 = fastest deflate, 9 = smallest archive
+MANIFEST_NAME = "build_info.txt"
+
+def create_sign_zip(object_json_path: str, preview_image_path: str, zip_output_path: str, extra_text: str = "", export_mode: str = "json", compress_level: int = DEFAULT_COMPRESS_LEVEL):
     """
-    Skips zip creation and returns only the path to the object JSON file.
-    Used for sending raw object layout directly into Discord without zipping.
+    export_mode "json": skips zip creation and returns the path to the object JSON file,
+    for sending the raw object layout straight into Discord.
+
+    export_mode "zip": streams the object JSON, the preview image and a build manifest
+    (`extra_text`) into a deflate-compressed archive and returns its path. Files are read
+    in chunks straight from disk, so nothing is staged. Pass `zip_output_path=None` to
+    build the archive in memory and get an `io.BytesIO` back instead.
     """
-    os.makedirs(os.path.dirname(object_json_path), exist_ok=True)
+    if export_mode != "zip":
+        print(f"[sign_packager] 🔄 Export mode: '{export_mode}'. Returning JSON file only.")
+        return object_json_path
+
+    compress_level = max(0, min(9, int(compress_level)))
+    compression = zipfile.ZIP_DEFLATED if compress_level > 0 else zipfile.ZIP_STORED
+
+    if zip_output_path is None:
+        target = io.BytesIO()
+    else:
+        os.makedirs(os.path.dirname(zip_output_path) or ".", exist_ok=True)
+        target = zip_output_path
+
+    with zipfile.ZipFile(target, "w", compression=compression, compresslevel=compress_level or None) as zf:
+        zf.write(object_json_path, arcname=os.path.basename(object_json_path))
+        if preview_image_path and os.path.exists(preview_image_path):
+            # Images are already compressed; deflating them again only costs time
+            zf.write(preview_image_path, arcname=os.path.basename(preview_image_path), compress_type=zipfile.ZIP_STORED)
+        if extra_text:
+            zf.writestr(MANIFEST_NAME, extra_text)
+
+    if zip_output_path is None:
+        target.seek(0)
+        print(f"[sign_packager] 📦 Built in-memory ZIP ({target.getbuffer().nbytes} bytes, level {compress_level})")
+        return target
 
-    print(f"[sign_packager] 🔄 Export mode: '{export_mode}'. Returning JSON file only.")
-    return object_json_path
+    print(f"[sign_packager] 📦 Wrote {zip_output_path} ({os.path.getsize(zip_output_path)} bytes, level {compress_level})")
+    return zip_output_path
@@ -0,0 +1,168 @@
+# utils/build_scheduler.py — Central build queue: global + per-guild concurrency caps,
+# small builds first, round-robin between guilds, queue position reported back to the user
+
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from collections import defaultdict, deque
+
+MAX_CONCURRENT_BUILDS = int(os.environ.get("SIGN4ME_BUILD_WORKERS", "2"))
+MAX_BUILDS_PER_GUILD = int(os.environ.get("SIGN4ME_GUILD_BUILDS", "1"))
+SMALL_BUILD_OBJECTS = 300  # builds estimated at or under this many objects jump ahead of big ones
+SMALL_BUILD_AGING = float(os.environ.get("SIGN4ME_BUILD_AGING", "30"))  # seconds before a waiting big build stops being jumped
+
+class _Job:
+    def __init__(self, guild_id, estimate, seq, on_update):
+        self.guild_id = guild_id
+        self.estimate = estimate
+        self.seq = seq
+        self.queued_at = time.monotonic()
+        self.on_update = on_update
+        self.started = asyncio.Event()
+        self.cancelled = False
+        self.position = None     # last position handed to on_update
+        self._reported = None
+        self._notifier = None
+
+    def __lt__(self, other):
+        return (self.estimate, self.seq) < (other.estimate, other.seq)
+
+    def notify(self, position) -> None:
+        """Record the latest position; one task per job delivers updates in order, skipping stale ones."""
+        self.position = position
+        if self.on_update and (self._notifier is None or self._notifier.done()):
+            self._notifier = asyncio.create_task(self._deliver())
+
+    async def _deliver(self) -> None:
+        while self._reported != self.position:
+            position = self.position
+            try:
+                await self.on_update(position)
+            except Exception as e:
+                print(f"[build_scheduler] ⚠️ Progress update failed: {e}")
+            self._reported = position
+
+class BuildScheduler:
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_BUILDS, per_guild: int = MAX_BUILDS_PER_GUILD, small_build: int = SMALL_BUILD_OBJECTS,
+                 aging: float = SMALL_BUILD_AGING):
+        self.max_concurrent = max_concurrent
+        self.per_guild = per_guild
+        self.small_build = small_build
+        self.aging = aging
+        self._waiting = defaultdict(list)        # guild_id -> heap of _Job (smallest estimate first)
+        self._rotation = deque()                 # guild order for round-robin
+        self._running = 0
+        self._running_by_guild = defaultdict(int)
+        self._seq = itertools.count()
+
+    async def run(self, guild_id: str, estimate: int, func, *args, on_update=None, **kwargs):
+        """
+        Wait for a build slot, then run `func(*args, **kwargs)` — in a worker thread if it's a
+        plain function — and return its result. `on_update(position)` is awaited with the queue
+        position (1 = next), 0 once the build starts and None when it has finished.
+        """
+        job = _Job(str(guild_id), estimate, next(self._seq), on_update)
+        heapq.heappush(self._waiting[job.guild_id], job)
+        if job.guild_id not in self._rotation:
+            self._rotation.append(job.guild_id)
+        self._dispatch()
+
+        try:
+            await job.started.wait()
+        except asyncio.CancelledError:
+            job.cancelled = True
+            if job.started.is_set():
+                # Cancelled just as a slot was handed over; give it back
+                self._running -= 1
+                self._running_by_guild[job.guild_id] -= 1
+            self._dispatch()
+            raise
+
+        try:
+            job.notify(0)
+            if asyncio.iscoroutinefunction(func):
+                return await func(*args, **kwargs)
+            return await asyncio.to_thread(func, *args, **kwargs)
+        finally:
+            self._running -= 1
+            self._running_by_guild[job.guild_id] -= 1
+            job.notify(None)
+            self._dispatch()
+
+    def queued(self, guild_id: str = None) -> int:
+        heaps = [self._waiting.get(str(guild_id), [])] if guild_id else self._waiting.values()
+        return sum(1 for heap in heaps for job in heap if not job.cancelled)
+
+    # ─────────────── Internals ───────────────
+
+    def _pick(self, waiting: dict, rotation: deque, running_by_guild: dict = None):
+        """
+        Next job: guilds take turns; a guild whose smallest build is small goes before big ones.
+        A big build that has waited `aging` seconds counts as small, so a steady stream of
+        small builds from other guilds can't hold it back forever.
+        """
+        for heap in waiting.values():
+            while heap and heap[0].cancelled:
+                heapq.heappop(heap)
+
+        eligible = [
+            guild_id for guild_id in rotation
+            if waiting.get(guild_id) and (running_by_guild is None or running_by_guild[guild_id] < self.per_guild)
+        ]
+        if not eligible:
+            return None
+
+        now = time.monotonic()
+        small = [
+            guild_id for guild_id in eligible
+            if waiting[guild_id][0].estimate <= self.small_build or now - waiting[guild_id][0].queued_at >= self.aging
+        ]
+        guild_id = (small or eligible)[0]
+        rotation.remove(guild_id)
+        rotation.append(guild_id)
+        return heapq.heappop(waiting[guild_id])
+
+    def _dispatch(self) -> None:
+        while self._running < self.max_concurrent:
+            job = self._pick(self._waiting, self._rotation, self._running_by_guild)
+            if job is None:
+                break
+            self._running += 1
+            self._running_by_guild[job.guild_id] += 1
+            job.started.set()
+
+        for guild_id in [g for g in self._rotation if not self._waiting.get(g)]:
+            self._rotation.remove(guild_id)
+            self._waiting.pop(guild_id, None)
+
+        self._report_positions()
+
+    def _report_positions(self) -> None:
+        # Replay the pick order on a copy of the queue (ignoring per-guild caps) to number the waiting jobs
+        waiting = {guild_id: list(heap) for guild_id, heap in self._waiting.items()}
+        rotation = deque(self._rotation)
+        position = 0
+        while True:
+            job = self._pick(waiting, rotation)
+            if job is None:
+                break
+            position += 1
+            if job.position != position:
+                job.notify(position)
+
+def interaction_progress(interaction, label: str = "sign"):
+    """on_update callback that keeps the deferred interaction response showing the build's status."""
+    async def update(position):
+        if position is None:
+            content = f"✅ Your {label} build has finished."
+        elif position == 0:
+            content = f"🔨 Building your {label}…"
+        else:
+            content = f"⏳ Your {label} build is queued — position **{position}**."
+        await interaction.edit_original_response(content=content)
+    return update
+
+# Shared scheduler for every build command
+build_scheduler = BuildScheduler()
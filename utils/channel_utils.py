@@ -1,31 +1,25 @@
 # utils/channel_utils.py
 
-import json
-import os
-
-CHANNELS_FILE = "data/channels.json"
+from utils.io_executor import run_io
+from utils.storage import get_storage, CHANNELS_FILE
 
 def load_channels():
-    """Load all channel mappings from the JSON file."""
-    if not os.path.exists(CHANNELS_FILE):
-        return {}
-    with open(CHANNELS_FILE, "r") as f:
-        return json.load(f)
+    """Load all channel mappings from the configured storage backend."""
+    return get_storage().load_channels()
 
 def save_channel(server_id: str, channel_type: str, channel_id: str):
     """Save a specific channel type (admin, gallery, log) for a given server ID."""
-    os.makedirs(os.path.dirname(CHANNELS_FILE), exist_ok=True)
-    data = load_channels()
+    get_storage().save_channel(str(server_id), channel_type, str(channel_id))
 
-    if server_id not in data:
-        data[server_id] = {}
+def get_channel_id(channel_type: str, server_id: str) -> str | None:
+    """Retrieve a stored channel ID by type and server."""
+    return get_storage().get_channel_id(channel_type, str(server_id))
 
-    data[server_id][channel_type] = channel_id
+async def load_channels_async():
+    return await run_io(load_channels)
 
-    with open(CHANNELS_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+async def save_channel_async(server_id: str, channel_type: str, channel_id: str):
+    await run_io(save_channel, server_id, channel_type, channel_id)
 
-def get_channel_id(channel_type: str, server_id: str) -> str | None:
-    """Retrieve a stored channel ID by type and server."""
-    data = load_channels()
-    return data.get(server_id, {}).get(channel_type)
+async def get_channel_id_async(channel_type: str, server_id: str) -> str | None:
+    return await run_io(get_channel_id, channel_type, server_id)
@@ -1,9 +1,9 @@
 # utils/config_utils.py
 
-import json
-import os
+import copy
 
-CONFIGS_FILE = "data/guild_configs.json"
+from utils.io_executor import run_io
+from utils.storage import get_storage, CONFIGS_FILE
 
 DEFAULTS = {
     "origin_position": {"x": 5000.0, "y": 0.0, "z": 5000.0},
@@ -17,49 +17,51 @@ DEFAULTS = {
     "map_coordinates": {"x": 5000.0, "y": 0.0, "z": 5000.0},
     "custom_spacing": {},
     "custom_scale": {},
-    "include_mirror_kit": False
+    "include_mirror_kit": False,
+    "export_mode": "json",
+    "zip_compress_level": 6,
+    "font_path": None,
+    "font_cell_height": 12,
+    "optimize_objects": False,
+    "optimize_max_merge": 4,
+    "size_factor": 1,
+    "outline_mode": False,
+    "preview_encoding": "png",
+    "sign_yaw": 0.0,
+    "sign_tilt": 0.0
 }
 
+def _missing_defaults(config: dict, guild_id_str: str) -> dict:
+    return {
+        key: copy.deepcopy(value) if not isinstance(value, str) else value.format(guild_id=guild_id_str)
+        for key, value in DEFAULTS.items()
+        if key not in config
+    }
+
 def get_guild_config(guild_id: int) -> dict:
     """Load per-guild configuration. Fills in any missing keys with defaults."""
-    os.makedirs("data", exist_ok=True)
     guild_id_str = str(guild_id)
+    storage = get_storage()
 
-    try:
-        with open(CONFIGS_FILE, "r") as f:
-            all_configs = json.load(f)
-    except FileNotFoundError:
-        all_configs = {}
-
-    config = all_configs.get(guild_id_str, {})
-
-    updated = False
-    for key, value in DEFAULTS.items():
-        if key not in config:
-            config[key] = value if not isinstance(value, str) else value.format(guild_id=guild_id_str)
-            updated = True
+    config = storage.get_guild_config(guild_id_str) or {}
+    missing = _missing_defaults(config, guild_id_str)
+    if not missing:
+        return config
 
-    if updated:
-        all_configs[guild_id_str] = config
-        with open(CONFIGS_FILE, "w") as f:
-            json.dump(all_configs, f, indent=2)
-
-    return config
+    # Merge atomically so another process's changes aren't clobbered
+    return storage.ensure_guild_defaults(guild_id_str, missing)
 
 def save_guild_config(guild_id: int, updated_config: dict) -> None:
-    """Save the updated config dictionary for a guild back to the config file."""
-    os.makedirs("data", exist_ok=True)
-    guild_id_str = str(guild_id)
-
-    try:
-        with open(CONFIGS_FILE, "r") as f:
-            all_configs = json.load(f)
-    except FileNotFoundError:
-        all_configs = {}
-
-    all_configs[guild_id_str] = updated_config
-    with open(CONFIGS_FILE, "w") as f:
-        json.dump(all_configs, f, indent=2)
+    """Save the updated config dictionary for a guild back to storage."""
+    get_storage().save_guild_config(str(guild_id), updated_config)
 
 # ✅ Alias for backwards compatibility
 update_guild_config = save_guild_config
+
+async def get_guild_config_async(guild_id: int) -> dict:
+    """get_guild_config on the I/O pool, for use inside coroutines."""
+    return await run_io(get_guild_config, guild_id)
+
+async def save_guild_config_async(guild_id: int, updated_config: dict) -> None:
+    """save_guild_config on the I/O pool, for use inside coroutines."""
+    await run_io(save_guild_config, guild_id, updated_config)
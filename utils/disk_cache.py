@@ -0,0 +1,55 @@
+# utils/disk_cache.py — Small LRU caches persisted as JSON (glyph atlas, QR results, ...)
+
+import threading
+import time
+from collections import OrderedDict
+
+from utils.json_store import read_json, write_json
+
+class PersistentLRUCache:
+    """
+    In-memory LRU cache of JSON-serialisable values, loaded from and flushed to `path`.
+    Least recently used entries are evicted once `max_entries` is exceeded.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries = None   # key -> {"value": ..., "used": timestamp}, oldest first
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        if self._entries is not None:
+            return
+        stored = read_json(self.path, dict).get("entries", {})
+        ordered = sorted(stored.items(), key=lambda item: item[1].get("used", 0))
+        self._entries = OrderedDict(ordered)
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            # Recency is persisted with the next write; hits alone don't rewrite the file
+            entry["used"] = time.time()
+            self._entries.move_to_end(key)
+            return entry["value"]
+
+    def put(self, key: str, value) -> None:
+        with self._lock:
+            self._load()
+            self._entries[key] = {"value": value, "used": time.time()}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)  # evict least recently used
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write the cache to disk if anything changed since the last flush."""
+        with self._lock:
+            if not self._dirty:
+                return
+            write_json(self.path, {"entries": dict(self._entries)})
+            self._dirty = False
@@ -0,0 +1,232 @@
+# utils/disk_gc.py — Retention for build outputs, previews and gallery copies
+#
+# Files are grouped per guild (outputs/<guild>/, previews/<guild>/, public/gallery/<guild>/,
+# <guild>_* outputs, data/objects_<guild>.json and data/fonts/<guild>/). Files that belong to no
+# guild go into named pools: API and batch builds, staged gallery jobs and the runtime caches.
+# Build and staging folders are collected whole, so a half-deleted build is never reused. Each pass:
+#   1. removes anything older than MAX_AGE_DAYS,
+#   2. trims each guild to GUILD_BUDGET_MB and each pool to its POOL_BUDGETS_MB entry,
+#      least recently used first (pools budgeted None are only aged out),
+#   3. trims everything together to GLOBAL_BUDGET_MB the same way.
+# Files touched in the last GRACE_SECONDS (in-flight builds, staged posts) and each guild's
+# current output paths and font are never removed.
+#
+# Report without deleting anything:
+#   python -m utils.disk_gc --dry-run
+
+import asyncio
+import glob
+import os
+import re
+import shutil
+import sys
+import time
+from collections import defaultdict
+
+from logic.glyph_provider import ATLAS_PATH, UPLOADED_FONTS_DIR
+from logic.qr_matrix import QR_CACHE_PATH
+from utils.config_utils import DEFAULTS
+from utils.gallery_queue import GALLERY_STAGING_DIR
+from utils.gallery_utils import GALLERY_ROOT
+from utils.io_executor import run_io
+from utils.storage import get_storage
+
+MB = 1024 * 1024
+GC_INTERVAL = int(os.environ.get("SIGN4ME_GC_INTERVAL", "3600"))
+MAX_AGE_DAYS = float(os.environ.get("SIGN4ME_GC_MAX_AGE_DAYS", "30"))
+GUILD_BUDGET_MB = float(os.environ.get("SIGN4ME_GC_GUILD_MB", "200"))
+GLOBAL_BUDGET_MB = float(os.environ.get("SIGN4ME_GC_GLOBAL_MB", "2000"))
+GRACE_SECONDS = 900
+
+SHARED_GUILD = "shared"  # legacy single-file outputs not tied to one server
+POOL_BUDGETS_MB = {
+    "api": float(os.environ.get("SIGN4ME_GC_API_MB", "500")),
+    "batch": float(os.environ.get("SIGN4ME_GC_BATCH_MB", "500")),
+    "staging": None,   # a pending gallery job still needs its staged copy
+    "caches": None     # the caches already cap their own entry counts
+}
+
+# (glob, regex extracting the guild id from the path)
+TRACKED = [
+    ("outputs/*/*", r"^outputs/(\d+)/"),
+    ("previews/*/*", r"^previews/(\d+)/"),
+    (f"{GALLERY_ROOT}/*/*", rf"^{re.escape(GALLERY_ROOT)}/(\d+)/"),
+    ("outputs/*_*", r"^outputs/(\d+)_"),
+    ("previews/*_*", r"^previews/(\d+)_"),
+    ("data/objects_*.json", r"^data/objects_(\d+)\.json$"),
+    (f"{UPLOADED_FONTS_DIR}/*/*", rf"^{re.escape(UPLOADED_FONTS_DIR)}/(\d+)/"),
+    ("outputs/Sign4ME.json", None),
+    ("previews/sign_preview.*", None),
+]
+
+# (glob, pool, collect each match as one folder)
+TRACKED_POOLS = [
+    ("outputs/api/*", "api", True),
+    ("outputs/batch/*", "batch", True),
+    (f"{GALLERY_STAGING_DIR}/*", "staging", True),
+    (ATLAS_PATH, "caches", False),
+    (QR_CACHE_PATH, "caches", False),
+]
+
+def _folder_stats(path: str) -> tuple:
+    """(total bytes, last access) of everything under a folder."""
+    size, last_access = 0, os.stat(path).st_mtime
+    for root, _, names in os.walk(path):
+        for name in names:
+            try:
+                st = os.stat(os.path.join(root, name))
+            except FileNotFoundError:
+                continue
+            size += st.st_size
+            last_access = max(last_access, st.st_atime, st.st_mtime)
+    return size, last_access
+
+def _collect() -> list:
+    files = {}
+    for pattern, guild_re in TRACKED:
+        for path in glob.glob(pattern):
+            path = path.replace("\\", "/")
+            if path in files or not os.path.isfile(path):
+                continue
+            match = re.match(guild_re, path) if guild_re else None
+            if guild_re and not match:
+                continue
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            # atime is often frozen (noatime/relatime mounts); never treat a file as older than its last write
+            files[path] = {
+                "path": path,
+                "guild": match.group(1) if match else SHARED_GUILD,
+                "size": st.st_size,
+                "last_access": max(st.st_atime, st.st_mtime)
+            }
+
+    for pattern, pool, whole_folder in TRACKED_POOLS:
+        for path in glob.glob(pattern):
+            path = path.replace("\\", "/")
+            if path in files or not (os.path.isdir(path) if whole_folder else os.path.isfile(path)):
+                continue
+            try:
+                if whole_folder:
+                    size, last_access = _folder_stats(path)
+                else:
+                    st = os.stat(path)
+                    size, last_access = st.st_size, max(st.st_atime, st.st_mtime)
+            except FileNotFoundError:
+                continue
+            files[path] = {"path": path, "guild": pool, "size": size, "last_access": last_access, "folder": whole_folder}
+    return list(files.values())
+
+def _protected_paths() -> set:
+    """Each guild's current export/preview/bundle paths, which /sign_settings rebuilds read back."""
+    protected = set()
+    keys = ("object_output_path", "preview_output_path", "zip_output_path")
+    for guild_id, config in get_storage().all_guild_configs().items():
+        for key in keys:
+            path = config.get(key) or DEFAULTS[key].format(guild_id=guild_id)
+            protected.add(os.path.normpath(path).replace("\\", "/"))
+        if config.get("font_path"):
+            protected.add(os.path.normpath(config["font_path"]).replace("\\", "/"))
+    return protected
+
+def plan(now: float = None, max_age_days: float = MAX_AGE_DAYS, guild_budget_mb: float = GUILD_BUDGET_MB,
+         global_budget_mb: float = GLOBAL_BUDGET_MB) -> list:
+    """Decide what to delete: list of (file, reason). Nothing is touched."""
+    now = now or time.time()
+    protected = _protected_paths()
+    files = sorted(_collect(), key=lambda f: f["last_access"])  # least recently used first
+    candidates = [f for f in files if f["path"] not in protected and now - f["last_access"] > GRACE_SECONDS]
+
+    doomed = {}
+    for f in candidates:
+        if now - f["last_access"] > max_age_days * 86400:
+            doomed[f["path"]] = (f, "age")
+
+    usage = defaultdict(int)
+    for f in files:
+        if f["path"] not in doomed:
+            usage[f["guild"]] += f["size"]
+
+    # Age-only pools are left out of the budget passes
+    candidates = [f for f in candidates if POOL_BUDGETS_MB.get(f["guild"], 0) is not None]
+    for f in candidates:
+        if f["path"] in doomed or f["guild"] == SHARED_GUILD:
+            continue
+        budget_mb = POOL_BUDGETS_MB.get(f["guild"], guild_budget_mb)
+        if usage[f["guild"]] > budget_mb * MB:
+            doomed[f["path"]] = (f, "pool budget" if f["guild"] in POOL_BUDGETS_MB else "guild budget")
+            usage[f["guild"]] -= f["size"]
+
+    total = sum(size for group, size in usage.items() if POOL_BUDGETS_MB.get(group, 0) is not None)
+    for f in candidates:
+        if total <= global_budget_mb * MB:
+            break
+        if f["path"] not in doomed:
+            doomed[f["path"]] = (f, "global budget")
+            total -= f["size"]
+
+    return list(doomed.values())
+
+def _prune_gallery_entries(removed: list) -> None:
+    """Drop gallery entries whose image or export was collected, so the web gallery has no broken links."""
+    prefix = os.path.dirname(GALLERY_ROOT)
+    by_guild = defaultdict(list)
+    for f in removed:
+        if f["path"].startswith(GALLERY_ROOT + "/"):
+            by_guild[f["guild"]].append(os.path.relpath(f["path"], prefix).replace("\\", "/"))
+    storage = get_storage()
+    for guild_id, paths in by_guild.items():
+        storage.remove_gallery_entries(guild_id, paths)
+
+def collect_garbage(dry_run: bool = False, **budgets) -> dict:
+    """Run one retention pass and return a report (with dry_run, only the report)."""
+    doomed = plan(**budgets)
+    removed, freed = [], 0
+    by_guild = defaultdict(lambda: {"files": 0, "bytes": 0})
+
+    for f, reason in doomed:
+        if not dry_run:
+            try:
+                if f.get("folder"):
+                    shutil.rmtree(f["path"])
+                else:
+                    os.remove(f["path"])
+            except FileNotFoundError:
+                continue
+        removed.append(f)
+        freed += f["size"]
+        by_guild[f["guild"]]["files"] += 1
+        by_guild[f["guild"]]["bytes"] += f["size"]
+
+    if removed and not dry_run:
+        _prune_gallery_entries(removed)
+
+    return {
+        "dry_run": dry_run,
+        "files": len(removed),
+        "bytes": freed,
+        "by_guild": dict(by_guild),
+        "items": [{"path": f["path"], "size": f["size"], "reason": reason} for f, reason in doomed]
+    }
+
+async def run_forever(interval: float = GC_INTERVAL) -> None:
+    """Background loop started by the bot; each pass runs on the I/O pool."""
+    while True:
+        try:
+            report = await run_io(collect_garbage)
+            if report["files"]:
+                print(f"[gc] 🧹 Removed {report['files']} file(s), {report['bytes'] / MB:.1f} MB")
+        except Exception as e:
+            print(f"[gc] ❌ Retention pass failed: {e}")
+        await asyncio.sleep(interval)
+
+if __name__ == "__main__":
+    report = collect_garbage(dry_run="--dry-run" in sys.argv[1:])
+    verb = "Would remove" if report["dry_run"] else "Removed"
+    for item in report["items"]:
+        print(f"  {item['path']}  {item['size'] / 1024:.0f} KB  ({item['reason']})")
+    for guild_id, stats in sorted(report["by_guild"].items()):
+        print(f"  guild {guild_id}: {stats['files']} file(s), {stats['bytes'] / MB:.1f} MB")
+    print(f"🧹 {verb} {report['files']} file(s), {report['bytes'] / MB:.1f} MB")
@@ -0,0 +1,177 @@
+# utils/gallery_queue.py — Background gallery archiving with durable, retried jobs
+#
+# Publishing a build only waits for the Discord post. The artifacts are staged into
+# data/gallery_staging/<job_id>/ straight away (so the next build can't overwrite them),
+# and once the post goes out a job is recorded in data/gallery_jobs.json and archived
+# by a single worker. Jobs left behind by a crash or restart are picked up on startup.
+
+import asyncio
+import os
+import shutil
+import time
+import uuid
+from datetime import datetime
+
+from utils.gallery_utils import save_to_gallery
+from utils.io_executor import run_io
+from utils.json_store import update_json, read_json
+
+GALLERY_JOBS_FILE = "data/gallery_jobs.json"
+GALLERY_STAGING_DIR = "data/gallery_staging"
+MAX_ATTEMPTS = 5
+RETRY_DELAY = 2.0            # seconds, doubled per attempt
+ORPHAN_STAGING_AGE = 3600    # staged files with no job after this long belong to a post that never went out
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+class GalleryArchiver:
+    def __init__(self, jobs_file: str = GALLERY_JOBS_FILE, staging_dir: str = GALLERY_STAGING_DIR, max_attempts: int = MAX_ATTEMPTS):
+        self.jobs_file = jobs_file
+        self.staging_dir = staging_dir
+        self.max_attempts = max_attempts
+        self._queue = None
+        self._worker = None
+        self._waiters = set()  # tasks waiting on a Discord post before enqueueing
+
+    async def publish(self, post_future: asyncio.Future, preview_path: str, export_path: str, metadata: dict, server_id: str) -> None:
+        """
+        Stage the build's files now and archive them once `post_future` (from post_queue.send)
+        resolves to a message. A failed post discards the staged copy.
+        """
+        job = await run_io(self._stage, preview_path, export_path, metadata, str(server_id))
+        task = asyncio.create_task(self._archive_after_post(post_future, job))
+        self._waiters.add(task)
+        task.add_done_callback(self._waiters.discard)
+
+    async def resume(self) -> None:
+        """Claim jobs left by dead processes, clear orphaned staging folders and start the worker."""
+        jobs = await run_io(self._claim_abandoned)
+        await run_io(self._clear_orphans)
+        for job in jobs:
+            self._enqueue(job)
+        if jobs:
+            print(f"[gallery] 🔁 Resuming {len(jobs)} pending archive job(s)")
+
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    async def drain(self, timeout: float = 30.0) -> None:
+        """Wait for queued archive jobs on shutdown; anything unfinished stays in the jobs file."""
+        if self._waiters:
+            await asyncio.wait(list(self._waiters), timeout=timeout)
+        if not self._queue:
+            return
+        if self._queue.qsize():
+            print(f"[gallery] ⏳ Draining {self._queue.qsize()} archive job(s)...")
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            print("[gallery] ⚠️ Drain timed out; remaining jobs will resume on next start")
+        if self._worker:
+            self._worker.cancel()
+
+    # ─────────────── Internals ───────────────
+
+    def _stage(self, preview_path: str, export_path: str, metadata: dict, server_id: str) -> dict:
+        job_id = uuid.uuid4().hex
+        job_dir = os.path.join(self.staging_dir, job_id)
+        os.makedirs(job_dir, exist_ok=True)
+
+        staged_preview = os.path.join(job_dir, os.path.basename(preview_path))
+        staged_export = os.path.join(job_dir, os.path.basename(export_path))
+        shutil.copy(preview_path, staged_preview)
+        shutil.copy(export_path, staged_export)
+
+        return {
+            "id": job_id,
+            "server_id": server_id,
+            "preview_path": staged_preview,
+            "export_path": staged_export,
+            "metadata": metadata,
+            "timestamp": datetime.now().strftime("%Y%m%d_%H%M%S"),
+            "attempts": 0,
+            "owner": os.getpid()
+        }
+
+    async def _archive_after_post(self, post_future: asyncio.Future, job: dict) -> None:
+        message = await post_future
+        if message is None:
+            await run_io(shutil.rmtree, os.path.dirname(job["preview_path"]), True)
+            return
+        await run_io(self._record, job)
+        self._enqueue(job)
+
+    def _record(self, job: dict) -> None:
+        with update_json(self.jobs_file, dict) as data:
+            data.setdefault("jobs", {})[job["id"]] = job
+
+    def _forget(self, job: dict) -> None:
+        with update_json(self.jobs_file, dict) as data:
+            data.setdefault("jobs", {}).pop(job["id"], None)
+
+    def _claim_abandoned(self) -> list:
+        claimed = []
+        with update_json(self.jobs_file, dict) as data:
+            for job in data.setdefault("jobs", {}).values():
+                if job.get("owner") == os.getpid() or not _pid_alive(job.get("owner", 0)):
+                    job["owner"] = os.getpid()
+                    job["attempts"] = 0
+                    claimed.append(job)
+        return claimed
+
+    def _clear_orphans(self) -> None:
+        if not os.path.isdir(self.staging_dir):
+            return
+        known = set(read_json(self.jobs_file, dict).get("jobs", {}))
+        cutoff = time.time() - ORPHAN_STAGING_AGE
+        for name in os.listdir(self.staging_dir):
+            path = os.path.join(self.staging_dir, name)
+            if name not in known and os.path.getmtime(path) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _archive(self, job: dict) -> None:
+        save_to_gallery(job["preview_path"], job["export_path"], job["metadata"], job["server_id"],
+                        timestamp=job["timestamp"], suffix=job["id"][:8])
+        self._forget(job)
+        shutil.rmtree(os.path.dirname(job["preview_path"]), ignore_errors=True)
+
+    def _enqueue(self, job: dict) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._queue.put_nowait(job)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._process(job)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job: dict) -> None:
+        while True:
+            job["attempts"] += 1
+            try:
+                await run_io(self._archive, job)
+                return
+            except Exception as e:
+                if job["attempts"] >= self.max_attempts:
+                    # Left in the jobs file (with its staged files) for a later restart or manual look
+                    print(f"[gallery] ❌ Giving up on archive job {job['id']} after {job['attempts']} attempts: {e}")
+                    return
+                delay = RETRY_DELAY * 2 ** (job["attempts"] - 1)
+                print(f"[gallery] ⚠️ Archive job {job['id']} failed ({e}), retrying in {delay:.0f}s")
+                await run_io(self._record, job)
+                await asyncio.sleep(delay)
+
+# Shared archiver for every cog
+gallery_archiver = GalleryArchiver()
@@ -1,65 +1,59 @@
 # utils/gallery_utils.py
 
 import os
-import json
 import shutil
+import uuid
 from datetime import datetime
 
+from utils.io_executor import run_io
+from utils.json_store import read_json, write_json
+from utils.storage import get_storage, GALLERY_DATA_ROOT, LATEST_PREVIEW_JSON
+
 GALLERY_ROOT = "public/gallery"
-GALLERY_DATA_ROOT = "data/galleries"
-LATEST_PREVIEW_JSON = "data/previews.json"
 LATEST_OUTPUT_JSON = "data/output_build.json"
 
-def save_to_gallery(preview_path, zip_path, metadata: dict, server_id: str = "unknown"):
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    base_name = f"{metadata['object_type']}_{timestamp}"
+def save_to_gallery(preview_path, zip_path, metadata: dict, server_id: str = "unknown", timestamp: str = None, suffix: str = None):
+    # A fixed timestamp + suffix makes retries overwrite the same gallery files instead of adding new ones;
+    # the suffix keeps two builds of one object type in the same second apart
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+    suffix = suffix or uuid.uuid4().hex[:8]
+    base_name = f"{metadata['object_type']}_{timestamp}_{suffix}"
+    export_ext = os.path.splitext(zip_path)[1] or ".zip"
 
     # Create target folders per server
     gallery_dir = os.path.join(GALLERY_ROOT, server_id)
     os.makedirs(gallery_dir, exist_ok=True)
 
     # Target output paths
-    preview_target = os.path.join(gallery_dir, f"{base_name}.png")
-    zip_target = os.path.join(gallery_dir, f"{base_name}.zip")
+    preview_ext = os.path.splitext(preview_path)[1] or ".png"
+    preview_target = os.path.join(gallery_dir, f"{base_name}{preview_ext}")
+    zip_target = os.path.join(gallery_dir, f"{base_name}{export_ext}")
 
     # Copy preview and zip into server folder
     shutil.copy(preview_path, preview_target)
     shutil.copy(zip_path, zip_target)
 
-    # Load or initialize server-specific gallery JSON
-    server_gallery_json = os.path.join(GALLERY_DATA_ROOT, f"gallery_{server_id}.json")
-    os.makedirs(os.path.dirname(server_gallery_json), exist_ok=True)
-
-    try:
-        with open(server_gallery_json, "r") as f:
-            gallery = json.load(f)
-    except FileNotFoundError:
-        gallery = []
-
     # Build gallery entry
     entry = {
-        "image": f"gallery/{server_id}/{base_name}.png",
-        "zip": f"gallery/{server_id}/{base_name}.zip",
+        "image": f"gallery/{server_id}/{base_name}{preview_ext}",
+        "zip": f"gallery/{server_id}/{base_name}{export_ext}",
         "object_type": metadata["object_type"],
         "qr_size": metadata["qr_size"],
         "total_objects": metadata["total_objects"],
         "created": timestamp
     }
-    gallery.append(entry)
 
-    # Save updated gallery file
-    with open(server_gallery_json, "w") as f:
-        json.dump(gallery, f, indent=2)
-
-    # Also write last build to latest pointer
-    with open(LATEST_PREVIEW_JSON, "w") as f:
-        json.dump(entry, f, indent=2)
+    # Append to the server-specific gallery and update the latest pointer
+    storage = get_storage()
+    storage.append_gallery_entry(server_id, entry)
+    storage.set_latest_preview(entry)
 
     # Optional: copy raw object data to global latest
     if os.path.exists(LATEST_OUTPUT_JSON):
-        with open(LATEST_OUTPUT_JSON, "r") as f:
-            obj_data = json.load(f)
-        with open("data/latest_objects.json", "w") as f:
-            json.dump(obj_data, f, indent=2)
+        write_json("data/latest_objects.json", read_json(LATEST_OUTPUT_JSON, dict))
+
+    print(f"[+] Saved gallery item for server {server_id} ({storage.name} storage)")
 
-    print(f"[+] Saved gallery item for server {server_id} to {server_gallery_json}")
+async def save_to_gallery_async(preview_path, zip_path, metadata: dict, server_id: str = "unknown", timestamp: str = None, suffix: str = None):
+    """save_to_gallery on the I/O pool so the copies and JSON writes never block the event loop."""
+    await run_io(save_to_gallery, preview_path, zip_path, metadata, server_id, timestamp, suffix)
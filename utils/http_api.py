@@ -0,0 +1,258 @@
+# utils/http_api.py — Optional local HTTP API for generating signs without Discord
+#
+# Runs inside the bot when SIGN4ME_HTTP_PORT is set, or standalone:
+#   python -m utils.http_api --port 8080
+#
+#   POST /signs               JSON spec (same fields as sign4me.py) → build info as JSON
+#   POST /signs?format=png    same, but the response body is the preview image
+#   GET  /signs/<hash>.json   the object export of a finished build
+#   GET  /signs/<hash>.png    its preview
+#
+# Builds go through the shared build scheduler, whose slots are the worker pool; each batch runs
+# on a thread so it shares the bot's glyph and icon caches. Identical specs in flight at the same
+# time share one build, and small specs arriving together are built as one batch. Every build
+# lands in outputs/api/<hash>/, which utils.disk_gc keeps within its own budget.
+# API specs are held to the /signbuild limits, may only name bundled fonts, and always get a
+# PNG preview so /signs/<hash>.png means what it says.
+
+import argparse
+import asyncio
+import os
+import re
+
+from logic.glyph_provider import resolve_font_path
+from sign4me import normalize_spec, spec_hash, build_one, load_done, mark_done
+from sign_generator import MAX_OBJECTS
+from utils.build_scheduler import build_scheduler
+
+HTTP_HOST = os.environ.get("SIGN4ME_HTTP_HOST", "127.0.0.1")
+HTTP_PORT = int(os.environ["SIGN4ME_HTTP_PORT"]) if os.environ.get("SIGN4ME_HTTP_PORT") else None
+HTTP_TOKEN = os.environ.get("SIGN4ME_HTTP_TOKEN")   # when set, requests need "Authorization: Bearer <token>"
+API_ROOT = "outputs/api"
+BATCH_WINDOW = 0.02      # seconds to wait for more small specs before dispatching a batch
+BATCH_MAX = 8            # specs per batch
+BATCH_OBJECTS = 300      # specs estimated above this many objects are built on their own
+MAX_BODY_BYTES = 64 * 1024
+HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+MAX_TEXT_LENGTH = 256
+API_RANGES = {
+    # field: (min, max), the same bounds the slash commands enforce
+    "size_factor": (1, 6),
+    "font_cell_height": (5, 64),
+    "max_merge": (1, 8)
+}
+API_PREVIEW_ENCODINGS = ("png", "png_fast", "palette")
+
+def check_api_spec(spec: dict) -> dict:
+    """Tighten a normalized spec for untrusted callers; raises ValueError with the reason."""
+    if len(spec["text"]) > MAX_TEXT_LENGTH:
+        raise ValueError(f"text must be at most {MAX_TEXT_LENGTH} characters")
+    for field, (low, high) in API_RANGES.items():
+        if not low <= spec[field] <= high:
+            raise ValueError(f"{field} must be between {low} and {high}, got {spec[field]}")
+    if spec["preview_encoding"] not in API_PREVIEW_ENCODINGS:
+        raise ValueError(f"preview_encoding must be one of {', '.join(API_PREVIEW_ENCODINGS)}")
+
+    font = spec["font_path"]
+    if font:
+        # Bundled font names only; a path could read any file the bot can
+        try:
+            path = resolve_font_path(font)
+        except FileNotFoundError:
+            raise ValueError(f"font_path must be the file name of a bundled font, got {font!r}")
+        spec = {**spec, "font_path": path}
+    return spec
+
+def _estimate(spec: dict) -> int:
+    """Object count from the matrix alone, so the batcher can route the spec before building."""
+    from logic.text_matrix import generate_letter_matrix
+    from logic.matrix_ops import estimate_object_counts
+
+    matrix = generate_letter_matrix(spec["text"], font_path=spec["font_path"], cell_height=spec["font_cell_height"])
+    counts = estimate_object_counts(matrix, spec["size_factor"], spec["mirror_kit"] and spec["orientation"] == "upright")
+    return counts["outline" if spec["outline"] else "solid"]
+
+def _build_many(jobs: list) -> list:
+    """Worker: build a batch back to back in one thread; returns stats or the exception per job."""
+    results = []
+    for spec, folder, digest in jobs:
+        try:
+            os.makedirs(folder, exist_ok=True)
+            stats = build_one(spec, folder)
+            mark_done(folder, spec, digest, stats)
+            results.append(stats)
+        except Exception as e:
+            results.append(e)
+    return results
+
+class SignService:
+    def __init__(self, root: str = API_ROOT):
+        self.root = root
+        self._inflight = {}      # spec hash -> Future shared by every identical request
+        self._pending = []       # [(spec, folder, digest, future, client)] waiting for the batch window
+        self._flusher = None
+        self._tasks = set()      # running batch tasks, kept referenced until they finish
+
+    async def generate(self, spec: dict, client: str = "http") -> dict:
+        """Build (or reuse) one spec; returns its stats plus hash and file names."""
+        digest = await asyncio.to_thread(spec_hash, spec)
+        folder = os.path.join(self.root, digest)
+
+        done = await asyncio.to_thread(load_done, folder, digest)
+        if done is not None:
+            return self._describe(digest, folder, done, cached=True)
+
+        future = self._inflight.get(digest)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[digest] = future
+            future.add_done_callback(lambda f: self._settled(digest, f))
+            await self._submit(spec, folder, digest, future, client)
+        else:
+            print(f"[http_api] 🔗 Coalesced request for {digest[:12]}")
+
+        stats = await asyncio.shield(future)
+        return self._describe(digest, folder, stats, cached=False)
+
+    def _settled(self, digest: str, future) -> None:
+        self._inflight.pop(digest, None)
+        if not future.cancelled():
+            future.exception()  # mark retrieved even if every requester has gone away
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _describe(self, digest: str, folder: str, stats: dict, cached: bool) -> dict:
+        return {
+            "hash": digest,
+            "folder": folder,
+            "cached": cached,
+            "export_url": f"/signs/{digest}.json",
+            "preview_url": f"/signs/{digest}.png",
+            **stats
+        }
+
+    async def _submit(self, spec, folder, digest, future, client) -> None:
+        try:
+            estimate = await asyncio.to_thread(_estimate, spec)
+        except Exception as e:
+            future.set_exception(ValueError(f"Could not read spec: {e}"))
+            return
+        if estimate > MAX_OBJECTS and not spec["optimize"]:
+            future.set_exception(ValueError(
+                f"Sign needs ~{estimate} objects, over the {MAX_OBJECTS} limit; shorten the text, "
+                f"lower size_factor or set optimize"))
+            return
+
+        if estimate > BATCH_OBJECTS:
+            self._spawn(self._run_batch(client, estimate, [(spec, folder, digest, future)]))
+            return
+
+        self._pending.append((spec, folder, digest, future, client, estimate))
+        if len(self._pending) >= BATCH_MAX:
+            self._flush()
+        elif self._flusher is None:
+            self._flusher = asyncio.get_running_loop().call_later(BATCH_WINDOW, self._flush)
+
+    def _flush(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        pending, self._pending = self._pending, []
+        if pending:
+            # One scheduler job per batch; the first requester's key decides its place in the rotation
+            jobs = [(spec, folder, digest, future) for spec, folder, digest, future, _, _ in pending]
+            self._spawn(self._run_batch(pending[0][4], sum(p[5] for p in pending), jobs))
+
+    async def _run_batch(self, client: str, estimate: int, jobs: list) -> None:
+        try:
+            results = await build_scheduler.run(f"http:{client}", estimate, _build_many,
+                                                [(spec, folder, digest) for spec, folder, digest, _ in jobs])
+        except Exception as e:
+            results = [e] * len(jobs)
+
+        if len(jobs) > 1:
+            print(f"[http_api] 📦 Built a batch of {len(jobs)} specs")
+        for (_, _, _, future), result in zip(jobs, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def find(self, digest: str, kind: str):
+        """Path of a finished build's export ("json") or preview ("png"), or None."""
+        # Build folders are named by the full hash, so this is a direct lookup
+        folder = os.path.join(self.root, digest)
+        if not HASH_RE.match(digest) or load_done(folder, digest) is None:
+            return None
+        path = os.path.join(folder, "Sign4ME.json" if kind == "json" else "sign_preview.png")
+        return path if os.path.exists(path) else None
+
+def create_app(service: SignService = None):
+    """aiohttp application exposing the service; aiohttp ships with discord.py and is imported here only."""
+    from aiohttp import web
+
+    service = service or SignService()
+
+    @web.middleware
+    async def auth(request, handler):
+        if HTTP_TOKEN and request.headers.get("Authorization") != f"Bearer {HTTP_TOKEN}":
+            return web.json_response({"error": "unauthorized"}, status=401)
+        return await handler(request)
+
+    async def post_sign(request):
+        try:
+            raw = await request.json()
+            if not isinstance(raw, dict):
+                raise ValueError("body must be a JSON object")
+            spec = check_api_spec(normalize_spec(raw, 1))
+        except ValueError as e:
+            return web.json_response({"error": str(e).replace("line 1: ", "")}, status=400)
+
+        try:
+            info = await service.generate(spec, request.remote or "http")
+        except ValueError as e:
+            return web.json_response({"error": str(e)}, status=422)
+
+        if request.query.get("format") == "png":
+            path = await asyncio.to_thread(service.find, info["hash"], "png")
+            if not path:
+                return web.json_response({"error": "preview not found"}, status=404)
+            return web.FileResponse(path)
+        info.pop("folder")
+        return web.json_response(info)
+
+    async def get_file(request):
+        path = await asyncio.to_thread(service.find, request.match_info["digest"], request.match_info["kind"])
+        if not path or not os.path.exists(path):
+            return web.json_response({"error": "not found"}, status=404)
+        return web.FileResponse(path)   # streamed from disk in chunks
+
+    app = web.Application(middlewares=[auth], client_max_size=MAX_BODY_BYTES)
+    app.router.add_post("/signs", post_sign)
+    app.router.add_get(r"/signs/{digest}.{kind:json|png}", get_file)
+    app["service"] = service
+    return app
+
+async def start_http_api(host: str = HTTP_HOST, port: int = HTTP_PORT):
+    """Start the API on the running loop (e.g. from the bot's setup_hook); returns the runner to clean up."""
+    from aiohttp import web
+
+    runner = web.AppRunner(create_app())
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    print(f"[http_api] 🌐 Listening on http://{host}:{port}")
+    return runner
+
+if __name__ == "__main__":
+    from aiohttp import web
+
+    parser = argparse.ArgumentParser(description="Run the Sign4Me generation API without the Discord bot")
+    parser.add_argument("--host", default=HTTP_HOST)
+    parser.add_argument("--port", type=int, default=HTTP_PORT or 8080)
+    args = parser.parse_args()
+    web.run_app(create_app(), host=args.host, port=args.port)
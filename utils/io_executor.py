@@ -0,0 +1,21 @@
+# utils/io_executor.py — Dedicated thread pool for blocking storage I/O
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Kept separate from asyncio's default executor so builds running in to_thread()
+# can't starve config/permission lookups (and vice versa)
+IO_WORKERS = int(os.environ.get("SIGN4ME_IO_WORKERS", "4"))
+
+io_executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="sign4me-io")
+
+async def run_io(func, *args, **kwargs):
+    """Run a blocking storage call on the I/O pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(io_executor, functools.partial(func, *args, **kwargs))
+
+def shutdown_io(wait: bool = True):
+    """Finish in-flight writes and stop the pool (called on bot shutdown)."""
+    io_executor.shutdown(wait=wait)
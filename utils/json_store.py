@@ -0,0 +1,65 @@
+# utils/json_store.py — Process-safe JSON file helpers shared by the Sign4Me stores
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines: fall back to unlocked access
+    fcntl = None
+
+@contextmanager
+def file_lock(path: str, shared: bool = False):
+    """Hold an advisory lock on `<path>.lock` so several bot processes can share one store."""
+    lock_path = f"{path}.lock"
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+
+    with open(lock_path, "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def _read(path: str, default):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default()
+
+def _write(path: str, data) -> None:
+    # Write to a temp file in the same folder and swap it in, so readers never see a half-written file
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def read_json(path: str, default=dict):
+    """Load a JSON file under a shared lock. `default` is a factory used when the file is missing."""
+    with file_lock(path, shared=True):
+        return _read(path, default)
+
+def write_json(path: str, data) -> None:
+    """Atomically replace a JSON file under an exclusive lock."""
+    with file_lock(path):
+        _write(path, data)
+
+@contextmanager
+def update_json(path: str, default=dict):
+    """Load, mutate and save a JSON file while holding an exclusive lock for the whole cycle."""
+    with file_lock(path):
+        data = _read(path, default)
+        yield data
+        _write(path, data)
@@ -1,32 +1,10 @@
 # utils/permissions.py — SIGN4ME Admin Permission Checks
 
-import json
-import os
-
-CONFIG_PATH = "config.json"
-ADMIN_USERS_FILE = "data/admin_users.json"
+from utils.io_executor import run_io
+from utils.storage import get_storage, CONFIG_PATH, ADMIN_USERS_FILE
 
 def _load_admin_users():
-    if not os.path.exists(ADMIN_USERS_FILE):
-        return {}
-    with open(ADMIN_USERS_FILE, "r") as f:
-        data = json.load(f)
-
-    # Auto-migrate flat formats to proper dict structure
-    fixed = {}
-    for sid, value in data.items():
-        if isinstance(value, list):
-            fixed[sid] = {"permitted_users": value}
-        elif isinstance(value, dict) and "permitted_users" in value:
-            fixed[sid] = value
-        else:
-            fixed[sid] = {"permitted_users": []}
-    return fixed
-
-def _save_admin_users(data):
-    os.makedirs(os.path.dirname(ADMIN_USERS_FILE), exist_ok=True)
-    with open(ADMIN_USERS_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    return get_storage().load_admin_users()
 
 def is_admin_user(interaction) -> bool:
     """
@@ -36,59 +14,57 @@ def is_admin_user(interaction) -> bool:
     - ✅ TEMP: Hardcoded override for trusted IDs/roles
     """
     try:
-        server_id = str(interaction.guild.id)
-        user_id = str(interaction.user.id)
-        user_roles = [str(role.id) for role in getattr(interaction.user, "roles", [])]
-
-        # ✅ Hardcoded override for Nuke (SV13 Owner/Admin)
-        if (
-            server_id == "1222586285332496425" and (
-                user_id == "423217982437851136" or
-                "1317426743602184192" in user_roles
-            )
-        ):
-            return True
+        return _check_admin(*_identity(interaction))
+    except Exception as e:
+        print(f"[permissions] Error in is_admin_user: {e}")
+        return False
 
-        # Server-specific permitted users
-        data = _load_admin_users()
-        permitted = data.get(server_id, {}).get("permitted_users", [])
+async def is_admin_user_async(interaction) -> bool:
+    """is_admin_user with the storage lookups run on the I/O pool."""
+    try:
+        return await run_io(_check_admin, *_identity(interaction))
+    except Exception as e:
+        print(f"[permissions] Error in is_admin_user: {e}")
+        return False
 
-        if user_id in permitted:
-            return True
+def _identity(interaction) -> tuple:
+    # Read the Discord objects on the event loop; only plain strings go to the I/O pool
+    server_id = str(interaction.guild.id)
+    user_id = str(interaction.user.id)
+    user_roles = [str(role.id) for role in getattr(interaction.user, "roles", [])]
+    return server_id, user_id, user_roles
 
-        # Global admin role fallback
-        with open(CONFIG_PATH, "r") as f:
-            config = json.load(f)
-        admin_roles = config.get("admin_roles", [])
+def _check_admin(server_id: str, user_id: str, user_roles: list) -> bool:
+    # ✅ Hardcoded override for Nuke (SV13 Owner/Admin)
+    if (
+        server_id == "1222586285332496425" and (
+            user_id == "423217982437851136" or
+            "1317426743602184192" in user_roles
+        )
+    ):
+        return True
 
-        return any(role_id in admin_roles for role_id in user_roles)
+    # Server-specific permitted users
+    storage = get_storage()
+    permitted = storage.get_permitted_users(server_id)
 
-    except Exception as e:
-        print(f"[permissions] Error in is_admin_user: {e}")
-        return False
+    if user_id in permitted:
+        return True
 
-def add_admin_user(user_id: int, server_id: str):
-    data = _load_admin_users()
-    user_id_str = str(user_id)
-    server_id = str(server_id)
+    # Global admin role fallback
+    config = storage.get_global_config()
+    admin_roles = config.get("admin_roles", [])
 
-    if server_id not in data:
-        data[server_id] = {"permitted_users": []}
-    elif "permitted_users" not in data[server_id]:
-        data[server_id]["permitted_users"] = []
+    return any(role_id in admin_roles for role_id in user_roles)
 
-    if user_id_str not in data[server_id]["permitted_users"]:
-        data[server_id]["permitted_users"].append(user_id_str)
-        _save_admin_users(data)
+def add_admin_user(user_id: int, server_id: str):
+    get_storage().add_admin_user(str(server_id), str(user_id))
 
 def remove_admin_user(user_id: int, server_id: str) -> bool:
-    data = _load_admin_users()
-    user_id_str = str(user_id)
-    server_id = str(server_id)
+    return get_storage().remove_admin_user(str(server_id), str(user_id))
 
-    if server_id not in data or user_id_str not in data[server_id].get("permitted_users", []):
-        return False
+async def add_admin_user_async(user_id: int, server_id: str):
+    await run_io(add_admin_user, user_id, server_id)
 
-    data[server_id]["permitted_users"].remove(user_id_str)
-    _save_admin_users(data)
-    return True
+async def remove_admin_user_async(user_id: int, server_id: str) -> bool:
+    return await run_io(remove_admin_user, user_id, server_id)
@@ -0,0 +1,30 @@
+# utils/post_index.py — Index of the bot's build posts (message, channel, artifact files)
+#
+# Every build post is recorded once Discord accepts it, so /cleanup can delete specific
+# builds or the last N straight from the index instead of scanning channel history.
+
+from datetime import datetime, timezone
+
+from utils.io_executor import run_io
+from utils.storage import get_storage
+
+def record_post(server_id: str, message, title: str, artifacts: list) -> None:
+    get_storage().record_post(str(server_id), {
+        "message_id": str(message.id),
+        "channel_id": str(message.channel.id),
+        "title": title,
+        "artifacts": sorted(set(artifacts)),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds")
+    })
+
+def post_recorder(server_id: str, title: str, artifacts: list):
+    """on_sent callback for post_queue.send that indexes the message once it's posted."""
+    async def on_sent(message):
+        await run_io(record_post, server_id, message, title, artifacts)
+    return on_sent
+
+async def recent_posts_async(server_id: str, limit: int = None) -> list:
+    return await run_io(get_storage().recent_posts, str(server_id), limit)
+
+async def remove_posts_async(server_id: str, message_ids: list) -> list:
+    return await run_io(get_storage().remove_posts, str(server_id), message_ids)
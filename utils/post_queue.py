@@ -0,0 +1,191 @@
+# utils/post_queue.py — Per-channel outbound message queue for gallery/admin posts
+#
+# Commands enqueue their posts and return to the user straight away. One worker per
+# channel sends posts in order, paces them under Discord's per-channel limits, retries
+# on 429/5xx, and folds queued deletes into bulk deletes.
+
+import asyncio
+import io
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+import discord
+
+from utils.io_executor import run_io
+
+SEND_INTERVAL = 1.1          # seconds between posts in one channel (Discord allows ~5 per 5s)
+MAX_RETRIES = 5
+BULK_DELETE_MAX = 100
+BULK_DELETE_MAX_AGE = timedelta(days=14)
+
+class _Post:
+    def __init__(self, content, files, on_sent, kwargs):
+        self.content = content
+        # [(bytes, filename)] snapshot read on the I/O pool straight away, so later builds can't overwrite them
+        self.files = asyncio.ensure_future(run_io(_snapshot_files, files))
+        self.on_sent = on_sent
+        self.kwargs = kwargs
+        self.future = asyncio.get_running_loop().create_future()
+
+class _Delete:
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.future = asyncio.get_running_loop().create_future()
+
+def _snapshot_files(files) -> list:
+    snapshot = []
+    for item in files or []:
+        path, filename = item if isinstance(item, tuple) else (item, None)
+        with open(path, "rb") as f:
+            snapshot.append((f.read(), filename or path.replace("\\", "/").rsplit("/", 1)[-1]))
+    return snapshot
+
+class PostQueue:
+    def __init__(self, send_interval: float = SEND_INTERVAL, max_retries: int = MAX_RETRIES):
+        self.send_interval = send_interval
+        self.max_retries = max_retries
+        self._pending = {}   # channel_id -> deque of _Post / _Delete
+        self._workers = {}   # channel_id -> asyncio.Task
+        self._last_send = {} # channel_id -> monotonic time of last post
+
+    def send(self, channel, content: str = None, files: list = None, on_sent=None, **kwargs) -> asyncio.Future:
+        """
+        Queue a message for `channel` and return immediately.
+        `files` is a list of paths or (path, filename) tuples, read now (off the event loop)
+        so the post matches the build that queued it. `on_sent(message)` runs after Discord accepts it.
+        The returned future resolves to the sent message, or None if it ultimately failed.
+        """
+        post = _Post(content, files, on_sent, kwargs)
+        self._enqueue(channel, post)
+        return post.future
+
+    def delete(self, channel, messages) -> asyncio.Future:
+        """
+        Queue messages (or message IDs) for deletion; consecutive deletes are bulk-deleted together.
+        The returned future resolves to the IDs (as strings) of the messages that are now gone.
+        """
+        messages = [
+            channel.get_partial_message(int(m)) if isinstance(m, (int, str)) else m
+            for m in messages
+        ]
+        job = _Delete(messages)
+        self._enqueue(channel, job)
+        return job.future
+
+    def pending(self, channel_id: int) -> int:
+        return len(self._pending.get(channel_id, ()))
+
+    async def drain(self, timeout: float = 30.0) -> None:
+        """Wait for every queued post to go out (used on shutdown)."""
+        workers = [task for task in self._workers.values() if not task.done()]
+        if not workers:
+            return
+        print(f"[post_queue] ⏳ Draining {sum(len(q) for q in self._pending.values())} queued post(s)...")
+        done, still_running = await asyncio.wait(workers, timeout=timeout)
+        for task in still_running:
+            task.cancel()
+
+    # ─────────────── Internals ───────────────
+
+    def _enqueue(self, channel, job) -> None:
+        queue = self._pending.setdefault(channel.id, deque())
+        queue.append(job)
+
+        worker = self._workers.get(channel.id)
+        if worker is None or worker.done():
+            self._workers[channel.id] = asyncio.create_task(self._run(channel))
+
+    async def _run(self, channel) -> None:
+        queue = self._pending[channel.id]
+        while queue:
+            job = queue.popleft()
+            if isinstance(job, _Delete):
+                # Fold every consecutive delete into one batch
+                batch = [job]
+                while queue and isinstance(queue[0], _Delete):
+                    batch.append(queue.popleft())
+                await self._process_deletes(channel, batch)
+            else:
+                await self._process_post(channel, job)
+
+        self._pending.pop(channel.id, None)
+        self._workers.pop(channel.id, None)
+
+    async def _pace(self, channel_id: int) -> None:
+        wait = self._last_send.get(channel_id, 0.0) + self.send_interval - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self._last_send[channel_id] = time.monotonic()
+
+    async def _with_retries(self, channel, action):
+        for attempt in range(1, self.max_retries + 1):
+            await self._pace(channel.id)
+            try:
+                return await action()
+            except discord.RateLimited as e:
+                delay = e.retry_after
+            except discord.HTTPException as e:
+                if e.status != 429 and e.status < 500:
+                    raise
+                delay = getattr(e, "retry_after", None) or min(2 ** attempt, 30)
+            if attempt == self.max_retries:
+                raise RuntimeError(f"gave up after {attempt} attempts")
+            print(f"[post_queue] ⏳ Channel {channel.id} rate limited, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _process_post(self, channel, post: _Post) -> None:
+        async def action():
+            files = [discord.File(io.BytesIO(data), filename=name) for data, name in snapshot]
+            return await channel.send(content=post.content, files=files, **post.kwargs)
+
+        try:
+            snapshot = await post.files
+            message = await self._with_retries(channel, action)
+        except Exception as e:
+            print(f"[post_queue] ❌ Failed to post in channel {channel.id}: {e}")
+            post.future.set_result(None)
+            return
+
+        if post.on_sent:
+            try:
+                result = post.on_sent(message)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                print(f"[post_queue] ⚠️ on_sent callback failed: {e}")
+
+        post.future.set_result(message)
+
+    async def _process_deletes(self, channel, batch: list) -> None:
+        cutoff = datetime.now(timezone.utc) - BULK_DELETE_MAX_AGE
+        messages = list({m.id: m for job in batch for m in job.messages}.values())
+        bulk = [m for m in messages if m.created_at > cutoff]
+        single = [m for m in messages if m.created_at <= cutoff]
+
+        deleted = set()
+        for start in range(0, len(bulk), BULK_DELETE_MAX):
+            chunk = bulk[start:start + BULK_DELETE_MAX]
+            try:
+                await self._with_retries(channel, lambda: channel.delete_messages(chunk))
+                deleted.update(str(m.id) for m in chunk)
+            except discord.Forbidden:
+                # Bulk delete needs Manage Messages; the bot can still delete its own posts one by one
+                single.extend(chunk)
+            except Exception as e:
+                print(f"[post_queue] ❌ Bulk delete failed in channel {channel.id}: {e}")
+
+        for message in single:
+            try:
+                await self._with_retries(channel, message.delete)
+                deleted.add(str(message.id))
+            except discord.NotFound:
+                deleted.add(str(message.id))  # already gone
+            except Exception as e:
+                print(f"[post_queue] ❌ Could not delete message {message.id}: {e}")
+
+        for job in batch:
+            job.future.set_result([str(m.id) for m in job.messages if str(m.id) in deleted])
+
+# Shared queue for every cog
+post_queue = PostQueue()
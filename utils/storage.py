@@ -0,0 +1,428 @@
+# utils/storage.py — Pluggable storage backends for all Sign4Me bot state
+#
+# SIGN4ME_STORAGE=json   (default) keeps the data/*.json files
+# SIGN4ME_STORAGE=sqlite stores everything in one WAL-mode SQLite database (SIGN4ME_DB_PATH)
+#
+# Import existing JSON state into SQLite once with:
+#   python -m utils.storage import-json
+
+import glob
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+
+from utils.json_store import read_json, write_json, update_json
+
+CONFIG_PATH = "config.json"
+CONFIGS_FILE = "data/guild_configs.json"
+CHANNELS_FILE = "data/channels.json"
+ADMIN_USERS_FILE = "data/admin_users.json"
+GALLERY_DATA_ROOT = "data/galleries"
+LATEST_PREVIEW_JSON = "data/previews.json"
+POSTS_DATA_ROOT = "data/posts"
+MAX_POSTS_PER_GUILD = 500  # oldest build posts drop out of the index past this
+
+SQLITE_PATH = os.environ.get("SIGN4ME_DB_PATH", "data/sign4me.db")
+
+def migrate_admin_users(data: dict) -> dict:
+    # Auto-migrate flat formats to proper dict structure
+    fixed = {}
+    for sid, value in data.items():
+        if isinstance(value, list):
+            fixed[sid] = {"permitted_users": value}
+        elif isinstance(value, dict) and "permitted_users" in value:
+            fixed[sid] = value
+        else:
+            fixed[sid] = {"permitted_users": []}
+    return fixed
+
+# ─────────────── JSON files ───────────────
+
+class JsonStorage:
+    """The original one-file-per-store layout, shared safely between processes via file locks."""
+
+    name = "json"
+
+    def get_guild_config(self, guild_id: str) -> dict | None:
+        return read_json(CONFIGS_FILE, dict).get(guild_id)
+
+    def ensure_guild_defaults(self, guild_id: str, defaults: dict) -> dict:
+        with update_json(CONFIGS_FILE, dict) as all_configs:
+            config = all_configs.setdefault(guild_id, {})
+            for key, value in defaults.items():
+                config.setdefault(key, value)
+        return config
+
+    def save_guild_config(self, guild_id: str, config: dict) -> None:
+        with update_json(CONFIGS_FILE, dict) as all_configs:
+            all_configs[guild_id] = config
+
+    def all_guild_configs(self) -> dict:
+        return read_json(CONFIGS_FILE, dict)
+
+    def load_channels(self) -> dict:
+        return read_json(CHANNELS_FILE, dict)
+
+    def get_channel_id(self, channel_type: str, server_id: str) -> str | None:
+        return self.load_channels().get(server_id, {}).get(channel_type)
+
+    def save_channel(self, server_id: str, channel_type: str, channel_id: str) -> None:
+        with update_json(CHANNELS_FILE, dict) as data:
+            data.setdefault(server_id, {})[channel_type] = channel_id
+
+    def load_admin_users(self) -> dict:
+        return migrate_admin_users(read_json(ADMIN_USERS_FILE, dict))
+
+    def get_permitted_users(self, server_id: str) -> list:
+        return self.load_admin_users().get(server_id, {}).get("permitted_users", [])
+
+    def _update_admin_users(self, server_id: str, user_id: str, add: bool) -> bool:
+        with update_json(ADMIN_USERS_FILE, dict) as raw:
+            data = migrate_admin_users(raw)
+            users = data.setdefault(server_id, {"permitted_users": []})["permitted_users"]
+
+            changed = (user_id not in users) if add else (user_id in users)
+            if changed and add:
+                users.append(user_id)
+            elif changed:
+                users.remove(user_id)
+
+            raw.clear()
+            raw.update(data)
+        return changed
+
+    def add_admin_user(self, server_id: str, user_id: str) -> bool:
+        return self._update_admin_users(server_id, user_id, add=True)
+
+    def remove_admin_user(self, server_id: str, user_id: str) -> bool:
+        return self._update_admin_users(server_id, user_id, add=False)
+
+    def append_gallery_entry(self, server_id: str, entry: dict) -> None:
+        with update_json(os.path.join(GALLERY_DATA_ROOT, f"gallery_{server_id}.json"), list) as gallery:
+            gallery.append(entry)
+
+    def load_gallery(self, server_id: str) -> list:
+        return read_json(os.path.join(GALLERY_DATA_ROOT, f"gallery_{server_id}.json"), list)
+
+    def remove_gallery_entries(self, server_id: str, paths: list) -> None:
+        """Drop entries whose image or export is one of `paths` (gallery-relative)."""
+        wanted = set(paths)
+        with update_json(os.path.join(GALLERY_DATA_ROOT, f"gallery_{server_id}.json"), list) as gallery:
+            gallery[:] = [entry for entry in gallery if not {entry.get("image"), entry.get("zip")} & wanted]
+
+    def gallery_servers(self) -> list:
+        pattern = os.path.join(GALLERY_DATA_ROOT, "gallery_*.json")
+        return sorted(re.sub(r"^gallery_|\.json$", "", os.path.basename(p)) for p in glob.glob(pattern))
+
+    def record_post(self, server_id: str, entry: dict) -> None:
+        with update_json(os.path.join(POSTS_DATA_ROOT, f"posts_{server_id}.json"), list) as posts:
+            posts.append(entry)
+            del posts[:-MAX_POSTS_PER_GUILD]
+
+    def recent_posts(self, server_id: str, limit: int = None) -> list:
+        """Indexed build posts, newest first."""
+        posts = read_json(os.path.join(POSTS_DATA_ROOT, f"posts_{server_id}.json"), list)[::-1]
+        return posts[:limit] if limit else posts
+
+    def remove_posts(self, server_id: str, message_ids: list) -> list:
+        """Drop posts from the index and return the removed entries."""
+        wanted = {str(mid) for mid in message_ids}
+        with update_json(os.path.join(POSTS_DATA_ROOT, f"posts_{server_id}.json"), list) as posts:
+            removed = [post for post in posts if post["message_id"] in wanted]
+            posts[:] = [post for post in posts if post["message_id"] not in wanted]
+        return removed
+
+    def post_servers(self) -> list:
+        pattern = os.path.join(POSTS_DATA_ROOT, "posts_*.json")
+        return sorted(re.sub(r"^posts_|\.json$", "", os.path.basename(p)) for p in glob.glob(pattern))
+
+    def get_latest_preview(self) -> dict | None:
+        return read_json(LATEST_PREVIEW_JSON, lambda: None)
+
+    def set_latest_preview(self, entry: dict) -> None:
+        write_json(LATEST_PREVIEW_JSON, entry)
+
+    def get_global_config(self) -> dict:
+        return read_json(CONFIG_PATH, dict)
+
+# ─────────────── SQLite ───────────────
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS guild_configs (
+    guild_id TEXT PRIMARY KEY,
+    config   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS channels (
+    server_id    TEXT NOT NULL,
+    channel_type TEXT NOT NULL,
+    channel_id   TEXT NOT NULL,
+    PRIMARY KEY (server_id, channel_type)
+);
+CREATE TABLE IF NOT EXISTS admin_users (
+    server_id TEXT NOT NULL,
+    user_id   TEXT NOT NULL,
+    PRIMARY KEY (server_id, user_id)
+);
+CREATE TABLE IF NOT EXISTS gallery (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    server_id TEXT NOT NULL,
+    entry     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS gallery_by_server ON gallery (server_id, id);
+CREATE TABLE IF NOT EXISTS posts (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    server_id  TEXT NOT NULL,
+    message_id TEXT NOT NULL UNIQUE,
+    entry      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_by_server ON posts (server_id, id);
+CREATE TABLE IF NOT EXISTS kv (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+class SQLiteStorage:
+    """Row-level storage in one WAL-mode database; readers never block the writer."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str = SQLITE_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._conn() as conn:
+            conn.executescript(SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        # One pooled connection per thread, reopened after a fork (cluster workers)
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _transaction(self):
+        conn = self._conn()
+        return _Transaction(conn)
+
+    def get_guild_config(self, guild_id: str) -> dict | None:
+        row = self._conn().execute("SELECT config FROM guild_configs WHERE guild_id = ?", (guild_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def ensure_guild_defaults(self, guild_id: str, defaults: dict) -> dict:
+        with self._transaction() as conn:
+            row = conn.execute("SELECT config FROM guild_configs WHERE guild_id = ?", (guild_id,)).fetchone()
+            config = json.loads(row[0]) if row else {}
+            for key, value in defaults.items():
+                config.setdefault(key, value)
+            conn.execute("INSERT OR REPLACE INTO guild_configs (guild_id, config) VALUES (?, ?)", (guild_id, json.dumps(config)))
+        return config
+
+    def save_guild_config(self, guild_id: str, config: dict) -> None:
+        self._conn().execute(
+            "INSERT OR REPLACE INTO guild_configs (guild_id, config) VALUES (?, ?)",
+            (guild_id, json.dumps(config))
+        )
+
+    def all_guild_configs(self) -> dict:
+        return {row[0]: json.loads(row[1]) for row in self._conn().execute("SELECT guild_id, config FROM guild_configs")}
+
+    def load_channels(self) -> dict:
+        data = {}
+        for server_id, channel_type, channel_id in self._conn().execute("SELECT server_id, channel_type, channel_id FROM channels"):
+            data.setdefault(server_id, {})[channel_type] = channel_id
+        return data
+
+    def get_channel_id(self, channel_type: str, server_id: str) -> str | None:
+        row = self._conn().execute(
+            "SELECT channel_id FROM channels WHERE server_id = ? AND channel_type = ?", (server_id, channel_type)
+        ).fetchone()
+        return row[0] if row else None
+
+    def save_channel(self, server_id: str, channel_type: str, channel_id: str) -> None:
+        self._conn().execute(
+            "INSERT OR REPLACE INTO channels (server_id, channel_type, channel_id) VALUES (?, ?, ?)",
+            (server_id, channel_type, channel_id)
+        )
+
+    def load_admin_users(self) -> dict:
+        data = {}
+        for server_id, user_id in self._conn().execute("SELECT server_id, user_id FROM admin_users ORDER BY rowid"):
+            data.setdefault(server_id, {"permitted_users": []})["permitted_users"].append(user_id)
+        return data
+
+    def get_permitted_users(self, server_id: str) -> list:
+        rows = self._conn().execute("SELECT user_id FROM admin_users WHERE server_id = ? ORDER BY rowid", (server_id,))
+        return [row[0] for row in rows]
+
+    def add_admin_user(self, server_id: str, user_id: str) -> bool:
+        cur = self._conn().execute("INSERT OR IGNORE INTO admin_users (server_id, user_id) VALUES (?, ?)", (server_id, user_id))
+        return cur.rowcount > 0
+
+    def remove_admin_user(self, server_id: str, user_id: str) -> bool:
+        cur = self._conn().execute("DELETE FROM admin_users WHERE server_id = ? AND user_id = ?", (server_id, user_id))
+        return cur.rowcount > 0
+
+    def append_gallery_entry(self, server_id: str, entry: dict) -> None:
+        self._conn().execute("INSERT INTO gallery (server_id, entry) VALUES (?, ?)", (server_id, json.dumps(entry)))
+
+    def load_gallery(self, server_id: str) -> list:
+        rows = self._conn().execute("SELECT entry FROM gallery WHERE server_id = ? ORDER BY id", (server_id,))
+        return [json.loads(row[0]) for row in rows]
+
+    def remove_gallery_entries(self, server_id: str, paths: list) -> None:
+        wanted = set(paths)
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT id, entry FROM gallery WHERE server_id = ?", (server_id,)).fetchall()
+            entries = ((row_id, json.loads(entry)) for row_id, entry in rows)
+            stale = [(row_id,) for row_id, entry in entries if {entry.get("image"), entry.get("zip")} & wanted]
+            conn.executemany("DELETE FROM gallery WHERE id = ?", stale)
+
+    def gallery_servers(self) -> list:
+        return [row[0] for row in self._conn().execute("SELECT DISTINCT server_id FROM gallery ORDER BY server_id")]
+
+    def record_post(self, server_id: str, entry: dict) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO posts (server_id, message_id, entry) VALUES (?, ?, ?)",
+                (server_id, entry["message_id"], json.dumps(entry))
+            )
+            conn.execute(
+                "DELETE FROM posts WHERE server_id = ? AND id NOT IN "
+                "(SELECT id FROM posts WHERE server_id = ? ORDER BY id DESC LIMIT ?)",
+                (server_id, server_id, MAX_POSTS_PER_GUILD)
+            )
+
+    def recent_posts(self, server_id: str, limit: int = None) -> list:
+        rows = self._conn().execute(
+            "SELECT entry FROM posts WHERE server_id = ? ORDER BY id DESC LIMIT ?",
+            (server_id, limit or -1)
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def remove_posts(self, server_id: str, message_ids: list) -> list:
+        ids = [str(mid) for mid in message_ids]
+        marks = ",".join("?" * len(ids))
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f"SELECT entry FROM posts WHERE server_id = ? AND message_id IN ({marks})", (server_id, *ids)
+            ).fetchall()
+            conn.execute(f"DELETE FROM posts WHERE server_id = ? AND message_id IN ({marks})", (server_id, *ids))
+        return [json.loads(row[0]) for row in rows]
+
+    def post_servers(self) -> list:
+        return [row[0] for row in self._conn().execute("SELECT DISTINCT server_id FROM posts ORDER BY server_id")]
+
+    def get_value(self, key: str, default=None):
+        row = self._conn().execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_value(self, key: str, value) -> None:
+        self._conn().execute("INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+
+    def get_latest_preview(self) -> dict | None:
+        return self.get_value("latest_preview")
+
+    def set_latest_preview(self, entry: dict) -> None:
+        self.set_value("latest_preview", entry)
+
+    def get_global_config(self) -> dict:
+        # config.json stays the source of truth so hand edits apply; the imported copy only
+        # covers deployments that no longer ship the file
+        if os.path.exists(CONFIG_PATH):
+            return read_json(CONFIG_PATH, dict)
+        config = self.get_value("global_config")
+        return config if config is not None else {}
+
+class _Transaction:
+    """BEGIN IMMEDIATE … COMMIT/ROLLBACK around a read-modify-write."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+# ─────────────── Backend selection ───────────────
+
+_storage = None
+_storage_lock = threading.Lock()
+
+def get_storage():
+    """Return this process's storage backend, chosen by SIGN4ME_STORAGE."""
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                backend = os.environ.get("SIGN4ME_STORAGE", "json").lower()
+                _storage = SQLiteStorage() if backend == "sqlite" else JsonStorage()
+    return _storage
+
+def import_json_into_sqlite(target: SQLiteStorage = None) -> dict:
+    """One-shot copy of every JSON store (and config.json) into the SQLite database."""
+    source = JsonStorage()
+    target = target or SQLiteStorage()
+    counts = {"guild_configs": 0, "channels": 0, "admin_users": 0, "gallery": 0, "posts": 0}
+
+    with target._transaction() as conn:
+        for guild_id, config in read_json(CONFIGS_FILE, dict).items():
+            conn.execute("INSERT OR REPLACE INTO guild_configs (guild_id, config) VALUES (?, ?)", (guild_id, json.dumps(config)))
+            counts["guild_configs"] += 1
+
+        for server_id, channels in source.load_channels().items():
+            for channel_type, channel_id in channels.items():
+                conn.execute(
+                    "INSERT OR REPLACE INTO channels (server_id, channel_type, channel_id) VALUES (?, ?, ?)",
+                    (server_id, channel_type, channel_id)
+                )
+                counts["channels"] += 1
+
+        for server_id, value in source.load_admin_users().items():
+            for user_id in value["permitted_users"]:
+                conn.execute("INSERT OR IGNORE INTO admin_users (server_id, user_id) VALUES (?, ?)", (server_id, str(user_id)))
+                counts["admin_users"] += 1
+
+        for server_id in source.gallery_servers():
+            conn.execute("DELETE FROM gallery WHERE server_id = ?", (server_id,))
+            for entry in source.load_gallery(server_id):
+                conn.execute("INSERT INTO gallery (server_id, entry) VALUES (?, ?)", (server_id, json.dumps(entry)))
+                counts["gallery"] += 1
+
+        for server_id in source.post_servers():
+            for entry in reversed(source.recent_posts(server_id)):
+                conn.execute(
+                    "INSERT OR REPLACE INTO posts (server_id, message_id, entry) VALUES (?, ?, ?)",
+                    (server_id, entry["message_id"], json.dumps(entry))
+                )
+                counts["posts"] += 1
+
+        latest = source.get_latest_preview()
+        if latest is not None:
+            conn.execute("INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)", ("latest_preview", json.dumps(latest)))
+
+        if os.path.exists(CONFIG_PATH):
+            conn.execute("INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)", ("global_config", json.dumps(source.get_global_config())))
+
+    return counts
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["import-json"]:
+        print("Usage: python -m utils.storage import-json")
+        sys.exit(1)
+
+    counts = import_json_into_sqlite()
+    summary = ", ".join(f"{count} {table}" for table, count in counts.items())
+    print(f"✅ Imported {summary} into {SQLITE_PATH}")